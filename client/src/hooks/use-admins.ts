@@ -9,11 +9,13 @@ import useSWRMutation from "swr/mutation";
 import { getErrorMessage } from "@/lib/api/handlers";
 import { createAdmin, deleteAdmin, updateAdmin } from "@/lib/api/mutations";
 import { buildQueryString } from "@/lib/api/query";
-import type { AdminUser, ApiResponse, PaginationMeta } from "@/types";
+import type { AdminUser, ApiResponse, PaginationMeta, TotalMode } from "@/types";
 
 type AdminsQuery = {
   limit?: number;
   offset?: number;
+  cursor?: string;
+  include_total?: TotalMode;
   q?: string;
 };
 
@@ -29,6 +31,7 @@ export const useAdmins = (params: AdminsQuery = {}) => {
   return {
     admins: data?.data ?? [],
     meta: (data?.meta ?? null) as PaginationMeta | null,
+    totalIsEstimate: data?.meta?.total_kind === "estimate",
     error,
     isLoading,
     mutate,
@@ -18,11 +18,14 @@ import type {
   AttendanceSummary,
   AttendanceUpdate,
   PaginationMeta,
+  TotalMode,
 } from "@/types";
 
 type AttendanceQuery = {
   limit?: number;
   offset?: number;
+  cursor?: string;
+  include_total?: TotalMode;
   date_from?: string;
   date_to?: string;
 };
@@ -45,6 +48,7 @@ export const useAttendance = (employeeId?: number, params: AttendanceQuery = {})
   return {
     records: data?.data ?? [],
     meta: (data?.meta ?? null) as PaginationMeta | null,
+    totalIsEstimate: data?.meta?.total_kind === "estimate",
     error,
     isLoading,
     mutate,
@@ -13,13 +13,17 @@ import type {
   ApiResponse,
   Employee,
   EmployeeCreate,
+  EmployeeSuggestion,
   EmployeeUpdate,
   PaginationMeta,
+  TotalMode,
 } from "@/types";
 
 type EmployeesQuery = {
   limit?: number;
   offset?: number;
+  cursor?: string;
+  include_total?: TotalMode;
   q?: string;
 };
 
@@ -36,12 +40,27 @@ export const useEmployees = (params: EmployeesQuery = {}) => {
   return {
     employees: data?.data ?? [],
     meta: (data?.meta ?? null) as PaginationMeta | null,
+    totalIsEstimate: data?.meta?.total_kind === "estimate",
     error,
     isLoading,
     mutate,
   };
 };
 
+export const useEmployeeSuggestions = (prefix: string, limit = 10) => {
+  const trimmed = prefix.trim();
+  const key = trimmed ? `/employees/suggest${buildQueryString({ prefix: trimmed, limit })}` : null;
+  const { data, error, isLoading } = useSWR<ApiResponse<EmployeeSuggestion[]>>(key, {
+    keepPreviousData: true,
+  });
+
+  return {
+    suggestions: data?.data ?? [],
+    error,
+    isLoading,
+  };
+};
+
 export const useEmployee = (employeeId?: number) => {
   const key = employeeId === undefined || employeeId === null ? null : `/employees/${employeeId}`;
   const { data, error, isLoading, mutate } = useSWR<ApiResponse<Employee>>(key);
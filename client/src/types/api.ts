@@ -17,9 +17,14 @@ export type ErrorResponse = {
   errors?: ErrorDetail[] | null;
 };
 
+export type TotalMode = "false" | "exact" | "estimate";
+
 export type PaginationMeta = {
-  total: number;
+  total: number | null;
+  total_kind?: Exclude<TotalMode, "false">;
   limit: number;
-  offset: number;
+  offset?: number;
+  cursor?: string;
+  next_cursor?: string | null;
   q?: string;
 };
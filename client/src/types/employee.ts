@@ -21,3 +21,9 @@ export type EmployeeUpdate = {
   email?: string;
   department?: string;
 };
+
+export type EmployeeSuggestion = {
+  id: number;
+  employee_id: string;
+  full_name: string;
+};
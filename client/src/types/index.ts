@@ -1,4 +1,4 @@
-export type { ApiResponse, ErrorDetail, ErrorResponse, PaginationMeta } from "./api";
+export type { ApiResponse, ErrorDetail, ErrorResponse, PaginationMeta, TotalMode } from "./api";
 export type {
   Attendance,
   AttendanceCreate,
@@ -10,5 +10,5 @@ export type {
   AttendanceUpdate,
 } from "./attendance";
 export type { AdminUser, AuthToken, SessionData } from "./auth";
-export type { Employee, EmployeeCreate, EmployeeUpdate } from "./employee";
+export type { Employee, EmployeeCreate, EmployeeSuggestion, EmployeeUpdate } from "./employee";
 export type { OverviewStats } from "./stats";
@@ -0,0 +1,109 @@
+"""baseline schema: admins, employees and attendance
+
+Revision ID: 1d7e4b9a2c05
+Revises:
+Create Date: 2026-10-18 08:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "1d7e4b9a2c05"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _missing(table: str) -> bool:
+    # Databases that `create_all` set up before this revision existed already have the tables.
+    if op.get_context().as_sql:
+        return True
+    return not sa.inspect(op.get_bind()).has_table(table)
+
+
+def _timestamps() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
+        ),
+    ]
+
+
+def _authors() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "created_by_id",
+            sa.Integer(),
+            sa.ForeignKey("admins.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_by_id",
+            sa.Integer(),
+            sa.ForeignKey("admins.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+    ]
+
+
+def upgrade() -> None:
+    if _missing("admins"):
+        op.create_table(
+            "admins",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("name", sa.String(120), nullable=True),
+            sa.Column("email", sa.String(255), nullable=False),
+            sa.Column("password_hash", sa.String(255), nullable=False),
+            sa.Column("role", sa.Enum("ADMIN", "MANAGER", name="role"), nullable=False),
+            *_timestamps(),
+            sa.Column("last_active_at", sa.DateTime(timezone=True), nullable=True),
+            *_authors(),
+        )
+        op.create_index("ix_admins_email", "admins", ["email"], unique=True)
+
+    if _missing("employees"):
+        op.create_table(
+            "employees",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("employee_id", sa.String(50), nullable=False),
+            sa.Column("full_name", sa.String(120), nullable=False),
+            sa.Column("email", sa.String(255), nullable=False),
+            sa.Column("department", sa.String(120), nullable=False),
+            *_timestamps(),
+            *_authors(),
+        )
+        op.create_index("ix_employees_employee_id", "employees", ["employee_id"], unique=True)
+        op.create_index("ix_employees_email", "employees", ["email"], unique=True)
+
+    if _missing("attendance"):
+        op.create_table(
+            "attendance",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column(
+                "employee_id",
+                sa.Integer(),
+                sa.ForeignKey("employees.id", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            sa.Column("date", sa.Date(), nullable=False),
+            sa.Column(
+                "status", sa.Enum("PRESENT", "ABSENT", name="attendancestatus"), nullable=False
+            ),
+            *_timestamps(),
+            *_authors(),
+            sa.UniqueConstraint("employee_id", "date", name="uq_employee_date"),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("attendance")
+    op.drop_table("employees")
+    op.drop_table("admins")
+    op.execute("DROP TYPE IF EXISTS attendancestatus")
+    op.execute("DROP TYPE IF EXISTS role")
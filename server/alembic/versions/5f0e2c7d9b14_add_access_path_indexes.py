@@ -0,0 +1,66 @@
+"""add indexes for the attendance list, export and department access paths
+
+Revision ID: 5f0e2c7d9b14
+Revises: a3c91f0e5b21
+Create Date: 2026-10-18 12:00:00.000000
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import text
+
+from alembic import op
+
+revision = "5f0e2c7d9b14"
+down_revision = "a3c91f0e5b21"
+branch_labels = None
+depends_on = None
+
+# name -> (table, columns). Each entry names the queries it serves. Queries that
+# are already covered are listed at the end.
+INDEXES = {
+    # list_attendance_all: ORDER BY date DESC, id DESC LIMIT n, with the keyset seek
+    # (date, id) < (:date, :id) and optional date_from/date_to. A backward scan of this
+    # index returns pages in order, so no sort of the whole filter is needed.
+    # attendance_export_statement: ORDER BY date, id over a date range (forward scan).
+    "ix_attendance_date_id": ("attendance", "date, id"),
+    # bulk_upsert_department: SELECT ... FROM employees WHERE department = :department.
+    # attendance_export_statement with `department`: the employees side of the join.
+    "ix_employees_department": ("employees", "department"),
+}
+# Already served, so deliberately not duplicated:
+# - per-employee list/summary/stats, employee_id + date range: uq_employee_date
+#   (employee_id, date)
+# - attendance_stats (org-wide) and overview_stats, date range/date = :d: the rollup
+#   primary key (date, department)
+# - attendance.created_by_id / updated_by_id (ON DELETE SET NULL when an admin is
+#   deleted): rare enough that the write cost on every attendance insert is not worth it
+
+
+def _drop_invalid(name: str) -> None:
+    # A failed CREATE INDEX CONCURRENTLY leaves an INVALID index behind, which
+    # IF NOT EXISTS would then treat as done.
+    invalid = op.get_bind().scalar(
+        text(
+            "SELECT NOT i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name"
+        ),
+        {"name": name},
+    )
+    if invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+# CONCURRENTLY cannot run inside a transaction; the builds do not block writes.
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, (table, columns) in INDEXES.items():
+            if not op.get_context().as_sql:
+                _drop_invalid(name)
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,80 @@
+"""add the daily rollup, attendance archive and monthly count tables
+
+Revision ID: 9b2f6d41c8e3
+Revises: 5f0e2c7d9b14
+Create Date: 2026-10-18 15:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "9b2f6d41c8e3"
+down_revision = "5f0e2c7d9b14"
+branch_labels = None
+depends_on = None
+
+
+def _missing(table: str) -> bool:
+    # Databases that `create_all` set up before this revision existed already have the tables.
+    if op.get_context().as_sql:
+        return True
+    return not sa.inspect(op.get_bind()).has_table(table)
+
+
+def upgrade() -> None:
+    if _missing("attendance_daily_counts"):
+        op.create_table(
+            "attendance_daily_counts",
+            sa.Column("date", sa.Date(), primary_key=True),
+            sa.Column("department", sa.String(120), primary_key=True),
+            sa.Column("present", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("absent", sa.Integer(), nullable=False, server_default="0"),
+        )
+        # Same counts as `rollup.py`; nothing can be archived yet, so every month is rebuilt.
+        op.execute(
+            "INSERT INTO attendance_daily_counts (date, department, present, absent) "
+            "SELECT a.date, e.department, "
+            "count(*) FILTER (WHERE a.status = 'PRESENT'), "
+            "count(*) FILTER (WHERE a.status = 'ABSENT') "
+            "FROM attendance a JOIN employees e ON e.id = a.employee_id "
+            "GROUP BY a.date, e.department"
+        )
+
+    if _missing("attendance_archives"):
+        op.create_table(
+            "attendance_archives",
+            sa.Column("month", sa.Date(), primary_key=True),
+            sa.Column("path", sa.String(255), nullable=False),
+            sa.Column("row_count", sa.Integer(), nullable=False),
+            sa.Column("size_bytes", sa.BigInteger(), nullable=False),
+            sa.Column("sha256", sa.String(64), nullable=False),
+            sa.Column(
+                "archived_at",
+                sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.func.now(),
+            ),
+        )
+
+    if _missing("attendance_monthly_counts"):
+        op.create_table(
+            "attendance_monthly_counts",
+            sa.Column(
+                "employee_id",
+                sa.Integer(),
+                sa.ForeignKey("employees.id", ondelete="CASCADE"),
+                primary_key=True,
+            ),
+            sa.Column("month", sa.Date(), primary_key=True),
+            sa.Column("present", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("absent", sa.Integer(), nullable=False, server_default="0"),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("attendance_monthly_counts")
+    op.drop_table("attendance_archives")
+    op.drop_table("attendance_daily_counts")
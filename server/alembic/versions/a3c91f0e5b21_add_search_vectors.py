@@ -0,0 +1,53 @@
+"""add search vectors to employees and admins
+
+Revision ID: a3c91f0e5b21
+Revises: 1d7e4b9a2c05
+Create Date: 2026-10-18 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "a3c91f0e5b21"
+down_revision = "1d7e4b9a2c05"
+branch_labels = None
+depends_on = None
+
+
+def _vector(*columns: tuple[str, str]) -> str:
+    return " || ".join(
+        f"setweight(to_tsvector('simple', "
+        f"regexp_replace(coalesce({column}, ''), '[^[:alnum:]]+', ' ', 'g')), '{weight}')"
+        for column, weight in columns
+    )
+
+
+# IF NOT EXISTS: databases created by `create_all` already have these.
+def upgrade() -> None:
+    employees = _vector(
+        ("full_name", "A"), ("employee_id", "A"), ("email", "B"), ("department", "C")
+    )
+    op.execute(
+        "ALTER TABLE employees ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({employees}) STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_employees_search_vector "
+        "ON employees USING gin (search_vector)"
+    )
+    admins = _vector(("name", "A"), ("email", "A"))
+    op.execute(
+        "ALTER TABLE admins ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({admins}) STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_admins_search_vector ON admins USING gin (search_vector)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_admins_search_vector")
+    op.execute("ALTER TABLE admins DROP COLUMN IF EXISTS search_vector")
+    op.execute("DROP INDEX IF EXISTS ix_employees_search_vector")
+    op.execute("ALTER TABLE employees DROP COLUMN IF EXISTS search_vector")
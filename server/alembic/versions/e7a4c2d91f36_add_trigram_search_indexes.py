@@ -0,0 +1,62 @@
+"""add trigram indexes behind substring search
+
+Revision ID: e7a4c2d91f36
+Revises: 9b2f6d41c8e3
+Create Date: 2026-10-18 18:00:00.000000
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import text
+
+from alembic import op
+
+revision = "e7a4c2d91f36"
+down_revision = "9b2f6d41c8e3"
+branch_labels = None
+depends_on = None
+
+# name -> (table, column). `q` is `column ILIKE '%term%'` OR'ed over these columns
+# (substring_search); the planner only combines index scans when every arm has one.
+INDEXES = {
+    "ix_employees_full_name_trgm": ("employees", "full_name"),
+    "ix_employees_email_trgm": ("employees", "email"),
+    "ix_employees_employee_id_trgm": ("employees", "employee_id"),
+    "ix_employees_department_trgm": ("employees", "department"),
+    "ix_admins_name_trgm": ("admins", "name"),
+    "ix_admins_email_trgm": ("admins", "email"),
+}
+
+
+def _drop_invalid(name: str) -> None:
+    # A failed CREATE INDEX CONCURRENTLY leaves an INVALID index behind, which
+    # IF NOT EXISTS would then treat as done.
+    invalid = op.get_bind().scalar(
+        text(
+            "SELECT NOT i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name"
+        ),
+        {"name": name},
+    )
+    if invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+# CONCURRENTLY cannot run inside a transaction; the builds do not block writes.
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        for name, (table, column) in INDEXES.items():
+            if not op.get_context().as_sql:
+                _drop_invalid(name)
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING gin ({column} gin_trgm_ops)"
+            )
+
+
+# The extension stays: other objects may have come to depend on it.
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -1,9 +1,19 @@
 from fastapi import APIRouter
 
-from app.api.routes import admins, attendance, attendance_global, auth, employees, health, stats
+from app.api.routes import (
+    admins,
+    attendance,
+    attendance_global,
+    auth,
+    employees,
+    health,
+    metrics,
+    stats,
+)
 
 api_router = APIRouter(prefix="/api/v1")
 api_router.include_router(health.router)
+api_router.include_router(metrics.router)
 api_router.include_router(auth.router)
 api_router.include_router(admins.router)
 api_router.include_router(employees.router)
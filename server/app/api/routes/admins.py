@@ -1,69 +1,97 @@
 from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.orm import Session
 
+from app.api.routing import ApiRoute
 from app.controllers import admins_controller
 from app.core.deps import require_roles
+from app.core.query_budget import query_budget
 from app.core.rbac import Role
-from app.db.deps import get_db
+from app.db.deps import DbSession, get_db, get_read_db, run_db
+from app.db.pagination import TotalMode
+from app.db.search import SearchMode
 from app.schemas.admin import AdminCreate, AdminRead
 from app.schemas.admins import AdminUpdate
 from app.schemas.response import ApiResponse
-from app.utils.response import success_response
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_CURSOR_PAGE_SIZE,
+    check_page_size,
+    page_meta,
+)
+from app.utils.response import project, success_response, trusted_response
 
-router = APIRouter(prefix="/admins", tags=["admins"])
+router = APIRouter(prefix="/admins", tags=["admins"], route_class=ApiRoute)
 
 
 @router.get("", response_model=ApiResponse[list[AdminRead]])
-def list_admins(
-    db: Session = Depends(get_db),
-    limit: int = Query(default=20, ge=1, le=100),
+@query_budget(4)
+async def list_admins(
+    db: DbSession = Depends(get_read_db),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_CURSOR_PAGE_SIZE),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, min_length=1),
+    include_total: TotalMode = Query(default=TotalMode.EXACT),
     q: str | None = Query(default=None, min_length=1),
+    search_mode: SearchMode = Query(default=SearchMode.SUBSTRING),
     current_admin=Depends(require_roles(Role.ADMIN)),
 ):
-    items, total = admins_controller.list_all(db, limit=limit, offset=offset, search=q)
-    meta = {"total": total, "limit": limit, "offset": offset}
+    check_page_size(limit, offset, cursor)
+    items, total, next_cursor = await run_db(
+        db,
+        admins_controller.list_all,
+        limit=limit,
+        offset=offset,
+        search=q,
+        cursor=cursor,
+        include_total=include_total,
+        search_mode=search_mode,
+    )
+    meta = page_meta(total, limit, offset, cursor, next_cursor)
     if q:
         meta["q"] = q
-    return success_response(items, message="Admins fetched", meta=meta)
+        meta["search_mode"] = search_mode.value
+    return trusted_response(project(items, AdminRead), message="Admins fetched", meta=meta)
 
 
 @router.get("/{admin_id}", response_model=ApiResponse[AdminRead])
-def get_admin(
+@query_budget(2)
+async def get_admin(
     admin_id: int,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_read_db),
     current_admin=Depends(require_roles(Role.ADMIN)),
 ):
-    admin = admins_controller.get_one(db, admin_id)
+    admin = await run_db(db, admins_controller.get_one, admin_id)
     return success_response(admin, message="Admin fetched")
 
 
 @router.post("", response_model=ApiResponse[AdminRead], status_code=status.HTTP_201_CREATED)
-def create_admin(
+@query_budget(4)
+async def create_admin(
     payload: AdminCreate,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
     current_admin=Depends(require_roles(Role.ADMIN)),
 ):
-    admin = admins_controller.create(db, payload, actor_id=current_admin.id)
+    admin = await admins_controller.create(db, payload, actor_id=current_admin.id)
     return success_response(admin, message="Admin created")
 
 
 @router.patch("/{admin_id}", response_model=ApiResponse[AdminRead])
-def update_admin(
+@query_budget(5)
+async def update_admin(
     admin_id: int,
     payload: AdminUpdate,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
     current_admin=Depends(require_roles(Role.ADMIN)),
 ):
-    admin = admins_controller.update(db, admin_id, payload, actor_id=current_admin.id)
+    admin = await admins_controller.update(db, admin_id, payload, actor_id=current_admin.id)
     return success_response(admin, message="Admin updated")
 
 
 @router.delete("/{admin_id}", response_model=ApiResponse[dict])
-def delete_admin(
+@query_budget(3)
+async def delete_admin(
     admin_id: int,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
     current_admin=Depends(require_roles(Role.ADMIN)),
 ):
-    admins_controller.delete(db, admin_id, actor_id=current_admin.id)
+    await run_db(db, admins_controller.delete, admin_id, actor_id=current_admin.id)
     return success_response({"status": "deleted"}, message="Admin deleted")
@@ -1,12 +1,14 @@
 from datetime import date
 
 from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.orm import Session
 
+from app.api.routing import ApiRoute
 from app.controllers import attendance_controller
 from app.core.deps import require_roles
+from app.core.query_budget import query_budget
 from app.core.rbac import Role
-from app.db.deps import get_db
+from app.db.deps import DbSession, get_db, get_read_db, run_db
+from app.db.pagination import TotalMode
 from app.models import AttendanceStatus as ModelAttendanceStatus
 from app.schemas.attendance import (
     AttendanceCreate,
@@ -15,9 +17,18 @@ from app.schemas.attendance import (
     AttendanceUpdate,
 )
 from app.schemas.response import ApiResponse
-from app.utils.response import success_response
+from app.utils.fieldsets import parse_fields
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_CURSOR_PAGE_SIZE,
+    check_page_size,
+    page_meta,
+)
+from app.utils.response import success_response, trusted_response
 
-router = APIRouter(prefix="/employees/{employee_id}/attendance", tags=["attendance"])
+router = APIRouter(
+    prefix="/employees/{employee_id}/attendance", tags=["attendance"], route_class=ApiRoute
+)
 
 
 @router.get(
@@ -25,13 +36,14 @@ router = APIRouter(prefix="/employees/{employee_id}/attendance", tags=["attendan
     response_model=ApiResponse[dict],
     dependencies=[Depends(require_roles(Role.ADMIN, Role.MANAGER))],
 )
-def attendance_summary(
+@query_budget(5)
+async def attendance_summary(
     employee_id: int,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_read_db),
     date_from: date | None = Query(default=None),
     date_to: date | None = Query(default=None),
 ):
-    summary = attendance_controller.summary(db, employee_id, date_from, date_to)
+    summary = await attendance_controller.summary(db, employee_id, date_from, date_to)
     return success_response(summary, message="Attendance summary fetched")
 
 
@@ -40,19 +52,36 @@ def attendance_summary(
     response_model=ApiResponse[list[AttendanceRead]],
     dependencies=[Depends(require_roles(Role.ADMIN, Role.MANAGER))],
 )
-def list_attendance(
+@query_budget(5)
+async def list_attendance(
     employee_id: int,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_read_db),
     date_from: date | None = Query(default=None),
     date_to: date | None = Query(default=None),
-    limit: int = Query(default=20, ge=1, le=100),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_CURSOR_PAGE_SIZE),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, min_length=1),
+    include_total: TotalMode = Query(default=TotalMode.EXACT),
+    fields: str | None = Query(default=None, min_length=1),
 ):
-    items, total = attendance_controller.list_for_employee(
-        db, employee_id, date_from, date_to, limit, offset
+    check_page_size(limit, offset, cursor)
+    selected = parse_fields(fields, AttendanceRead)
+    items, total, next_cursor = await run_db(
+        db,
+        attendance_controller.list_for_employee,
+        employee_id,
+        date_from,
+        date_to,
+        limit,
+        offset,
+        cursor=cursor,
+        include_total=include_total,
+        fields=selected,
     )
-    meta = {"total": total, "limit": limit, "offset": offset}
-    return success_response(items, message="Attendance fetched", meta=meta)
+    meta = page_meta(total, limit, offset, cursor, next_cursor)
+    if selected:
+        meta["fields"] = selected
+    return trusted_response(items, message="Attendance fetched", meta=meta)
 
 
 @router.get(
@@ -60,24 +89,27 @@ def list_attendance(
     response_model=ApiResponse[AttendanceRead],
     dependencies=[Depends(require_roles(Role.ADMIN, Role.MANAGER))],
 )
-def get_attendance(
+@query_budget(3)
+async def get_attendance(
     employee_id: int,
     attendance_id: int,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_read_db),
 ):
-    attendance = attendance_controller.get_one(db, employee_id, attendance_id)
+    attendance = await run_db(db, attendance_controller.get_one, employee_id, attendance_id)
     return success_response(attendance, message="Attendance fetched")
 
 
 @router.put("/today", response_model=ApiResponse[AttendanceRead])
-def upsert_today_attendance(
+@query_budget(6)
+async def upsert_today_attendance(
     employee_id: int,
     payload: AttendanceTodayUpsert,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
     current_admin=Depends(require_roles(Role.ADMIN, Role.MANAGER)),
 ):
-    attendance = attendance_controller.upsert_today(
+    attendance = await run_db(
         db,
+        attendance_controller.upsert_today,
         employee_id,
         ModelAttendanceStatus(payload.status.value),
         actor_id=current_admin.id,
@@ -86,38 +118,50 @@ def upsert_today_attendance(
 
 
 @router.post("", response_model=ApiResponse[AttendanceRead], status_code=status.HTTP_201_CREATED)
-def create_attendance(
+@query_budget(6)
+async def create_attendance(
     employee_id: int,
     payload: AttendanceCreate,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
     current_admin=Depends(require_roles(Role.ADMIN, Role.MANAGER)),
 ):
-    attendance = attendance_controller.create_for_employee(
-        db, employee_id, payload, actor_id=current_admin.id
+    attendance = await run_db(
+        db,
+        attendance_controller.create_for_employee,
+        employee_id,
+        payload,
+        actor_id=current_admin.id,
     )
     return success_response(attendance, message="Attendance created")
 
 
 @router.patch("/{attendance_id}", response_model=ApiResponse[AttendanceRead])
-def update_attendance(
+@query_budget(7)
+async def update_attendance(
     employee_id: int,
     attendance_id: int,
     payload: AttendanceUpdate,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
     current_admin=Depends(require_roles(Role.ADMIN, Role.MANAGER)),
 ):
-    attendance = attendance_controller.update(
-        db, employee_id, attendance_id, payload, actor_id=current_admin.id
+    attendance = await run_db(
+        db,
+        attendance_controller.update,
+        employee_id,
+        attendance_id,
+        payload,
+        actor_id=current_admin.id,
     )
     return success_response(attendance, message="Attendance updated")
 
 
 @router.delete("/{attendance_id}", response_model=ApiResponse[dict])
-def delete_attendance(
+@query_budget(5)
+async def delete_attendance(
     employee_id: int,
     attendance_id: int,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
     current_admin=Depends(require_roles(Role.ADMIN)),
 ):
-    attendance_controller.delete(db, employee_id, attendance_id)
+    await run_db(db, attendance_controller.delete, employee_id, attendance_id)
     return success_response({"status": "deleted"}, message="Attendance deleted")
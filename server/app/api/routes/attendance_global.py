@@ -1,17 +1,39 @@
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 
+from app.api.routing import ApiRoute
 from app.controllers import attendance_controller
 from app.core.deps import require_roles
+from app.core.query_budget import query_budget
 from app.core.rbac import Role
-from app.db.deps import get_db
-from app.schemas.attendance import AttendanceListItem, AttendanceStatsPoint
+from app.db.deps import DbSession, get_db, get_read_db, read_replica_for, run_db
+from app.db.pagination import TotalMode
+from app.schemas.attendance import (
+    BULK_ATTENDANCE_MAX_ITEMS,
+    AttendanceBulkRequest,
+    AttendanceBulkResult,
+    AttendanceListItem,
+    AttendanceStatsPoint,
+    ExportFormat,
+)
 from app.schemas.response import ApiResponse
-from app.utils.response import success_response
+from app.services.attendance_service import BULK_UPSERT_CHUNK_SIZE
+from app.utils.fieldsets import parse_fields
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_CURSOR_PAGE_SIZE,
+    check_page_size,
+    page_meta,
+)
+from app.utils.response import cached_response, success_response, trusted_response
 
-router = APIRouter(prefix="/attendance", tags=["attendance"])
+router = APIRouter(prefix="/attendance", tags=["attendance"], route_class=ApiRoute)
+
+# Item batches lock and upsert each chunk (2 statements per chunk) on top of auth, the
+# archived-month check, the employee lookup and the rollup update.
+BULK_MARK_QUERY_BUDGET = 4 + 2 * -(-BULK_ATTENDANCE_MAX_ITEMS // BULK_UPSERT_CHUNK_SIZE)
 
 
 @router.get(
@@ -19,8 +41,10 @@ router = APIRouter(prefix="/attendance", tags=["attendance"])
     response_model=ApiResponse[list[AttendanceStatsPoint]],
     dependencies=[Depends(require_roles(Role.ADMIN, Role.MANAGER))],
 )
-def attendance_stats(
-    db: Session = Depends(get_db),
+@query_budget(4)
+async def attendance_stats(
+    request: Request,
+    db: DbSession = Depends(get_read_db),
     employee_id: int | None = Query(default=None),
     date_from: date | None = Query(default=None),
     date_to: date | None = Query(default=None),
@@ -33,13 +57,62 @@ def attendance_stats(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="date_from must be on or before date_to.",
         )
-    points, total_employees = attendance_controller.stats(
-        db, date_from=start_date, date_to=end_date, employee_id=employee_id
+
+    async def build():
+        points, total_employees = await attendance_controller.stats(
+            db,
+            date_from=start_date,
+            date_to=end_date,
+            employee_id=employee_id,
+        )
+        meta = {"date_from": start_date, "date_to": end_date, "total_employees": total_employees}
+        if employee_id is not None:
+            meta["employee_id"] = employee_id
+        return success_response(points, message="Attendance stats fetched", meta=meta)
+
+    return await cached_response(
+        request,
+        ("attendance.stats", start_date, end_date, employee_id),
+        ApiResponse[list[AttendanceStatsPoint]],
+        build,
+    )
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    dependencies=[Depends(require_roles(Role.ADMIN, Role.MANAGER))],
+)
+@query_budget(4)
+async def export_attendance(
+    request: Request,
+    export_format: ExportFormat = Query(default=ExportFormat.CSV, alias="format"),
+    employee_id: int | None = Query(default=None),
+    date_from: date | None = Query(default=None),
+    date_to: date | None = Query(default=None),
+    department: str | None = Query(default=None, min_length=1),
+):
+    chunks = attendance_controller.export(
+        export_format,
+        employee_id=employee_id,
+        date_from=date_from,
+        date_to=date_to,
+        department=department,
+        replica=read_replica_for(request),
+    )
+    span = "-".join(value.isoformat() for value in (date_from, date_to) if value) or "all"
+    filename = f"attendance-{span}.{export_format.value}"
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
-    meta = {"date_from": start_date, "date_to": end_date, "total_employees": total_employees}
-    if employee_id is not None:
-        meta["employee_id"] = employee_id
-    return success_response(points, message="Attendance stats fetched", meta=meta)
 
 
 @router.get(
@@ -47,44 +120,55 @@ def attendance_stats(
     response_model=ApiResponse[list[AttendanceListItem]],
     dependencies=[Depends(require_roles(Role.ADMIN, Role.MANAGER))],
 )
-def list_attendance_all(
-    db: Session = Depends(get_db),
+@query_budget(4)
+async def list_attendance_all(
+    db: DbSession = Depends(get_read_db),
     employee_id: int | None = Query(default=None),
     date_from: date | None = Query(default=None),
     date_to: date | None = Query(default=None),
-    limit: int = Query(default=20, ge=1, le=100),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_CURSOR_PAGE_SIZE),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, min_length=1),
+    include_total: TotalMode = Query(default=TotalMode.EXACT),
+    fields: str | None = Query(default=None, min_length=1),
 ):
-    rows, total = attendance_controller.list_all(
+    check_page_size(limit, offset, cursor)
+    selected = parse_fields(fields, AttendanceListItem)
+    items, total, next_cursor = await run_db(
         db,
+        attendance_controller.list_all,
         employee_id=employee_id,
         date_from=date_from,
         date_to=date_to,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        include_total=include_total,
+        fields=selected,
     )
-    items = [
-        {
-            "id": attendance.id,
-            "employee_id": employee.id,
-            "employee_code": employee.employee_id,
-            "employee_name": employee.full_name,
-            "employee_email": employee.email,
-            "department": employee.department,
-            "date": attendance.date,
-            "status": attendance.status,
-            "created_at": attendance.created_at,
-            "updated_at": attendance.updated_at,
-            "created_by_id": attendance.created_by_id,
-            "updated_by_id": attendance.updated_by_id,
-        }
-        for attendance, employee in rows
-    ]
-    meta = {"total": total, "limit": limit, "offset": offset}
+    meta = page_meta(total, limit, offset, cursor, next_cursor)
     if employee_id is not None:
         meta["employee_id"] = employee_id
     if date_from:
         meta["date_from"] = date_from
     if date_to:
         meta["date_to"] = date_to
-    return success_response(items, message="Attendance fetched", meta=meta)
+    if selected:
+        meta["fields"] = selected
+    return trusted_response(items, message="Attendance fetched", meta=meta)
+
+
+@router.post("/bulk", response_model=ApiResponse[list[AttendanceBulkResult]])
+@query_budget(BULK_MARK_QUERY_BUDGET)
+async def bulk_mark_attendance(
+    payload: AttendanceBulkRequest,
+    db: DbSession = Depends(get_db),
+    current_admin=Depends(require_roles(Role.ADMIN, Role.MANAGER)),
+):
+    results = await run_db(db, attendance_controller.bulk_mark, payload, actor_id=current_admin.id)
+    meta = {"processed": len(results)}
+    for outcome in ("created", "updated", "duplicate", "not_found"):
+        meta[outcome] = sum(1 for item in results if item["result"] == outcome)
+    if payload.department is not None:
+        meta["department"] = payload.department
+    return success_response(results, message="Attendance marked", meta=meta)
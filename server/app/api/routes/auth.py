@@ -1,36 +1,41 @@
-from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, status
 
+from app.api.routing import ApiRoute
 from app.controllers.auth_controller import bootstrap_admin, create_manager, get_session, login
 from app.core.config import settings
 from app.core.deps import require_roles
+from app.core.metrics import login_latency
+from app.core.query_budget import query_budget
 from app.core.ratelimit import limiter
 from app.core.rbac import Role
-from app.db.deps import get_db
+from app.db.deps import DbSession, get_db, run_db
 from app.schemas.admin import AdminCreate, LoginRequest, SessionResponse, Token
 from app.schemas.response import ApiResponse
 from app.utils.response import success_response
 
-router = APIRouter(prefix="/auth", tags=["auth"])
+router = APIRouter(prefix="/auth", tags=["auth"], route_class=ApiRoute)
 
 
 @router.post("/login", response_model=ApiResponse[Token])
 @limiter.limit(settings.rate_limit_login)
-def login_admin(
-    request: Request,
+# An outdated hash is upgraded on login: the UPDATE, plus the admin being reloaded after the
+# commit on sync sessions.
+@query_budget(3)
+async def login_admin(
     payload: LoginRequest,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
 ) -> ApiResponse[Token]:
-    token = login(db, str(payload.email), payload.password)
+    with login_latency.time():
+        token = await login(db, str(payload.email), payload.password)
     return success_response(token, message="Login successful")
 
 
 @router.post("/bootstrap", status_code=status.HTTP_201_CREATED, response_model=ApiResponse[dict])
 @limiter.limit(settings.rate_limit_bootstrap)
-def bootstrap(
-    request: Request,
+@query_budget(3)
+async def bootstrap(
     payload: AdminCreate,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
     bootstrap_token: str | None = Header(default=None, alias="X-Admin-Bootstrap-Token"),
 ) -> ApiResponse[dict]:
     if not bootstrap_token or bootstrap_token != settings.bootstrap_token:
@@ -38,24 +43,26 @@ def bootstrap(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid bootstrap token.",
         )
-    bootstrap_admin(db, payload)
+    await bootstrap_admin(db, payload)
     return success_response({"status": "created"}, message="Admin created")
 
 
 @router.post("/admins", status_code=status.HTTP_201_CREATED, response_model=ApiResponse[dict])
-def create_admin_user(
+@query_budget(4)
+async def create_admin_user(
     payload: AdminCreate,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
     current_admin=Depends(require_roles(Role.ADMIN)),
 ) -> ApiResponse[dict]:
-    create_manager(db, payload, actor_id=current_admin.id)
+    await create_manager(db, payload, actor_id=current_admin.id)
     return success_response({"status": "created"}, message="Admin created")
 
 
 @router.get("/session", response_model=ApiResponse[SessionResponse])
-def session(
-    db: Session = Depends(get_db),
+@query_budget(2)
+async def session(
+    db: DbSession = Depends(get_db),
     current_admin=Depends(require_roles(Role.ADMIN, Role.MANAGER)),
 ) -> ApiResponse[SessionResponse]:
-    session_data = get_session(db, current_admin.email)
+    session_data = await run_db(db, get_session, current_admin.email)
     return success_response(session_data, message="Session refreshed")
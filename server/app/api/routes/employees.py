@@ -1,18 +1,35 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Query, Response, UploadFile, status
 from sqlalchemy.orm import Session
 
+from app.api.routing import ApiRoute
 from app.controllers import employee_controller
-from app.core.deps import require_roles
+from app.core.deps import Principal, require_roles
+from app.core.jobs import JobStatus
+from app.core.query_budget import query_budget
 from app.core.rbac import Role
-from app.db.deps import get_db
-from app.models import Admin
-from app.schemas.employee import EmployeeCreate, EmployeeRead, EmployeeUpdate
+from app.db.deps import DbSession, get_db, get_read_db, get_sync_db, run_db
+from app.db.pagination import TotalMode
+from app.db.search import SearchMode
+from app.schemas.employee import (
+    EmployeeCreate,
+    EmployeeImportJobRead,
+    EmployeeRead,
+    EmployeeSuggestion,
+    EmployeeUpdate,
+)
 from app.schemas.response import ApiResponse
-from app.utils.response import success_response
+from app.utils.fieldsets import parse_fields
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_CURSOR_PAGE_SIZE,
+    check_page_size,
+    page_meta,
+)
+from app.utils.response import success_response, trusted_response
 
-router = APIRouter(prefix="/employees", tags=["employees"])
+router = APIRouter(prefix="/employees", tags=["employees"], route_class=ApiRoute)
 
 
 @router.get(
@@ -20,17 +37,88 @@ router = APIRouter(prefix="/employees", tags=["employees"])
     response_model=ApiResponse[list[EmployeeRead]],
     dependencies=[Depends(require_roles(Role.ADMIN, Role.MANAGER))],
 )
-def list_employees(
-    db: Annotated[Session, Depends(get_db)],
-    limit: int = Query(default=20, ge=1, le=100),
+@query_budget(4)
+async def list_employees(
+    db: Annotated[DbSession, Depends(get_read_db)],
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_CURSOR_PAGE_SIZE),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, min_length=1),
+    include_total: TotalMode = Query(default=TotalMode.EXACT),
     q: str | None = Query(default=None, min_length=1),
+    search_mode: SearchMode = Query(default=SearchMode.SUBSTRING),
+    fields: str | None = Query(default=None, min_length=1),
 ):
-    items, total = employee_controller.list_all(db, limit=limit, offset=offset, search=q)
-    meta = {"total": total, "limit": limit, "offset": offset}
+    check_page_size(limit, offset, cursor)
+    selected = parse_fields(fields, EmployeeRead)
+    items, total, next_cursor = await run_db(
+        db,
+        employee_controller.list_all,
+        limit=limit,
+        offset=offset,
+        search=q,
+        cursor=cursor,
+        include_total=include_total,
+        fields=selected,
+        search_mode=search_mode,
+    )
+    meta = page_meta(total, limit, offset, cursor, next_cursor)
     if q:
         meta["q"] = q
-    return success_response(items, message="Employees fetched", meta=meta)
+        meta["search_mode"] = search_mode.value
+    if selected:
+        meta["fields"] = selected
+    return trusted_response(items, message="Employees fetched", meta=meta)
+
+
+@router.get(
+    "/suggest",
+    response_model=ApiResponse[list[EmployeeSuggestion]],
+    dependencies=[Depends(require_roles(Role.ADMIN, Role.MANAGER))],
+)
+@query_budget(2)
+async def suggest_employees(
+    db: Annotated[DbSession, Depends(get_read_db)],
+    prefix: str = Query(min_length=1, max_length=100),
+    limit: int = Query(default=10, ge=1, le=50),
+):
+    # Only touches the database when this worker's index is missing or expired.
+    await employee_controller.refresh_suggestions(db)
+    items = employee_controller.suggest(prefix, limit)
+    return success_response(items, message="Employee suggestions fetched", meta={"prefix": prefix})
+
+
+@router.post("/import", response_model=ApiResponse[EmployeeImportJobRead])
+@query_budget(9)
+async def import_employees(
+    response: Response,
+    background_tasks: BackgroundTasks,
+    db: Annotated[Session, Depends(get_sync_db)],
+    current_admin: Annotated[Principal, Depends(require_roles(Role.ADMIN))],
+    file: UploadFile = File(...),
+):
+    job = await run_db(
+        db,
+        employee_controller.import_csv,
+        file,
+        actor_id=current_admin.id,
+        background_tasks=background_tasks,
+    )
+    if job.status == JobStatus.PENDING:
+        response.status_code = status.HTTP_202_ACCEPTED
+        response.headers["Location"] = f"/api/v1/employees/import/{job.id}"
+        return success_response(job, message="Employee import queued")
+    return success_response(job, message="Employees imported")
+
+
+@router.get(
+    "/import/{job_id}",
+    response_model=ApiResponse[EmployeeImportJobRead],
+    dependencies=[Depends(require_roles(Role.ADMIN))],
+)
+@query_budget(1)
+async def get_import_job(job_id: str):
+    job = employee_controller.get_import_job(job_id)
+    return success_response(job, message="Employee import fetched")
 
 
 @router.get(
@@ -38,37 +126,43 @@ def list_employees(
     response_model=ApiResponse[EmployeeRead],
     dependencies=[Depends(require_roles(Role.ADMIN, Role.MANAGER))],
 )
-def get_employee(employee_id: int, db: Annotated[Session, Depends(get_db)]):
-    employee = employee_controller.get_one(db, employee_id)
+@query_budget(2)
+async def get_employee(employee_id: int, db: Annotated[DbSession, Depends(get_read_db)]):
+    employee = await run_db(db, employee_controller.get_one, employee_id)
     return success_response(employee, message="Employee fetched")
 
 
 @router.post("", response_model=ApiResponse[EmployeeRead], status_code=status.HTTP_201_CREATED)
-def create_employee(
+@query_budget(4)
+async def create_employee(
     payload: EmployeeCreate,
-    db: Annotated[Session, Depends(get_db)],
-    current_admin: Annotated[Admin, Depends(require_roles(Role.ADMIN))],
+    db: Annotated[DbSession, Depends(get_db)],
+    current_admin: Annotated[Principal, Depends(require_roles(Role.ADMIN))],
 ):
-    employee = employee_controller.create(db, payload, actor_id=current_admin.id)
+    employee = await run_db(db, employee_controller.create, payload, actor_id=current_admin.id)
     return success_response(employee, message="Employee created")
 
 
 @router.patch("/{employee_id}", response_model=ApiResponse[EmployeeRead])
-def update_employee(
+@query_budget(6)
+async def update_employee(
     employee_id: int,
     payload: EmployeeUpdate,
-    db: Annotated[Session, Depends(get_db)],
-    current_admin: Annotated[Admin, Depends(require_roles(Role.ADMIN))],
+    db: Annotated[DbSession, Depends(get_db)],
+    current_admin: Annotated[Principal, Depends(require_roles(Role.ADMIN))],
 ):
-    employee = employee_controller.update(db, employee_id, payload, actor_id=current_admin.id)
+    employee = await run_db(
+        db, employee_controller.update, employee_id, payload, actor_id=current_admin.id
+    )
     return success_response(employee, message="Employee updated")
 
 
 @router.delete("/{employee_id}", response_model=ApiResponse[dict])
-def delete_employee(
+@query_budget(6)
+async def delete_employee(
     employee_id: int,
-    db: Annotated[Session, Depends(get_db)],
-    current_admin: Annotated[Admin, Depends(require_roles(Role.ADMIN))],
+    db: Annotated[DbSession, Depends(get_db)],
+    current_admin: Annotated[Principal, Depends(require_roles(Role.ADMIN))],
 ):
-    employee_controller.delete(db, employee_id)
+    await run_db(db, employee_controller.delete, employee_id)
     return success_response({"status": "deleted"}, message="Employee deleted")
@@ -1,13 +1,59 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from app.api.routing import ApiRoute
+from app.core.cache import principal_cache, response_cache
+from app.core.deps import require_roles
+from app.core.metrics import login_latency
+from app.core.password_hasher import password_hasher
+from app.core.query_budget import query_budget
 from app.core.ratelimit import limiter
+from app.core.rbac import Role
+from app.db.replicas import replicas
 from app.schemas.response import ApiResponse
+from app.services.employee_suggest_service import suggest_index
 from app.utils.response import success_response
 
-router = APIRouter()
+router = APIRouter(route_class=ApiRoute)
 
 
 @router.get("/health", response_model=ApiResponse[dict])
 @limiter.exempt
-def health() -> ApiResponse[dict]:
+@query_budget(0)
+async def health() -> ApiResponse[dict]:
     return success_response({"status": "ok"}, message="Service healthy")
+
+
+@router.get(
+    "/health/caches",
+    response_model=ApiResponse[dict],
+    dependencies=[Depends(require_roles(Role.ADMIN))],
+)
+@query_budget(1)
+async def cache_stats() -> ApiResponse[dict]:
+    stats = {
+        "principal": principal_cache.stats(),
+        "response": response_cache.stats(),
+        "employee_suggest": suggest_index.stats(),
+    }
+    return success_response(stats, message="Cache stats fetched")
+
+
+@router.get(
+    "/health/passwords",
+    response_model=ApiResponse[dict],
+    dependencies=[Depends(require_roles(Role.ADMIN))],
+)
+@query_budget(1)
+async def password_stats() -> ApiResponse[dict]:
+    stats = {"hasher": password_hasher.stats(), "login_latency": login_latency.stats()}
+    return success_response(stats, message="Password hashing stats fetched")
+
+
+@router.get(
+    "/health/replicas",
+    response_model=ApiResponse[list[dict]],
+    dependencies=[Depends(require_roles(Role.ADMIN))],
+)
+@query_budget(1)
+async def replica_status() -> ApiResponse[list[dict]]:
+    return success_response(replicas.status(), message="Read replica status fetched")
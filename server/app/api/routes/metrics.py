@@ -0,0 +1,29 @@
+import secrets
+
+from fastapi import APIRouter, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
+
+from app.core.config import settings
+from app.core.metrics import request_metrics
+from app.core.query_budget import query_budget
+from app.core.ratelimit import limiter
+from app.db.instrumentation import pool_gauges
+from app.db.replicas import replicas
+from app.db.session import async_engine, engine
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+@limiter.exempt
+@query_budget(0)
+async def metrics(authorization: str | None = Header(default=None)) -> PlainTextResponse:
+    # Scrapers cannot log in, so this takes a static bearer token when one is configured.
+    if settings.metrics_token and not secrets.compare_digest(
+        authorization or "", f"Bearer {settings.metrics_token}"
+    ):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token.")
+    pools = pool_gauges({"sync": engine, "async": async_engine.sync_engine, **replicas.engines()})
+    return PlainTextResponse(request_metrics.render(pools), media_type=PROMETHEUS_CONTENT_TYPE)
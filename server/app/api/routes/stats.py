@@ -1,17 +1,18 @@
 from datetime import date
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Request
 
+from app.api.routing import ApiRoute
 from app.controllers import stats_controller
 from app.core.deps import require_roles
+from app.core.query_budget import query_budget
 from app.core.rbac import Role
-from app.db.deps import get_db
+from app.db.deps import DbSession, get_read_db, run_db
 from app.schemas.response import ApiResponse
 from app.schemas.stats import OverviewStats
-from app.utils.response import success_response
+from app.utils.response import cached_response, success_response
 
-router = APIRouter(prefix="/stats", tags=["stats"])
+router = APIRouter(prefix="/stats", tags=["stats"], route_class=ApiRoute)
 
 
 @router.get(
@@ -19,9 +20,16 @@ router = APIRouter(prefix="/stats", tags=["stats"])
     response_model=ApiResponse[OverviewStats],
     dependencies=[Depends(require_roles(Role.ADMIN, Role.MANAGER))],
 )
-def overview(
-    db: Session = Depends(get_db),
+@query_budget(2)
+async def overview(
+    request: Request,
+    db: DbSession = Depends(get_read_db),
     for_date: date = Query(default_factory=date.today, alias="date"),
 ):
-    stats = stats_controller.get_overview(db, for_date)
-    return success_response(stats, message="Stats fetched")
+    async def build():
+        stats = await run_db(db, stats_controller.get_overview, for_date)
+        return success_response(stats, message="Stats fetched")
+
+    return await cached_response(
+        request, ("stats.overview", for_date), ApiResponse[OverviewStats], build
+    )
@@ -0,0 +1,79 @@
+import functools
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import Response
+from fastapi.datastructures import Default, DefaultPlaceholder
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
+
+from app.utils.response import ApiJSONResponse
+
+SERIALIZED_ATTR = "__serializes_response__"
+# Route options the one-pass encoder does not implement; routes using them keep FastAPI's path.
+_RESPONSE_MODEL_OPTIONS = (
+    "response_model_include",
+    "response_model_exclude",
+    "response_model_exclude_unset",
+    "response_model_exclude_defaults",
+    "response_model_exclude_none",
+)
+
+
+def _sets_response(endpoint: Callable[..., Any]) -> bool:
+    # An injected `Response` carries status/headers that FastAPI only merges into
+    # responses it builds itself.
+    return any(
+        isinstance(param.annotation, type) and issubclass(param.annotation, Response)
+        for param in inspect.signature(endpoint).parameters.values()
+    )
+
+
+def _serializing(
+    endpoint: Callable[..., Any], adapter: TypeAdapter, status_code: int | None
+) -> Callable[..., Any]:
+    @functools.wraps(endpoint)
+    async def serialize(*args: Any, **kwargs: Any) -> Any:
+        content = await endpoint(*args, **kwargs)
+        if isinstance(content, Response):
+            return content
+        value = adapter.validate_python(content, from_attributes=True)
+        return ApiJSONResponse(
+            adapter.dump_json(value, by_alias=True), status_code=status_code or 200
+        )
+
+    setattr(serialize, SERIALIZED_ATTR, True)
+    return serialize
+
+
+class ApiRoute(APIRoute):
+    """
+    Validates an endpoint's result against `response_model` once and writes JSON bytes.
+
+    FastAPI's default path validates the result, dumps it to Python primitives and then
+    encodes those with the stdlib `json`. Here pydantic-core goes straight from the
+    validated model to bytes. Endpoints that return a `Response` themselves
+    (`trusted_response`, `cached_response`, streams) are passed through untouched.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        endpoint: Callable[..., Any],
+        *,
+        response_model: Any = Default(None),
+        **kwargs: Any,
+    ) -> None:
+        if (
+            response_model is not None
+            and not isinstance(response_model, DefaultPlaceholder)
+            and inspect.iscoroutinefunction(endpoint)
+            and not getattr(endpoint, SERIALIZED_ATTR, False)
+            and not any(kwargs.get(option) for option in _RESPONSE_MODEL_OPTIONS)
+            and not _sets_response(endpoint)
+        ):
+            endpoint = _serializing(
+                endpoint, TypeAdapter(response_model), kwargs.get("status_code")
+            )
+        super().__init__(path, endpoint, response_model=response_model, **kwargs)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+if __package__ in (None, ""):
+    sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import time
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.attendance_archive_service import (
+    archive_before,
+    archive_cutoff,
+    archive_dir,
+    archived_months,
+    months_to_archive,
+    verify,
+    write_manifest,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Archive old attendance months to compressed files under "
+        f"{settings.attendance_archive_dir}."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="archive every month before the live horizon")
+    run.add_argument(
+        "--keep-months",
+        type=int,
+        default=settings.attendance_archive_after_months,
+        help="months before the current one that stay live",
+    )
+    run.add_argument("--dry-run", action="store_true", help="only list the months to archive")
+    commands.add_parser("list", help="list archived months")
+    commands.add_parser("verify", help="check archive files against the manifest")
+    args = parser.parse_args()
+
+    directory = archive_dir()
+    db = SessionLocal()
+    try:
+        if args.command == "run":
+            cutoff = archive_cutoff(args.keep_months)
+            if args.dry_run:
+                months = months_to_archive(db, cutoff)
+                print(f"before {cutoff}: {', '.join(f'{m:%Y-%m}' for m in months) or 'nothing'}")
+                return
+            started = time.perf_counter()
+            records = archive_before(db, cutoff, directory)
+            elapsed = time.perf_counter() - started
+            rows = sum(record.row_count for record in records)
+            size = sum(record.size_bytes for record in records)
+            print(
+                f"archived {len(records)} months ({rows} rows, {size / 1024:.0f} KiB) "
+                f"before {cutoff} in {elapsed:.1f}s"
+            )
+        elif args.command == "list":
+            for record in archived_months(db):
+                print(
+                    f"{record.month:%Y-%m}  {record.row_count:>8} rows  "
+                    f"{record.size_bytes / 1024:>8.0f} KiB  {record.path}"
+                )
+        else:
+            problems = verify(db, directory)
+            write_manifest(db, directory)
+            for problem in problems:
+                print(problem)
+            if problems:
+                parser.exit(1)
+            print("archive ok")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,14 +4,41 @@ from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core.password_hasher import password_hasher
 from app.core.rbac import Role
+from app.db.deps import DbSession, run_db
+from app.db.pagination import TotalMode
+from app.db.search import SearchMode
+from app.models import Admin
 from app.schemas.admin import AdminCreate
 from app.schemas.admins import AdminUpdate
 from app.services import admins_service
+from app.utils.pagination import decode_cursor, encode_cursor
 
 
-def list_all(db: Session, limit: int, offset: int, search: str | None):
-    return admins_service.list_admins(db, limit=limit, offset=offset, search=search)
+def list_all(
+    db: Session,
+    limit: int,
+    offset: int,
+    search: str | None,
+    cursor: str | None = None,
+    include_total: TotalMode = TotalMode.EXACT,
+    search_mode: SearchMode = SearchMode.SUBSTRING,
+):
+    ranked = bool(search) and search_mode == SearchMode.RANKED
+    key_types = (float, int) if ranked else (int,)
+    after = decode_cursor(cursor, *key_types) if cursor else None
+    items, total, last_key = admins_service.list_admins(
+        db,
+        limit=limit,
+        offset=offset,
+        search=search,
+        after=after,
+        include_total=include_total,
+        search_mode=search_mode,
+    )
+    next_cursor = encode_cursor(*last_key) if len(items) == limit else None
+    return items, total, next_cursor
 
 
 def get_one(db: Session, admin_id: int):
@@ -21,19 +48,21 @@ def get_one(db: Session, admin_id: int):
     return admin
 
 
-def create(db: Session, payload: AdminCreate, actor_id: int):
+async def create(db: DbSession, payload: AdminCreate, actor_id: int):
     if payload.role not in {Role.ADMIN, Role.MANAGER}:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Unsupported role.")
-    if admins_service.get_admin_by_email(db, str(payload.email)):
+    if await run_db(db, admins_service.get_admin_by_email, str(payload.email)):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail="Admin with this email already exists."
         )
+    password_hash = await password_hasher.hash(payload.password)
     try:
-        return admins_service.create_admin_user(
+        return await run_db(
             db,
+            admins_service.create_admin_user,
             name=payload.name,
             email=str(payload.email),
-            password=payload.password,
+            password_hash=password_hash,
             role=payload.role,
             actor_id=actor_id,
         )
@@ -43,7 +72,7 @@ def create(db: Session, payload: AdminCreate, actor_id: int):
         )
 
 
-def update(db: Session, admin_id: int, payload: AdminUpdate, actor_id: int):
+def _validate_update(db: Session, admin_id: int, payload: AdminUpdate) -> tuple[Admin, dict]:
     admin = get_one(db, admin_id)
     updates = payload.model_dump(exclude_unset=True)
     if not updates:
@@ -60,8 +89,16 @@ def update(db: Session, admin_id: int, payload: AdminUpdate, actor_id: int):
     if "role" in updates and updates["role"] is not None:
         if updates["role"] not in {Role.ADMIN, Role.MANAGER}:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Unsupported role.")
+    return admin, updates
+
+
+async def update(db: DbSession, admin_id: int, payload: AdminUpdate, actor_id: int):
+    admin, updates = await run_db(db, _validate_update, admin_id, payload)
+    password = updates.pop("password", None)
+    if password:
+        updates["password_hash"] = await password_hasher.hash(password)
     try:
-        return admins_service.update_admin_user(db, admin, updates, actor_id=actor_id)
+        return await run_db(db, admins_service.update_admin_user, admin, updates, actor_id=actor_id)
     except IntegrityError:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail="Admin with this email already exists."
@@ -1,14 +1,34 @@
+from collections.abc import AsyncIterator, Sequence
 from datetime import date
 
 from fastapi import HTTPException, status
+from sqlalchemy import Row, Select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.db.deps import DbSession, run_db, stream_rows
+from app.db.pagination import TotalMode
+from app.db.replicas import Replica
 from app.models import AttendanceStatus
-from app.schemas.attendance import AttendanceCreate, AttendanceUpdate
+from app.schemas.attendance import (
+    AttendanceBulkRequest,
+    AttendanceCreate,
+    AttendanceUpdate,
+    ExportFormat,
+)
+from app.services.attendance_archive_service import (
+    ArchivedRange,
+    archived_export_batches,
+    archived_month_among,
+    load_archived_range,
+)
 from app.services.attendance_service import (
+    EXPORT_BATCH_SIZE,
+    attendance_export_statement,
     attendance_stats,
     attendance_summary,
+    bulk_upsert_attendance,
+    bulk_upsert_department,
     create_attendance,
     delete_attendance,
     get_attendance_by_id,
@@ -18,6 +38,17 @@ from app.services.attendance_service import (
     upsert_attendance_for_date,
 )
 from app.services.employee_service import get_employee_by_id
+from app.utils.export import csv_chunks, ndjson_chunks
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+def _reject_archived(db: Session, *dates: date) -> None:
+    month = archived_month_among(db, dates)
+    if month is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Attendance for {month:%Y-%m} is archived and read-only.",
+        )
 
 
 def list_for_employee(
@@ -27,11 +58,27 @@ def list_for_employee(
     date_to: date | None,
     limit: int,
     offset: int,
+    cursor: str | None = None,
+    include_total: TotalMode = TotalMode.EXACT,
+    fields: tuple[str, ...] | None = None,
 ):
+    after = decode_cursor(cursor, date)[0] if cursor else None
     employee = get_employee_by_id(db, employee_id)
     if not employee:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found.")
-    return list_attendance(db, employee, date_from, date_to, limit, offset)
+    items, total, last_date = list_attendance(
+        db,
+        employee,
+        date_from,
+        date_to,
+        limit,
+        offset,
+        after=after,
+        include_total=include_total,
+        fields=fields,
+    )
+    next_cursor = encode_cursor(last_date) if len(items) == limit else None
+    return items, total, next_cursor
 
 
 def list_all(
@@ -41,8 +88,24 @@ def list_all(
     date_to: date | None,
     limit: int,
     offset: int,
+    cursor: str | None = None,
+    include_total: TotalMode = TotalMode.EXACT,
+    fields: tuple[str, ...] | None = None,
 ):
-    return list_attendance_all(db, employee_id, date_from, date_to, limit, offset)
+    after = decode_cursor(cursor, date, int) if cursor else None
+    items, total, last_key = list_attendance_all(
+        db,
+        employee_id,
+        date_from,
+        date_to,
+        limit,
+        offset,
+        after=after,
+        include_total=include_total,
+        fields=fields,
+    )
+    next_cursor = encode_cursor(*last_key) if len(items) == limit else None
+    return items, total, next_cursor
 
 
 def create_for_employee(
@@ -51,6 +114,7 @@ def create_for_employee(
     employee = get_employee_by_id(db, employee_id)
     if not employee:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found.")
+    _reject_archived(db, payload.date)
     try:
         return create_attendance(
             db,
@@ -76,6 +140,23 @@ def upsert_today(
     return upsert_attendance_for_date(db, employee, today, status_value, actor_id=actor_id)
 
 
+def bulk_mark(db: Session, payload: AttendanceBulkRequest, actor_id: int | None):
+    if payload.department is not None:
+        _reject_archived(db, payload.date)
+        return bulk_upsert_department(
+            db,
+            payload.department,
+            payload.date,
+            AttendanceStatus(payload.status.value),
+            actor_id=actor_id,
+        )
+    items = [
+        (item.employee_id, item.date, AttendanceStatus(item.status.value)) for item in payload.items
+    ]
+    _reject_archived(db, *(item[1] for item in items))
+    return bulk_upsert_attendance(db, items, actor_id=actor_id)
+
+
 def get_one(db: Session, employee_id: int, attendance_id: int):
     employee = get_employee_by_id(db, employee_id)
     if not employee:
@@ -96,7 +177,7 @@ def update(
     employee = get_employee_by_id(db, employee_id)
     if not employee:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found.")
-    attendance = get_attendance_by_id(db, employee, attendance_id)
+    attendance = get_attendance_by_id(db, employee, attendance_id, for_update=True)
     if not attendance:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Attendance not found.")
     updates = payload.model_dump(exclude_unset=True)
@@ -104,6 +185,8 @@ def update(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="No fields provided for update."
         )
+    if updates.get("date") is not None:
+        _reject_archived(db, updates["date"])
     if "status" in updates and updates["status"] is not None:
         updates["status"] = AttendanceStatus(updates["status"].value)
     try:
@@ -119,22 +202,23 @@ def delete(db: Session, employee_id: int, attendance_id: int):
     employee = get_employee_by_id(db, employee_id)
     if not employee:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found.")
-    attendance = get_attendance_by_id(db, employee, attendance_id)
+    attendance = get_attendance_by_id(db, employee, attendance_id, for_update=True)
     if not attendance:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Attendance not found.")
     delete_attendance(db, attendance)
 
 
-def summary(
+def _summary(
     db: Session,
     employee_id: int,
     date_from: date | None,
     date_to: date | None,
+    archived: ArchivedRange,
 ):
     employee = get_employee_by_id(db, employee_id)
     if not employee:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found.")
-    stats = attendance_summary(db, employee, date_from, date_to)
+    stats = attendance_summary(db, employee, date_from, date_to, archived)
     return {
         "employee_id": employee.id,
         "employee_code": employee.employee_id,
@@ -144,14 +228,77 @@ def summary(
     }
 
 
-def stats(
+async def summary(
+    db: DbSession,
+    employee_id: int,
+    date_from: date | None,
+    date_to: date | None,
+):
+    archived = await load_archived_range(db, date_from, date_to, skip_covered=True)
+    return await run_db(db, _summary, employee_id, date_from, date_to, archived)
+
+
+def _stats(
     db: Session,
     date_from: date,
     date_to: date,
     employee_id: int | None,
+    archived: ArchivedRange | None,
 ):
     if employee_id is not None:
         employee = get_employee_by_id(db, employee_id)
         if not employee:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found.")
-    return attendance_stats(db, date_from, date_to, employee_id)
+    return attendance_stats(db, date_from, date_to, employee_id, archived)
+
+
+async def stats(
+    db: DbSession,
+    date_from: date,
+    date_to: date,
+    employee_id: int | None,
+):
+    # Org-wide stats read the rollup, which still counts archived months.
+    archived = None
+    if employee_id is not None:
+        archived = await load_archived_range(db, date_from, date_to)
+    return await run_db(db, _stats, date_from, date_to, employee_id, archived)
+
+
+def export(
+    export_format: ExportFormat,
+    employee_id: int | None,
+    date_from: date | None,
+    date_to: date | None,
+    department: str | None,
+    replica: Replica | None = None,
+) -> AsyncIterator[str]:
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="date_from must be on or before date_to.",
+        )
+    stmt = attendance_export_statement(employee_id, date_from, date_to, department)
+    columns = [column.name for column in stmt.selected_columns]
+    batches = _export_batches(stmt, employee_id, date_from, date_to, department, replica)
+    if export_format == ExportFormat.NDJSON:
+        return ndjson_chunks(columns, batches)
+    return csv_chunks(columns, batches)
+
+
+async def _export_batches(
+    stmt: Select,
+    employee_id: int | None,
+    date_from: date | None,
+    date_to: date | None,
+    department: str | None,
+    replica: Replica | None,
+) -> AsyncIterator[Sequence[Row] | list[tuple]]:
+    # Archived months all precede the live ones, so streaming them first keeps date order.
+    archived = archived_export_batches(
+        employee_id, date_from, date_to, department, EXPORT_BATCH_SIZE, replica
+    )
+    async for batch in archived:
+        yield batch
+    async for batch in stream_rows(stmt, EXPORT_BATCH_SIZE, replica):
+        yield batch
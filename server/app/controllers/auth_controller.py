@@ -2,14 +2,17 @@ from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core.password_hasher import password_hasher
 from app.core.rbac import Role
 from app.core.security import create_access_token
+from app.db.deps import DbSession, run_db
 from app.schemas.admin import AdminCreate, SessionResponse, Token
 from app.services import admins_service as admin_service
+from app.services import last_active_service
 
 
-def bootstrap_admin(db: Session, payload: AdminCreate) -> None:
-    if admin_service.has_any_admin(db):
+async def bootstrap_admin(db: DbSession, payload: AdminCreate) -> None:
+    if await run_db(db, admin_service.has_any_admin):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Admin already exists. Bootstrap is disabled.",
@@ -19,12 +22,14 @@ def bootstrap_admin(db: Session, payload: AdminCreate) -> None:
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Bootstrap admin must have admin role.",
         )
+    password_hash = await password_hasher.hash(payload.password)
     try:
-        admin_service.create_admin_user(
+        await run_db(
             db,
+            admin_service.create_admin_user,
             name=payload.name,
             email=str(payload.email),
-            password=payload.password,
+            password_hash=password_hash,
             role=payload.role,
             actor_id=None,
         )
@@ -35,32 +40,35 @@ def bootstrap_admin(db: Session, payload: AdminCreate) -> None:
         )
 
 
-def login(db: Session, email: str, password: str) -> Token:
-    admin = admin_service.authenticate_admin(db, email, password)
-    if not admin:
+async def login(db: DbSession, email: str, password: str) -> Token:
+    admin = await run_db(db, admin_service.get_admin_by_email, email)
+    valid, new_hash = await password_hasher.verify(password, admin.password_hash if admin else None)
+    if not admin or not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials.",
         )
-    admin_service.update_last_active(db, admin)
+    await run_db(db, admin_service.record_login, admin, new_hash)
     access_token = create_access_token(subject=admin.email, role=admin.role)
     return Token(access_token=access_token)
 
 
-def create_manager(db: Session, payload: AdminCreate, actor_id: int) -> None:
-    if admin_service.get_admin_by_email(db, payload.email):
+async def create_manager(db: DbSession, payload: AdminCreate, actor_id: int) -> None:
+    if await run_db(db, admin_service.get_admin_by_email, str(payload.email)):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Admin with this email already exists.",
         )
     if payload.role not in {Role.ADMIN, Role.MANAGER}:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Unsupported role.")
+    password_hash = await password_hasher.hash(payload.password)
     try:
-        admin_service.create_admin_user(
+        await run_db(
             db,
+            admin_service.create_admin_user,
             name=payload.name,
             email=str(payload.email),
-            password=payload.password,
+            password_hash=password_hash,
             role=payload.role,
             actor_id=actor_id,
         )
@@ -75,6 +83,6 @@ def get_session(db: Session, admin_email: str) -> SessionResponse:
     admin = admin_service.get_admin_by_email(db, admin_email)
     if not admin:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Admin not found.")
-    admin = admin_service.update_last_active(db, admin)
+    admin = last_active_service.touch(admin)
     access_token = create_access_token(subject=admin.email, role=admin.role)
     return SessionResponse(user=admin, token=Token(access_token=access_token))
@@ -1,8 +1,27 @@
-from fastapi import HTTPException, status
+import csv
+import io
+import os
+import shutil
+import tempfile
+from typing import IO
+
+from fastapi import BackgroundTasks, HTTPException, UploadFile, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.jobs import Job, jobs
+from app.core.logger import logger
+from app.db.deps import DbSession
+from app.db.pagination import TotalMode
+from app.db.search import SearchMode
+from app.db.session import SessionLocal
 from app.schemas.employee import EmployeeCreate, EmployeeUpdate
+from app.services.employee_import_service import (
+    ImportFileError,
+    import_employees_csv,
+    read_header,
+)
 from app.services.employee_service import (
     create_employee,
     delete_employee,
@@ -11,10 +30,44 @@ from app.services.employee_service import (
     list_employees,
     update_employee,
 )
+from app.services.employee_suggest_service import suggest_index
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+def list_all(
+    db: Session,
+    limit: int,
+    offset: int,
+    search: str | None,
+    cursor: str | None = None,
+    include_total: TotalMode = TotalMode.EXACT,
+    fields: tuple[str, ...] | None = None,
+    search_mode: SearchMode = SearchMode.SUBSTRING,
+):
+    ranked = bool(search) and search_mode == SearchMode.RANKED
+    key_types = (float, int) if ranked else (int,)
+    after = decode_cursor(cursor, *key_types) if cursor else None
+    items, total, last_key = list_employees(
+        db,
+        limit=limit,
+        offset=offset,
+        search=search,
+        after=after,
+        include_total=include_total,
+        fields=fields,
+        search_mode=search_mode,
+    )
+    next_cursor = encode_cursor(*last_key) if len(items) == limit else None
+    return items, total, next_cursor
 
 
-def list_all(db: Session, limit: int, offset: int, search: str | None):
-    return list_employees(db, limit=limit, offset=offset, search=search)
+async def refresh_suggestions(db: DbSession) -> None:
+    if suggest_index.is_stale():
+        await suggest_index.rebuild(db)
+
+
+def suggest(prefix: str, limit: int) -> list[dict]:
+    return suggest_index.search(prefix, limit)
 
 
 def create(db: Session, payload: EmployeeCreate, actor_id: int | None):
@@ -31,11 +84,11 @@ def create(db: Session, payload: EmployeeCreate, actor_id: int | None):
             department=payload.department,
             actor_id=actor_id,
         )
-    except IntegrityError:
+    except IntegrityError as exc:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Employee with this email already exists.",
-        )
+        ) from exc
 
 
 def get_one(db: Session, employee_id: int):
@@ -56,11 +109,11 @@ def update(db: Session, employee_id: int, payload: EmployeeUpdate, actor_id: int
         )
     try:
         return update_employee(db, employee, updates, actor_id=actor_id)
-    except IntegrityError:
+    except IntegrityError as exc:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Employee with this email already exists.",
-        )
+        ) from exc
 
 
 def delete(db: Session, employee_id: int):
@@ -68,3 +121,93 @@ def delete(db: Session, employee_id: int):
     if not employee:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found.")
     delete_employee(db, employee)
+
+
+IMPORT_JOB_KIND = "employee_import"
+
+
+def _run_import(db: Session, raw: IO[bytes], actor_id: int | None) -> dict:
+    text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+    try:
+        return import_employees_csv(db, text, actor_id)
+    except UnicodeDecodeError as exc:
+        db.rollback()
+        raise ImportFileError("CSV file must be UTF-8 encoded.") from exc
+    except csv.Error as exc:
+        db.rollback()
+        raise ImportFileError(f"CSV file could not be parsed: {exc}") from exc
+    except ImportFileError:
+        db.rollback()
+        raise
+    finally:
+        text.detach()
+
+
+def _check_header(raw: IO[bytes]) -> None:
+    text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+    try:
+        read_header(csv.reader(text))
+    except (UnicodeDecodeError, csv.Error) as exc:
+        raise ImportFileError("CSV file must be UTF-8 encoded.") from exc
+    finally:
+        text.detach()
+        raw.seek(0)
+
+
+def run_import_job(job: Job, path: str, actor_id: int | None) -> None:
+    jobs.start(job)
+    db = SessionLocal()
+    try:
+        with open(path, "rb") as raw:
+            jobs.finish(job, result=_run_import(db, raw, actor_id))
+    except ImportFileError as exc:
+        jobs.finish(job, error=str(exc))
+    except Exception:
+        logger.exception("employee import %s failed", job.id)
+        jobs.finish(job, error="Import failed.")
+    finally:
+        db.close()
+        os.unlink(path)
+
+
+def import_csv(
+    db: Session,
+    upload: UploadFile,
+    actor_id: int | None,
+    background_tasks: BackgroundTasks,
+) -> Job:
+    """Imports small files in the request; larger ones become a background job."""
+
+    size = upload.size
+    if size is not None and size > settings.employee_import_max_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File must be at most {settings.employee_import_max_bytes} bytes.",
+        )
+    job = jobs.create(IMPORT_JOB_KIND)
+    if size is not None and size <= settings.employee_import_sync_max_bytes:
+        jobs.start(job)
+        try:
+            jobs.finish(job, result=_run_import(db, upload.file, actor_id))
+        except ImportFileError as exc:
+            jobs.finish(job, error=str(exc))
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+        return job
+
+    try:
+        _check_header(upload.file)
+    except ImportFileError as exc:
+        jobs.finish(job, error=str(exc))
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    # The upload is closed once the response is sent, so the job reads its own copy.
+    with tempfile.NamedTemporaryFile(prefix="employee-import-", delete=False) as copy:
+        shutil.copyfileobj(upload.file, copy)
+    background_tasks.add_task(run_import_job, job, copy.name, actor_id)
+    return job
+
+
+def get_import_job(job_id: str) -> Job:
+    job = jobs.get(job_id, IMPORT_JOB_KIND)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Import job not found.")
+    return job
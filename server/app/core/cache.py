@@ -0,0 +1,139 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.core.config import settings
+
+
+class TTLCache:
+    """
+    Bounded, thread-safe LRU cache whose entries expire after `ttl_seconds`.
+
+    `version` is bumped by every invalidation. Readers that load a value from the
+    database pass the version they saw before loading to `put`, so a value read
+    before a concurrent invalidation is never stored.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Any, value: Any, version: int | None = None) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            if version is not None and version != self.version:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, *keys: Any) -> None:
+        with self._lock:
+            self.version += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+class VersionCounter:
+    """Process-local counter that writers bump after committing data readers may have cached."""
+
+    def __init__(self) -> None:
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def bump(self) -> None:
+        with self._lock:
+            self.value += 1
+
+
+class LatestValueBuffer:
+    """
+    Coalesces writes per key, keeping only the greatest value seen.
+
+    Used for write-behind: callers `touch` on the hot path and a periodic job
+    `drain`s everything into one batched write, handing it back with `restore`
+    if that write fails.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[Any, Any] = {}
+        self._lock = threading.Lock()
+
+    def touch(self, key: Any, value: Any) -> None:
+        with self._lock:
+            current = self._values.get(key)
+            if current is None or value > current:
+                self._values[key] = value
+
+    def get(self, key: Any) -> Any | None:
+        with self._lock:
+            return self._values.get(key)
+
+    def drain(self) -> dict[Any, Any]:
+        with self._lock:
+            values, self._values = self._values, {}
+            return values
+
+    def restore(self, values: dict[Any, Any]) -> None:
+        for key, value in values.items():
+            self.touch(key, value)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._values)
+
+
+# Resolved (id, email, role) of authenticated admins, keyed by the token subject.
+principal_cache = TTLCache(
+    max_size=settings.principal_cache_max_size,
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+)
+
+# Bumped by attendance_service/employee_service after every committed write.
+data_version = VersionCounter()
+
+# Serialized stats responses, keyed by (endpoint, params, data_version.value).
+response_cache = TTLCache(
+    max_size=settings.response_cache_max_entries,
+    ttl_seconds=settings.response_cache_ttl_seconds,
+)
@@ -1,13 +1,15 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 
+from app.core.cache import principal_cache
 from app.core.config import settings
 from app.core.rbac import Role
-from app.db.deps import get_db
+from app.db.deps import DbSession, get_db, run_db
 from app.models import Admin
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
@@ -16,10 +18,24 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 from typing import Annotated
 
 
-def get_current_admin(
+@dataclass(frozen=True, slots=True)
+class Principal:
+    id: int
+    email: str
+    role: Role
+
+
+def _load_principal(db: Session, email: str) -> Principal | None:
+    admin = db.query(Admin).filter(Admin.email == email).first()
+    if not admin:
+        return None
+    return Principal(id=admin.id, email=admin.email, role=admin.role)
+
+
+async def get_current_admin(
     token: Annotated[str, Depends(oauth2_scheme)],
-    db: Annotated[Session, Depends(get_db)],
-) -> Admin:
+    db: Annotated[DbSession, Depends(get_db)],
+) -> Principal:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials.",
@@ -32,14 +48,21 @@ def get_current_admin(
     email = payload.get("sub")
     if not email:
         raise credentials_exception
-    admin = db.query(Admin).filter(Admin.email == email).first()
-    if not admin:
+    principal = principal_cache.get(email)
+    if principal is not None:
+        return principal
+    version = principal_cache.version
+    principal = await run_db(db, _load_principal, email)
+    if principal is None:
         raise credentials_exception
-    return admin
+    principal_cache.put(email, principal, version=version)
+    return principal
 
 
 def require_roles(*roles: Role) -> Callable:
-    def role_checker(current_admin: Annotated[Admin, Depends(get_current_admin)]) -> Admin:
+    async def role_checker(
+        current_admin: Annotated[Principal, Depends(get_current_admin)],
+    ) -> Principal:
         if current_admin.role not in roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -1,7 +1,6 @@
 from fastapi import HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
-from slowapi.errors import RateLimitExceeded
 from starlette import status
 
 from app.core.logger import logger
@@ -25,11 +24,6 @@ def validation_exception_handler(_: Request, exc: RequestValidationError) -> JSO
     )
 
 
-def rate_limit_exception_handler(_: Request, exc: RateLimitExceeded) -> JSONResponse:
-    payload = ErrorResponse(message="Rate limit exceeded.")
-    return JSONResponse(status_code=429, content=payload.model_dump())
-
-
 def unhandled_exception_handler(_: Request, exc: Exception) -> JSONResponse:
     logger.exception("unhandled_error", exc_info=exc)
     payload = ErrorResponse(message="Internal server error.")
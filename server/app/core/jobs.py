@@ -0,0 +1,67 @@
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Any
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass(slots=True)
+class Job:
+    id: str
+    kind: str
+    status: JobStatus = JobStatus.PENDING
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    result: Any = None
+    error: str | None = None
+
+
+class JobRegistry:
+    """
+    Process-local record of background jobs, keeping the most recent `max_jobs`.
+
+    Jobs run in the worker that accepted them, so their status is only visible there.
+    """
+
+    def __init__(self, max_jobs: int) -> None:
+        self.max_jobs = max_jobs
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, kind: str) -> Job:
+        job = Job(id=uuid.uuid4().hex, kind=kind)
+        with self._lock:
+            self._jobs[job.id] = job
+            while len(self._jobs) > self.max_jobs:
+                self._jobs.popitem(last=False)
+        return job
+
+    def get(self, job_id: str, kind: str) -> Job | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        return job if job is not None and job.kind == kind else None
+
+    def start(self, job: Job) -> None:
+        with self._lock:
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.now(UTC)
+
+    def finish(self, job: Job, result: Any = None, error: str | None = None) -> None:
+        with self._lock:
+            job.status = JobStatus.FAILED if error is not None else JobStatus.SUCCEEDED
+            job.finished_at = datetime.now(UTC)
+            job.result = result
+            job.error = error
+
+
+jobs = JobRegistry(max_jobs=200)
@@ -0,0 +1,193 @@
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+# Prometheus' default latency buckets, in seconds.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LatencyWindow:
+    """Keeps the last `size` durations of one operation for percentile reporting."""
+
+    def __init__(self, size: int) -> None:
+        self._samples: deque[float] = deque(maxlen=size)
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observes the block's duration if it completes; one that raises is not a sample."""
+        started = time.perf_counter()
+        yield
+        self.observe(time.perf_counter() - started)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            samples = sorted(self._samples)
+            count = self.count
+        if not samples:
+            return {"count": count, "window": 0, "p50_ms": None, "p95_ms": None, "p99_ms": None}
+
+        def percentile(q: float) -> float:
+            return round(samples[min(len(samples) - 1, int(q * len(samples)))] * 1000, 2)
+
+        return {
+            "count": count,
+            "window": len(samples),
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+        }
+
+
+class QueryStats:
+    """SQL statements run on behalf of one request and the time spent in them."""
+
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+# Set by RequestLoggingMiddleware; the engine hooks in app/db/instrumentation.py add to it.
+# Threadpool calls and AsyncSession greenlets copy the context, so they share the object.
+request_queries: ContextVar[QueryStats | None] = ContextVar("request_queries", default=None)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the shape Prometheus expects."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> Iterator[tuple[str, int]]:
+        running = 0
+        for bound, count in zip((*self.buckets, None), self.counts, strict=True):
+            running += count
+            yield ("+Inf" if bound is None else repr(bound)), running
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+class RequestMetrics:
+    """
+    Process-wide request, SQL and pool counters rendered as Prometheus text.
+
+    Routes are labelled by their path template (`/api/v1/employees/{employee_id}`),
+    so label cardinality stays bounded by the number of routes.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self._buckets = buckets
+        self._requests: defaultdict[tuple[str, str, str], int] = defaultdict(int)
+        self._latency: dict[tuple[str, str], Histogram] = {}
+        self._queries: defaultdict[tuple[str, str], int] = defaultdict(int)
+        self._db_seconds: defaultdict[tuple[str, str], float] = defaultdict(float)
+        self._checkouts: defaultdict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def observe_request(
+        self, method: str, route: str, status: int, seconds: float, queries: QueryStats
+    ) -> None:
+        key = (method, route)
+        with self._lock:
+            self._requests[(method, route, str(status))] += 1
+            histogram = self._latency.get(key)
+            if histogram is None:
+                histogram = self._latency[key] = Histogram(self._buckets)
+            histogram.observe(seconds)
+            self._queries[key] += queries.queries
+            self._db_seconds[key] += queries.db_seconds
+
+    def observe_checkout(self, engine: str) -> None:
+        with self._lock:
+            self._checkouts[engine] += 1
+
+    def render(self, pools: dict[str, dict[str, int]]) -> str:
+        """`pools` maps an engine name to its current `checked_out`/`size` gauges."""
+
+        lines: list[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            family("hrms_http_requests_total", "counter", "HTTP requests by route and status.")
+            for (method, route, status), count in sorted(self._requests.items()):
+                labels = _labels(method=method, route=route, status=status)
+                lines.append(f"hrms_http_requests_total{labels} {count}")
+
+            family(
+                "hrms_http_request_errors_total", "counter", "HTTP requests answered with a 5xx."
+            )
+            errors: defaultdict[tuple[str, str], int] = defaultdict(int)
+            for (method, route, status), count in self._requests.items():
+                errors[(method, route)] += count if status.startswith("5") else 0
+            for (method, route), count in sorted(errors.items()):
+                lines.append(
+                    f"hrms_http_request_errors_total{_labels(method=method, route=route)} {count}"
+                )
+
+            name = "hrms_http_request_duration_seconds"
+            family(name, "histogram", "HTTP request latency, including streamed bodies.")
+            for (method, route), histogram in sorted(self._latency.items()):
+                for bound, count in histogram.cumulative():
+                    labels = _labels(method=method, route=route, le=bound)
+                    lines.append(f"{name}_bucket{labels} {count}")
+                labels = _labels(method=method, route=route)
+                lines.append(f"{name}_sum{labels} {histogram.sum}")
+                lines.append(f"{name}_count{labels} {histogram.count}")
+
+            family("hrms_db_queries_total", "counter", "SQL statements executed per route.")
+            for (method, route), count in sorted(self._queries.items()):
+                lines.append(f"hrms_db_queries_total{_labels(method=method, route=route)} {count}")
+
+            family("hrms_db_query_seconds_total", "counter", "Time spent in SQL per route.")
+            for (method, route), seconds in sorted(self._db_seconds.items()):
+                labels = _labels(method=method, route=route)
+                lines.append(f"hrms_db_query_seconds_total{labels} {seconds}")
+
+            family("hrms_db_pool_checkouts_total", "counter", "Connections checked out of a pool.")
+            for engine, count in sorted(self._checkouts.items()):
+                lines.append(f"hrms_db_pool_checkouts_total{_labels(engine=engine)} {count}")
+
+        for gauge, help_text in (
+            ("checked_out", "Connections currently checked out."),
+            ("size", "Configured pool size."),
+        ):
+            family(f"hrms_db_pool_{gauge}", "gauge", help_text)
+            for engine, values in sorted(pools.items()):
+                lines.append(f"hrms_db_pool_{gauge}{_labels(engine=engine)} {values[gauge]}")
+        return "\n".join(lines) + "\n"
+
+
+request_metrics = RequestMetrics()
+
+# Wall time of POST /auth/login, including queueing for the password hasher.
+login_latency = LatencyWindow(size=1024)
@@ -0,0 +1,119 @@
+import asyncio
+import multiprocessing
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import cache
+from typing import Any
+
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+
+from app.core import security
+from app.core.config import settings
+
+
+def _noop() -> None:
+    return None
+
+
+@cache
+def _dummy_hash() -> str:
+    return security.hash_password("timing-equalizer")
+
+
+def _verify_unknown(password: str) -> bool:
+    # Unknown emails still cost one verification, so response time does not reveal them.
+    return security.verify_password(password, _dummy_hash())
+
+
+class PasswordHasher:
+    """
+    Runs pbkdf2 hashing on a bounded process pool, off the event loop and the GIL.
+
+    At most `max_pending` operations may be queued or running; beyond that
+    callers get a 503 instead of piling up behind a login burst. With
+    `workers=0` the work runs on the threadpool instead.
+    """
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.busy_seconds = 0.0
+        self._executor: Executor | None = None
+
+    def start(self) -> None:
+        if self.workers <= 0 or self._executor is not None:
+            return
+        # spawn: forking a process that already runs the event loop and DB pools is unsafe.
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        for _ in range(self.workers):
+            self._executor.submit(_noop)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _run[T](self, fn: Callable[..., T], *args: Any) -> T:
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many password operations in progress. Retry shortly.",
+                headers={"Retry-After": "1"},
+            )
+        self.pending += 1
+        started = time.perf_counter()
+        try:
+            if self.workers <= 0:
+                result = await run_in_threadpool(fn, *args)
+            else:
+                self.start()
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self._executor, fn, *args)
+        except BaseException:
+            # Failures and cancellations stay out of `completed` and the average.
+            self.failed += 1
+            raise
+        finally:
+            self.pending -= 1
+        self.completed += 1
+        self.busy_seconds += time.perf_counter() - started
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._run(security.hash_password, password)
+
+    async def verify(self, password: str, password_hash: str | None) -> tuple[bool, str | None]:
+        """Returns `(valid, new_hash)`; `new_hash` is set when the stored cost is outdated."""
+        if password_hash is None:
+            await self._run(_verify_unknown, password)
+            return False, None
+        return await self._run(security.verify_and_update, password, password_hash)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "rounds": settings.password_hash_rounds,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "avg_ms": round(self.busy_seconds / self.completed * 1000, 2)
+            if self.completed
+            else None,
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+)
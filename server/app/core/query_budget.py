@@ -0,0 +1,46 @@
+from collections.abc import Callable, Iterable
+from enum import Enum
+from typing import Any
+
+from fastapi.routing import APIRoute
+
+QUERY_BUDGET_ATTR = "query_budget"
+
+
+class QueryBudgetMode(str, Enum):
+    OFF = "off"
+    LOG = "log"
+    RAISE = "raise"
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """A request ran more SQL statements than its route declares."""
+
+
+def query_budget[F: Callable[..., Any]](max_queries: int) -> Callable[[F], F]:
+    """
+    Declares the most SQL statements one request to this route may run.
+
+    Count the worst case: authentication on a principal-cache miss, cold
+    response caches and every branch the endpoint can take, including queries
+    run while streaming the body or in background tasks. Place it directly above
+    the endpoint function.
+    """
+
+    def decorator(endpoint: F) -> F:
+        setattr(endpoint, QUERY_BUDGET_ATTR, max_queries)
+        return endpoint
+
+    return decorator
+
+
+def budget_for(route: Any) -> int | None:
+    return getattr(getattr(route, "endpoint", None), QUERY_BUDGET_ATTR, None)
+
+
+def routes_without_budget(routes: Iterable[Any]) -> list[str]:
+    return [
+        f"{','.join(sorted(route.methods))} {route.path}"
+        for route in routes
+        if isinstance(route, APIRoute) and budget_for(route) is None
+    ]
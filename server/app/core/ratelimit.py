@@ -1,6 +1,57 @@
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+import math
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from limits import RateLimitItem, parse_many
+from limits.aio.strategies import MovingWindowRateLimiter
+from limits.storage import storage_from_string
 
 from app.core.config import settings
 
-limiter = Limiter(key_func=get_remote_address, default_limits=[settings.rate_limit_default])
+F = TypeVar("F", bound=Callable[..., Any])
+
+_ROUTE_LIMITS = "__rate_limits__"
+
+
+class RateLimiter:
+    """
+    Per-client request limits on the `limits` package; `RateLimitMiddleware` applies them.
+
+    Every route gets `default` unless it declares its own with `limit` (which then
+    replaces the default) or opts out with `exempt`. A client's hits are counted per
+    route, so one busy endpoint does not use up another's allowance.
+    """
+
+    def __init__(self, default: str, storage_uri: str) -> None:
+        self.default_limits = parse_many(default)
+        self.strategy = MovingWindowRateLimiter(storage_from_string(storage_uri))
+
+    def limit(self, value: str) -> Callable[[F], F]:
+        items = parse_many(value)
+
+        def decorator(func: F) -> F:
+            setattr(func, _ROUTE_LIMITS, items)
+            return func
+
+        return decorator
+
+    def exempt(self, func: F) -> F:
+        setattr(func, _ROUTE_LIMITS, [])
+        return func
+
+    def limits_for(self, endpoint: Callable[..., Any] | None) -> list[RateLimitItem]:
+        return getattr(endpoint, _ROUTE_LIMITS, self.default_limits)
+
+    async def hit(self, items: list[RateLimitItem], *identifiers: str) -> int | None:
+        """Counts one request against `items`; seconds until retry if any is exhausted."""
+
+        for item in items:
+            if not await self.strategy.hit(item, *identifiers):
+                stats = await self.strategy.get_window_stats(item, *identifiers)
+                return max(1, math.ceil(stats.reset_time - time.time()))
+        return None
+
+
+# Memory storage is per worker; point RATE_LIMIT_STORAGE_URI at Redis to share counts.
+limiter = RateLimiter(settings.rate_limit_default, settings.rate_limit_storage_uri)
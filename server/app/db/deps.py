@@ -1,13 +1,152 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Generator, Sequence
+from contextlib import asynccontextmanager
+from typing import Annotated, Any
 
+from fastapi import Depends, Request
+from sqlalchemy import Row, Select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import HTTPConnection
 
-from app.db.session import SessionLocal
+from app.core.config import settings
+from app.db.replicas import Replica, replicas
+from app.db.session import AsyncSessionLocal, SessionLocal
 
+DbSession = AsyncSession | Session
 
-def get_db() -> Generator[Session]:
+
+def get_sync_db() -> Generator[Session]:
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+get_db = get_async_db if settings.database_async else get_sync_db
+
+# Send `X-Read-Primary: 1` to make a read-only request use the primary.
+READ_PRIMARY_HEADER = "x-read-primary"
+
+
+def read_client_key(connection: HTTPConnection) -> str:
+    """Who a request is from, for sticking a client's reads to the primary after it writes."""
+
+    client = connection.client.host if connection.client else ""
+    return connection.headers.get("authorization") or client
+
+
+def read_replica_for(request: Request) -> Replica | None:
+    """
+    Picks a healthy replica for a read-only request, round-robin. Returns None (the
+    primary) when the request sends X-Read-Primary, its client wrote within
+    REPLICA_STICKY_SECONDS or no replica is configured and healthy.
+    """
+
+    replica = None
+    if replicas and not (
+        request.headers.get(READ_PRIMARY_HEADER, "").lower() in ("1", "true")
+        or replicas.wrote_recently(read_client_key(request))
+    ):
+        replica = replicas.choose()
+    request.state.read_source = replica.name if replica else "primary"
+    return replica
+
+
+def get_sync_read_db(
+    request: Request, primary: Annotated[Session, Depends(get_sync_db)]
+) -> Generator[Session]:
+    replica = read_replica_for(request)
+    if replica is None:
+        # The request's own primary session, shared with authentication.
+        yield primary
+        return
+    db = replica.session_factory()
+    try:
+        yield db
+    except OperationalError as exc:
+        replicas.mark_down(replica, str(exc).splitlines()[0])
+        raise
+    finally:
+        db.close()
+
+
+async def get_async_read_db(
+    request: Request, primary: Annotated[AsyncSession, Depends(get_async_db)]
+) -> AsyncGenerator[AsyncSession]:
+    replica = read_replica_for(request)
+    if replica is None:
+        yield primary
+        return
+    async with replica.async_session_factory() as db:
+        try:
+            yield db
+        except OperationalError as exc:
+            replicas.mark_down(replica, str(exc).splitlines()[0])
+            raise
+
+
+# For routes that only read. Writes, and reads that must see the request's own
+# writes, keep using get_db.
+get_read_db = get_async_read_db if settings.database_async else get_sync_read_db
+
+
+async def run_db[T](db: DbSession, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Runs a controller/service function that takes a sync `Session` first.
+
+    On an `AsyncSession` the function runs via `run_sync`, so its queries await on
+    the event loop instead of holding a threadpool slot. On a sync `Session` it runs
+    in the threadpool, which is how plain `def` routes behaved before.
+    """
+
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
+
+
+@asynccontextmanager
+async def streaming_session(replica: Replica | None = None) -> AsyncIterator[DbSession]:
+    """
+    A session of the configured DB mode, on `replica` if one is given, for work that
+    runs while a streaming response is sent and so outlives the request's dependencies.
+    """
+
+    if settings.database_async:
+        async with (replica.async_session_factory if replica else AsyncSessionLocal)() as db:
+            yield db
+        return
+    db = replica.session_factory() if replica else SessionLocal()
+    try:
+        yield db
+    finally:
+        await run_in_threadpool(db.close)
+
+
+async def stream_rows(
+    stmt: Select, batch_size: int, replica: Replica | None = None
+) -> AsyncIterator[Sequence[Row]]:
+    """
+    Yields the rows of `stmt` in batches from a server-side cursor, on `replica`
+    if one is given.
+
+    Memory stays at roughly one batch however many rows match.
+    """
+
+    stmt = stmt.execution_options(yield_per=batch_size)
+    async with streaming_session(replica) as db:
+        if isinstance(db, AsyncSession):
+            result = await db.stream(stmt)
+            async for batch in result.partitions():
+                yield batch
+            return
+        result = await run_in_threadpool(db.execute, stmt)
+        while batch := await run_in_threadpool(result.fetchmany, batch_size):
+            yield batch
@@ -0,0 +1,47 @@
+import time
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+from app.core.metrics import request_metrics, request_queries
+
+_STARTED = "_hrms_query_started"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None:
+        setattr(context, _STARTED, time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = request_queries.get()
+    if stats is None:
+        return
+    stats.queries += 1
+    started = getattr(context, _STARTED, None)
+    if started is not None:
+        stats.db_seconds += time.perf_counter() - started
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """
+    Counts statements and SQL time for the current request, and pool checkouts.
+
+    Pass `async_engine.sync_engine` for an async engine. Statements run outside a
+    request (startup, background flushes) are not attributed to anything.
+    """
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+    def on_checkout(dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        request_metrics.observe_checkout(name)
+
+    event.listen(engine, "checkout", on_checkout)
+
+
+def pool_gauges(engines: dict[str, Engine]) -> dict[str, dict[str, int]]:
+    return {
+        name: {"checked_out": engine.pool.checkedout(), "size": engine.pool.size()}
+        for name, engine in engines.items()
+    }
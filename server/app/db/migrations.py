@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from alembic.command import upgrade
+from alembic.config import Config
+from sqlalchemy import text
+
+from app.db.session import engine
+
+SCRIPT_LOCATION = Path(__file__).resolve().parents[2] / "alembic"
+# Workers that start together take turns; the later ones find nothing left to apply.
+_LOCK_KEY = "hrms.migrations"
+
+
+def upgrade_schema() -> None:
+    """`alembic upgrade head`, the same as running it from the command line."""
+
+    # No ini file, so env.py leaves the app's logging configuration alone.
+    config = Config()
+    config.set_main_option("script_location", str(SCRIPT_LOCATION))
+    # Autocommit: an open transaction here would hold up CREATE INDEX CONCURRENTLY.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("SELECT pg_advisory_lock(hashtext(:key))"), {"key": _LOCK_KEY})
+        try:
+            upgrade(config, "head")
+        finally:
+            connection.execute(
+                text("SELECT pg_advisory_unlock(hashtext(:key))"), {"key": _LOCK_KEY}
+            )
@@ -0,0 +1,85 @@
+from enum import Enum
+from typing import Any, NamedTuple
+
+from sqlalchemy import ColumnElement, Executable, func, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.expression import ClauseElement
+
+# Below this many estimated rows an exact count is cheap enough to run instead.
+ESTIMATE_EXACT_THRESHOLD = 10_000
+
+
+class TotalMode(str, Enum):
+    NONE = "false"
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+
+
+class PageTotal(NamedTuple):
+    value: int | None
+    kind: TotalMode
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Any) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain)
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def estimate_count(db: Session, query: Query) -> int:
+    """Row estimate from the planner's statistics; never executes the query."""
+    plan = db.execute(_Explain(query.order_by(None).statement)).scalar_one()
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def fetch_page(
+    db: Session,
+    query: Query,
+    order_by: tuple[ColumnElement, ...],
+    limit: int,
+    offset: int,
+    include_total: TotalMode = TotalMode.EXACT,
+    seek: ColumnElement[bool] | None = None,
+) -> tuple[list[Any], PageTotal]:
+    """
+    Returns one page of `query` plus its total.
+
+    Exact totals ride along with the page as a scalar subquery, so the filter
+    and the page come back in a single statement. `seek` narrows the page only,
+    so keyset pages still report the total of the whole filter.
+    """
+
+    kind = include_total
+    total: int | None = None
+    if kind == TotalMode.ESTIMATE:
+        total = estimate_count(db, query)
+        if total < ESTIMATE_EXACT_THRESHOLD:
+            kind = TotalMode.EXACT
+
+    page = query if seek is None else query.filter(seek)
+    page = page.order_by(*order_by).offset(offset).limit(limit)
+    # A single-entity query yields the entity; multi-entity and column queries yield tuples.
+    descriptions = query.column_descriptions
+    as_tuples = len(descriptions) > 1 or not isinstance(descriptions[0]["expr"], type)
+    if kind != TotalMode.EXACT:
+        rows = page.all()
+        return rows, PageTotal(total, kind)
+
+    count_sq = select(func.count()).select_from(query.order_by(None).subquery())
+    rows = page.add_columns(count_sq.scalar_subquery().label("page_total")).all()
+    items = [tuple(row[:-1]) if as_tuples else row[0] for row in rows]
+    if rows:
+        total = int(rows[0][-1])
+    elif offset == 0 and seek is None:
+        total = 0
+    else:
+        # Past the last row the page is empty, so the inline count has nowhere to land.
+        total = query.order_by(None).count()
+    return items, PageTotal(total, kind)
@@ -0,0 +1,30 @@
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import ColumnElement
+
+
+def select_columns(
+    columns: Mapping[str, ColumnElement],
+    fields: Sequence[str] | None,
+    keys: Sequence[str] = (),
+) -> tuple[tuple[str, ...], list[ColumnElement]]:
+    """
+    SELECT list for `fields` (every entry of `columns` when None), followed by any
+    sort-key columns in `keys` the caller did not ask for. Each column is labeled
+    with its field name.
+    """
+
+    names = tuple(fields) if fields is not None else tuple(columns)
+    names += tuple(key for key in keys if key not in names)
+    return names, [columns[name].label(name) for name in names]
+
+
+def as_dicts(rows: Iterable[Sequence[Any]], fields: Sequence[str]) -> list[dict[str, Any]]:
+    """Maps column rows from `select_columns` onto `fields`, dropping the trailing key columns."""
+
+    return [dict(zip(fields, row, strict=False)) for row in rows]
+
+
+def row_key(row: Sequence[Any], names: Sequence[str], keys: Sequence[str]) -> tuple:
+    return tuple(row[names.index(key)] for key in keys)
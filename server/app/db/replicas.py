@@ -0,0 +1,143 @@
+import asyncio
+import threading
+
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.logger import logger
+from app.db.instrumentation import instrument_engine
+
+# Seconds the replica is behind: 0 when it has replayed everything it received
+# (an idle primary sends nothing, so the replay timestamp alone would look stale)
+# or when it is not a standby at all.
+LAG_QUERY = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() "
+    "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+# Keeps a dead replica from stalling its health check for the OS connect timeout.
+CONNECT_TIMEOUT_SECONDS = 3
+
+
+class Replica:
+    """Engines and health state of one read replica."""
+
+    def __init__(self, name: str, url: str) -> None:
+        self.name = name
+        self.host = make_url(url).render_as_string(hide_password=True)
+        options = {
+            "pool_pre_ping": True,
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "connect_args": {"connect_timeout": CONNECT_TIMEOUT_SECONDS},
+        }
+        self.engine = create_engine(url, **options)
+        self.async_engine = create_async_engine(url, **options)
+        self.session_factory = sessionmaker(bind=self.engine, autoflush=False, autocommit=False)
+        self.async_session_factory = async_sessionmaker(
+            bind=self.async_engine, autoflush=False, autocommit=False, expire_on_commit=False
+        )
+        instrument_engine(self.engine, f"{name}-sync")
+        instrument_engine(self.async_engine.sync_engine, f"{name}-async")
+        # Unhealthy until the first check passes.
+        self.healthy = False
+        self.lag_seconds: float | None = None
+
+
+class ReplicaPool:
+    """
+    Round-robin over the healthy replicas in DATABASE_REPLICA_URLS.
+
+    `check` marks a replica unhealthy when it cannot be reached or lags the primary
+    by more than `max_lag_seconds`. Clients that just wrote are remembered for
+    `sticky_seconds` so their next reads go to the primary and see their own writes.
+    """
+
+    def __init__(self, urls: list[str], max_lag_seconds: float, sticky_seconds: float) -> None:
+        self.replicas = [Replica(f"replica{index}", url) for index, url in enumerate(urls, 1)]
+        self.max_lag_seconds = max_lag_seconds
+        self._next = 0
+        self._lock = threading.Lock()
+        self._recent_writers = TTLCache(max_size=10_000, ttl_seconds=sticky_seconds)
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def choose(self) -> Replica | None:
+        with self._lock:
+            for _ in range(len(self.replicas)):
+                replica = self.replicas[self._next]
+                self._next = (self._next + 1) % len(self.replicas)
+                if replica.healthy:
+                    return replica
+        return None
+
+    def mark_down(self, replica: Replica, reason: str) -> None:
+        if replica.healthy:
+            logger.warning("read replica %s (%s) is down: %s", replica.name, replica.host, reason)
+        replica.healthy = False
+
+    def check(self) -> None:
+        for replica in self.replicas:
+            try:
+                with replica.engine.connect() as connection:
+                    lag = float(connection.scalar(LAG_QUERY) or 0)
+            except Exception as exc:
+                replica.lag_seconds = None
+                self.mark_down(replica, f"{type(exc).__name__}: {exc}".splitlines()[0])
+                continue
+            replica.lag_seconds = lag
+            if lag > self.max_lag_seconds:
+                self.mark_down(replica, f"{lag:.1f}s behind the primary")
+            elif not replica.healthy:
+                logger.info("read replica %s (%s) is up", replica.name, replica.host)
+                replica.healthy = True
+
+    def wrote(self, client: str) -> None:
+        self._recent_writers.put(client, True)
+
+    def wrote_recently(self, client: str) -> bool:
+        return self._recent_writers.get(client) is not None
+
+    def engines(self) -> dict[str, Engine]:
+        engines = {}
+        for replica in self.replicas:
+            engines[f"{replica.name}-sync"] = replica.engine
+            engines[f"{replica.name}-async"] = replica.async_engine.sync_engine
+        return engines
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            replica.engine.dispose()
+            await replica.async_engine.dispose()
+
+    def status(self) -> list[dict]:
+        return [
+            {
+                "name": replica.name,
+                "host": replica.host,
+                "healthy": replica.healthy,
+                "lag_seconds": replica.lag_seconds,
+            }
+            for replica in self.replicas
+        ]
+
+
+replicas = ReplicaPool(
+    settings.database_replica_urls,
+    max_lag_seconds=settings.replica_max_lag_seconds,
+    sticky_seconds=settings.replica_sticky_seconds,
+)
+
+
+async def run_periodic_health_checks(interval_seconds: float) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await asyncio.to_thread(replicas.check)
+        except Exception:
+            logger.exception("read replica health check failed; will retry")
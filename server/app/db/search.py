@@ -0,0 +1,59 @@
+import re
+from enum import Enum
+
+from sqlalchemy import ColumnElement, cast, func, literal, or_
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, REGCONFIG
+
+# `simple` keeps names, codes and emails as typed: no stemming and no stop words.
+SEARCH_CONFIG = "simple"
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+class SearchMode(str, Enum):
+    SUBSTRING = "substring"
+    RANKED = "ranked"
+
+
+def weighted_vector(*columns: tuple[str, str]) -> str:
+    """
+    SQL for a generated tsvector over `(column, weight)` pairs.
+
+    Punctuation splits words, so `EMP-001` indexes as `emp`, `001` and
+    `ava.patel@hrms.com` as `ava`, `patel`, `hrms`, `com`.
+    """
+
+    return " || ".join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', "
+        f"regexp_replace(coalesce({column}, ''), '[^[:alnum:]]+', ' ', 'g')), '{weight}')"
+        for column, weight in columns
+    )
+
+
+def substring_search(term: str, *columns: ColumnElement[str]) -> ColumnElement[bool]:
+    """`term` anywhere in any of `columns`, case-insensitively; the trigram indexes serve it."""
+
+    like = f"%{term}%"
+    return or_(*(column.ilike(like) for column in columns))
+
+
+def text_search(
+    vector: ColumnElement, term: str, fallback: ColumnElement[bool]
+) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+    """
+    Returns `(match, rank)` for `term` against a `weighted_vector` column.
+
+    Every word of the term must prefix-match a word of the row, which the GIN
+    index on the vector serves. Rank orders by how many and which weighted
+    columns matched; it is widened to double precision so a rank read back from
+    a cursor compares equal to the stored one. A term without any words has
+    nothing to rank, so it matches by `fallback` with every row ranked equal.
+    """
+
+    words = _WORD.findall(term.lower())
+    if not words:
+        return fallback, literal(0.0, DOUBLE_PRECISION)
+    query = func.to_tsquery(
+        cast(SEARCH_CONFIG, REGCONFIG), " & ".join(f"{word}:*" for word in words)
+    )
+    return vector.op("@@")(query), cast(func.ts_rank(vector, query), DOUBLE_PRECISION)
@@ -1,7 +1,28 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.db.instrumentation import instrument_engine
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+engine = create_engine(
+    settings.database_url,
+    pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+# psycopg 3 speaks asyncio natively, so the same URL drives the async engine.
+async_engine = create_async_engine(
+    settings.database_url,
+    pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, autocommit=False, expire_on_commit=False
+)
+
+instrument_engine(engine, "sync")
+instrument_engine(async_engine.sync_engine, "async")
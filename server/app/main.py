@@ -1,9 +1,9 @@
+import asyncio
+
 from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
 from sqlalchemy import text
 from starlette.middleware.httpsredirect import HTTPSRedirectMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
@@ -13,21 +13,32 @@ from app.api.router import api_router
 from app.core.config import settings
 from app.core.exceptions import (
     http_exception_handler,
-    rate_limit_exception_handler,
     unhandled_exception_handler,
     validation_exception_handler,
 )
 from app.core.logger import logger, setup_logging
+from app.core.password_hasher import password_hasher
+from app.core.query_budget import QueryBudgetMode, routes_without_budget
 from app.core.ratelimit import limiter
-from app.db.base import Base
-from app.db.session import engine
-from app.middleware.request_logging import request_logger
+from app.db.migrations import upgrade_schema
+from app.db.replicas import replicas, run_periodic_health_checks
+from app.db.session import async_engine, engine
+from app.middleware.query_budget import QueryBudgetMiddleware
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.read_routing import ReadRoutingMiddleware
+from app.middleware.request_logging import RequestLoggingMiddleware
 from app.middleware.security_headers import SecurityHeadersMiddleware
+from app.services import attendance_partition_service, last_active_service
+from app.utils.response import ApiJSONResponse
+
+# Upcoming months are created well ahead, so a few checks a day are plenty.
+PARTITION_MAINTENANCE_SECONDS = 6 * 60 * 60
 
 
 def create_app() -> FastAPI:
     setup_logging()
     app = FastAPI(
+        default_response_class=ApiJSONResponse,
         title="HRMS Lite API",
         version="1.0.0",
         docs_url="/docs",
@@ -35,7 +46,11 @@ def create_app() -> FastAPI:
         openapi_url="/openapi.json",
     )
 
-    app.state.limiter = limiter
+    query_budget_mode = QueryBudgetMode(settings.query_budget_mode)
+    if query_budget_mode != QueryBudgetMode.OFF:
+        app.add_middleware(QueryBudgetMiddleware, mode=query_budget_mode)
+    if replicas:
+        app.add_middleware(ReadRoutingMiddleware)
 
     # CORS configuration
     cors_origins = settings.cors_allow_origins
@@ -50,37 +65,73 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     app.add_middleware(GZipMiddleware, minimum_size=1000)
-    app.add_middleware(SlowAPIMiddleware)
+    app.add_middleware(RateLimitMiddleware, limiter=limiter)
     app.add_middleware(TrustedHostMiddleware, allowed_hosts=["*"])
     # We use '*' for TrustedHostMiddleware in this Lite app to avoid port matching issues in local dev
     app.add_middleware(SecurityHeadersMiddleware)
     if settings.enable_https_redirect:
         app.add_middleware(HTTPSRedirectMiddleware)
-
-    @app.middleware("http")
-    async def logging_middleware(request, call_next):
-        return await request_logger(request, call_next)
+    app.add_middleware(RequestLoggingMiddleware)
 
     @app.on_event("startup")
     def on_startup() -> None:
         try:
             with engine.connect() as connection:
                 connection.execute(text("SELECT 1"))
-            Base.metadata.create_all(bind=engine)
-            logger.info("startup complete")
+            if settings.auto_migrate:
+                upgrade_schema()
+            attendance_partition_service.maintain(settings.attendance_partition_months_ahead)
+            # Replicas start unhealthy; check now so reads use them from the first request.
+            replicas.check()
+            password_hasher.start()
+            logger.info(
+                "startup complete db_mode=%s read_replicas=%d",
+                "async" if settings.database_async else "sync",
+                len(replicas.replicas),
+            )
         except Exception:
             logger.exception("startup failed")
             raise
 
+    @app.on_event("startup")
+    async def start_background_jobs() -> None:
+        app.state.last_active_flusher = asyncio.create_task(
+            last_active_service.run_periodic_flush(settings.last_active_flush_seconds)
+        )
+        app.state.partition_maintainer = asyncio.create_task(
+            attendance_partition_service.run_periodic_maintenance(
+                PARTITION_MAINTENANCE_SECONDS, settings.attendance_partition_months_ahead
+            )
+        )
+        app.state.replica_checker = None
+        if replicas:
+            app.state.replica_checker = asyncio.create_task(
+                run_periodic_health_checks(settings.replica_health_check_seconds)
+            )
+
     @app.on_event("shutdown")
-    def on_shutdown() -> None:
+    async def on_shutdown() -> None:
+        app.state.last_active_flusher.cancel()
+        app.state.partition_maintainer.cancel()
+        if app.state.replica_checker:
+            app.state.replica_checker.cancel()
+        try:
+            await last_active_service.flush_pending()
+        except Exception:
+            logger.exception("final last_active flush failed")
+        password_hasher.shutdown()
+        await async_engine.dispose()
+        await replicas.dispose()
         logger.info("shutdown complete")
 
     app.include_router(api_router)
+    if query_budget_mode != QueryBudgetMode.OFF:
+        missing = routes_without_budget(app.routes)
+        if missing:
+            raise RuntimeError(f"Routes without @query_budget: {', '.join(missing)}")
     app.add_exception_handler(Exception, unhandled_exception_handler)
     app.add_exception_handler(HTTPException, http_exception_handler)
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
-    app.add_exception_handler(RateLimitExceeded, rate_limit_exception_handler)
     return app
 
 
@@ -0,0 +1,50 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logger import logger
+from app.core.metrics import request_queries
+from app.core.query_budget import QueryBudgetExceeded, QueryBudgetMode, budget_for
+
+
+class QueryBudgetMiddleware:
+    """
+    Compares each request's SQL statement count with its route's `@query_budget`.
+
+    Meant for development and tests (`QUERY_BUDGET_MODE=log|raise`); it relies on
+    the counter RequestLoggingMiddleware sets up, so it must sit inside it. In
+    `raise` mode an over-budget request fails with a 500 before its headers are
+    sent. Statements run after that (streamed bodies) can only be logged.
+    """
+
+    def __init__(self, app: ASGIApp, mode: QueryBudgetMode) -> None:
+        self.app = app
+        self.mode = mode
+
+    def _check(self, scope: Scope, queries: int, can_raise: bool) -> bool:
+        budget = budget_for(scope.get("route"))
+        if budget is None or queries <= budget:
+            return True
+        message = (
+            f"{scope['method']} {scope['route'].path} ran {queries} SQL statements; "
+            f"its query budget is {budget}."
+        )
+        if can_raise and self.mode == QueryBudgetMode.RAISE:
+            raise QueryBudgetExceeded(message)
+        logger.warning("query_budget_exceeded %s", message)
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        stats = request_queries.get()
+        if scope["type"] != "http" or stats is None:
+            await self.app(scope, receive, send)
+            return
+        reported = False
+
+        async def send_checked(message: Message) -> None:
+            nonlocal reported
+            if message["type"] == "http.response.start":
+                reported = not self._check(scope, stats.queries, can_raise=True)
+            await send(message)
+
+        await self.app(scope, receive, send_checked)
+        if not reported:
+            self._check(scope, stats.queries, can_raise=False)
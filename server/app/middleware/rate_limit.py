@@ -0,0 +1,51 @@
+from fastapi.responses import JSONResponse
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.ratelimit import RateLimiter
+from app.schemas.response import ErrorResponse
+
+
+def _match_route(scope: Scope) -> tuple[str, object | None]:
+    """The scope (for counting) and endpoint of the route `scope` will be served by."""
+
+    for route in scope["app"].routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            endpoint = getattr(route, "endpoint", None)
+            if endpoint is not None:
+                return f"{endpoint.__module__}.{endpoint.__qualname__}", endpoint
+            break
+    return scope["path"], None
+
+
+class RateLimitMiddleware:
+    """
+    Pure ASGI rate limiting that also works with StreamingResponse.
+
+    The limit is checked before the app runs, so an allowed request passes straight
+    through and its messages are never held back or replayed.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter) -> None:
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        route, endpoint = _match_route(scope)
+        items = self.limiter.limits_for(endpoint)
+        if items:
+            client = scope["client"][0] if scope.get("client") else "127.0.0.1"
+            retry_after = await self.limiter.hit(items, client, route)
+            if retry_after is not None:
+                response = JSONResponse(
+                    status_code=429,
+                    content=ErrorResponse(message="Rate limit exceeded.").model_dump(),
+                    headers={"Retry-After": str(retry_after)},
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
@@ -0,0 +1,38 @@
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.deps import read_client_key
+from app.db.replicas import replicas
+
+READ_ONLY_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class ReadRoutingMiddleware:
+    """
+    Companion to `get_read_db`, installed when read replicas are configured.
+
+    Clients that send a write are remembered once it has been answered, so their
+    reads go to the primary for REPLICA_STICKY_SECONDS. Responses served by
+    `get_read_db` say which database they came from in `X-Read-Source`.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        state = scope.setdefault("state", {})
+
+        async def send_with_source(message: Message) -> None:
+            if message["type"] == "http.response.start" and "read_source" in state:
+                MutableHeaders(scope=message)["X-Read-Source"] = state["read_source"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_source)
+        finally:
+            if scope["method"] not in READ_ONLY_METHODS:
+                replicas.wrote(read_client_key(HTTPConnection(scope)))
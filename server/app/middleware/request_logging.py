@@ -1,24 +1,70 @@
 import time
 import uuid
 
-from fastapi import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logger import logger
+from app.core.metrics import QueryStats, request_metrics, request_queries
 
 
-async def request_logger(request: Request, call_next) -> Response:
-    request_id = request.headers.get("X-Request-Id", str(uuid.uuid4()))
-    start_time = time.time()
-    response: Response = await call_next(request)
-    duration_ms = int((time.time() - start_time) * 1000)
-    response.headers["X-Request-Id"] = request_id
-    logger.info(
-        "request_id=%s method=%s path=%s status=%s duration_ms=%s",
-        request_id,
-        request.method,
-        request.url.path,
-        response.status_code,
-        duration_ms,
-    )
-    return response
+def _route_label(scope: Scope) -> str:
+    # The router stores the matched route in the scope; unmatched paths share one label.
+    route = scope.get("route")
+    return getattr(route, "path", "unmatched")
+
+
+class RequestLoggingMiddleware:
+    """
+    Tags every response with `X-Request-Id` and logs one line per request.
+
+    The duration covers the whole response, including streamed bodies. SQL
+    statements counted by the engine hooks are reported in a `Server-Timing`
+    header (`db` and `app`, as of the moment headers are sent), in the log line
+    and in `request_metrics`.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_id = Headers(scope=scope).get("X-Request-Id") or str(uuid.uuid4())
+        start_time = time.perf_counter()
+        status_code = 500
+        queries = QueryStats()
+        token = request_queries.set(queries)
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-Id"] = request_id
+                app_ms = (time.perf_counter() - start_time) * 1000
+                headers["Server-Timing"] = (
+                    f'db;dur={queries.db_seconds * 1000:.1f};desc="queries={queries.queries}", '
+                    f"app;dur={app_ms:.1f}"
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_queries.reset(token)
+            elapsed = time.perf_counter() - start_time
+            request_metrics.observe_request(
+                scope["method"], _route_label(scope), status_code, elapsed, queries
+            )
+            logger.info(
+                "request_id=%s method=%s path=%s status=%s duration_ms=%s queries=%s db_ms=%s",
+                request_id,
+                scope["method"],
+                scope["path"],
+                status_code,
+                int(elapsed * 1000),
+                queries.queries,
+                int(queries.db_seconds * 1000),
+            )
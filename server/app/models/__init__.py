@@ -1,5 +1,16 @@
 from app.models.admin import Admin
 from app.models.attendance import Attendance, AttendanceStatus
+from app.models.attendance_archive import AttendanceArchive
+from app.models.attendance_daily_count import AttendanceDailyCount
+from app.models.attendance_monthly_count import AttendanceMonthlyCount
 from app.models.employee import Employee
 
-__all__ = ["Admin", "Attendance", "AttendanceStatus", "Employee"]
+__all__ = [
+    "Admin",
+    "Attendance",
+    "AttendanceArchive",
+    "AttendanceDailyCount",
+    "AttendanceMonthlyCount",
+    "AttendanceStatus",
+    "Employee",
+]
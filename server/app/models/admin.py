@@ -1,15 +1,29 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, func
+from sqlalchemy import Computed, DateTime, ForeignKey, Index, String, func
 from sqlalchemy import Enum as SqlEnum
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.rbac import Role
 from app.db.base import Base
+from app.db.search import weighted_vector
 
 
 class Admin(Base):
     __tablename__ = "admins"
+    __table_args__ = (
+        Index("ix_admins_search_vector", "search_vector", postgresql_using="gin"),
+        *(
+            Index(
+                f"ix_admins_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+            for column in ("name", "email")
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str | None] = mapped_column(String(120), nullable=True)
@@ -27,3 +41,8 @@ class Admin(Base):
     updated_by_id: Mapped[int | None] = mapped_column(
         ForeignKey("admins.id", ondelete="SET NULL"), nullable=True
     )
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(weighted_vector(("name", "A"), ("email", "A")), persisted=True),
+        deferred=True,
+    )
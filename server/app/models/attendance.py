@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from enum import Enum
 
-from sqlalchemy import Date, DateTime, ForeignKey, UniqueConstraint, func
+from sqlalchemy import Date, DateTime, ForeignKey, Index, UniqueConstraint, func
 from sqlalchemy import Enum as PgEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -15,7 +15,11 @@ class AttendanceStatus(str, Enum):
 
 class Attendance(Base):
     __tablename__ = "attendance"
-    __table_args__ = (UniqueConstraint("employee_id", "date", name="uq_employee_date"),)
+    __table_args__ = (
+        UniqueConstraint("employee_id", "date", name="uq_employee_date"),
+        # Global list/export order; see migration 5f0e2c7d9b14 for the queries each index serves.
+        Index("ix_attendance_date_id", "date", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     employee_id: Mapped[int] = mapped_column(ForeignKey("employees.id", ondelete="CASCADE"))
@@ -0,0 +1,15 @@
+from datetime import date
+
+from sqlalchemy import Date, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class AttendanceDailyCount(Base):
+    __tablename__ = "attendance_daily_counts"
+
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
+    department: Mapped[str] = mapped_column(String(120), primary_key=True)
+    present: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    absent: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
@@ -0,0 +1,17 @@
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class AttendanceMonthlyCount(Base):
+    __tablename__ = "attendance_monthly_counts"
+
+    employee_id: Mapped[int] = mapped_column(
+        ForeignKey("employees.id", ondelete="CASCADE"), primary_key=True
+    )
+    month: Mapped[date] = mapped_column(Date, primary_key=True)
+    present: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    absent: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
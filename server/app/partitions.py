@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+if __package__ in (None, ""):
+    sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import time
+from datetime import date
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.attendance_partition_service import (
+    detach_month,
+    ensure_partitions,
+    is_partitioned,
+    month_partitions,
+    partition_attendance,
+    partition_name,
+)
+
+
+def _month(value: str) -> date:
+    return date.fromisoformat(f"{value}-01")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Manage monthly range partitions of the attendance table."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    convert = commands.add_parser(
+        "convert", help="convert attendance to a partitioned table (locks it while copying)"
+    )
+    ensure = commands.add_parser("ensure", help="create upcoming and missing month partitions")
+    for command in (convert, ensure):
+        command.add_argument(
+            "--months-ahead", type=int, default=settings.attendance_partition_months_ahead
+        )
+    commands.add_parser("list", help="list month partitions")
+    detach = commands.add_parser("detach", help="detach one month's partition")
+    detach.add_argument("month", type=_month, help="YYYY-MM")
+    detach.add_argument("--drop", action="store_true", help="drop the table after detaching")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.command == "convert":
+            started = time.perf_counter()
+            rows = partition_attendance(db, args.months_ahead)
+            months = len(month_partitions(db))
+            elapsed = time.perf_counter() - started
+            print(f"partitioned attendance: {rows} rows into {months} months in {elapsed:.1f}s")
+        elif not is_partitioned(db):
+            parser.exit(1, "attendance is not partitioned; run `convert` first\n")
+        elif args.command == "ensure":
+            created = ensure_partitions(db, args.months_ahead)
+            print(f"created: {', '.join(created) or 'nothing'}")
+        elif args.command == "list":
+            for month in month_partitions(db):
+                print(partition_name(month))
+        else:
+            name = detach_month(db, args.month, drop=args.drop)
+            print(f"{'dropped' if args.drop else 'detached'} {name}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
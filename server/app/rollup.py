@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+if __package__ in (None, ""):
+    sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from datetime import date
+
+from app.db.session import SessionLocal
+from app.services.attendance_rollup_service import rebuild_daily_counts
+
+
+def rebuild(date_from: date | None = None, date_to: date | None = None) -> int:
+    db = SessionLocal()
+    try:
+        return rebuild_daily_counts(db, date_from, date_to)
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rebuild attendance_daily_counts from raw attendance rows."
+    )
+    parser.add_argument("--date-from", type=date.fromisoformat, default=None)
+    parser.add_argument("--date-to", type=date.fromisoformat, default=None)
+    args = parser.parse_args()
+    rows = rebuild(args.date_from, args.date_to)
+    print(f"rebuilt attendance_daily_counts: {rows} rows")
+
+
+if __name__ == "__main__":
+    main()
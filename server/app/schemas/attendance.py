@@ -3,15 +3,25 @@ from __future__ import annotations
 from datetime import date as dt_date
 from datetime import datetime
 from enum import Enum
+from typing import Literal
+
+from pydantic import Field, model_validator
 
 from app.schemas.base import BaseSchema
 
+BULK_ATTENDANCE_MAX_ITEMS = 10_000
+
 
 class AttendanceStatus(str, Enum):
     PRESENT = "Present"
     ABSENT = "Absent"
 
 
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
 class AttendanceCreate(BaseSchema):
     date: dt_date
     status: AttendanceStatus
@@ -57,3 +67,34 @@ class AttendanceStatsPoint(BaseSchema):
     present: int
     absent: int
     unmarked: int
+
+
+class AttendanceBulkItem(BaseSchema):
+    employee_id: int
+    date: dt_date
+    status: AttendanceStatus
+
+
+class AttendanceBulkRequest(BaseSchema):
+    items: list[AttendanceBulkItem] | None = Field(
+        default=None, min_length=1, max_length=BULK_ATTENDANCE_MAX_ITEMS
+    )
+    department: str | None = Field(default=None, min_length=1, max_length=120)
+    date: dt_date | None = None
+    status: AttendanceStatus | None = None
+
+    @model_validator(mode="after")
+    def check_mode(self) -> AttendanceBulkRequest:
+        department_mode = self.department is not None
+        if (self.items is None) == (not department_mode):
+            raise ValueError("Provide exactly one of items or department.")
+        if department_mode and (self.date is None or self.status is None):
+            raise ValueError("date and status are required when marking a department.")
+        return self
+
+
+class AttendanceBulkResult(BaseSchema):
+    employee_id: int
+    date: dt_date
+    result: Literal["created", "updated", "duplicate", "not_found"]
+    attendance_id: int | None = None
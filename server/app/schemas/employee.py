@@ -4,6 +4,7 @@ from datetime import datetime
 
 from pydantic import EmailStr, Field
 
+from app.core.jobs import JobStatus
 from app.schemas.base import BaseSchema
 
 
@@ -25,7 +26,36 @@ class EmployeeRead(BaseSchema):
     updated_by_id: int | None = None
 
 
+class EmployeeSuggestion(BaseSchema):
+    id: int
+    employee_id: str
+    full_name: str
+
+
 class EmployeeUpdate(BaseSchema):
     full_name: str | None = Field(default=None, min_length=1, max_length=120)
     email: EmailStr | None = None
     department: str | None = Field(default=None, min_length=1, max_length=120)
+
+
+class EmployeeImportRowError(BaseSchema):
+    row: int
+    email: str | None = None
+    error: str
+
+
+class EmployeeImportReport(BaseSchema):
+    total_rows: int
+    created: int
+    failed: int
+    errors: list[EmployeeImportRowError]
+
+
+class EmployeeImportJobRead(BaseSchema):
+    id: str
+    status: JobStatus
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    report: EmployeeImportReport | None = Field(default=None, validation_alias="result")
+    error: str | None = None
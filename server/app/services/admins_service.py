@@ -1,11 +1,14 @@
-from datetime import UTC, datetime
 from typing import Any
 
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
+from app.core.cache import principal_cache
 from app.core.rbac import Role
-from app.core.security import hash_password, verify_password
+from app.db.pagination import PageTotal, TotalMode, fetch_page
+from app.db.search import SearchMode, substring_search, text_search
 from app.models import Admin
+from app.services import last_active_service
 
 
 def list_admins(
@@ -13,36 +16,77 @@ def list_admins(
     limit: int,
     offset: int,
     search: str | None,
-) -> tuple[list[Admin], int]:
-    query = db.query(Admin)
+    after: tuple | None = None,
+    include_total: TotalMode = TotalMode.EXACT,
+    search_mode: SearchMode = SearchMode.SUBSTRING,
+) -> tuple[list[Admin], PageTotal, tuple | None]:
+    """Newest first, or by relevance for a ranked search; see `list_employees` for the key."""
+
+    matches = None
     if search:
-        like = f"%{search.strip()}%"
-        query = query.filter((Admin.email.ilike(like)) | (Admin.name.ilike(like)))
-    total = query.count()
-    items = query.order_by(Admin.id.desc()).offset(offset).limit(limit).all()
-    return items, total
+        matches = substring_search(search.strip(), Admin.email, Admin.name)
+    if not search or search_mode != SearchMode.RANKED:
+        query = db.query(Admin)
+        if matches is not None:
+            query = query.filter(matches)
+        items, total = fetch_page(
+            db,
+            query,
+            order_by=(Admin.id.desc(),),
+            limit=limit,
+            offset=offset,
+            include_total=include_total,
+            seek=Admin.id < after[0] if after is not None else None,
+        )
+        last_active_service.overlay(items)
+        return items, total, (items[-1].id,) if items else None
+
+    matches, rank = text_search(Admin.search_vector, search, matches)
+    seek = None
+    if after is not None:
+        after_rank, after_id = after
+        seek = or_(rank < after_rank, and_(rank == after_rank, Admin.id < after_id))
+    rows, total = fetch_page(
+        db,
+        db.query(Admin, rank).filter(matches),
+        order_by=(rank.desc(), Admin.id.desc()),
+        limit=limit,
+        offset=offset,
+        include_total=include_total,
+        seek=seek,
+    )
+    last = (rows[-1][1], rows[-1][0].id) if rows else None
+    items = [admin for admin, _ in rows]
+    last_active_service.overlay(items)
+    return items, total, last
 
 
 def get_admin(db: Session, admin_id: int) -> Admin | None:
-    return db.query(Admin).filter(Admin.id == admin_id).first()
+    admin = db.query(Admin).filter(Admin.id == admin_id).first()
+    if admin:
+        last_active_service.overlay([admin])
+    return admin
 
 
 def get_admin_by_email(db: Session, email: str) -> Admin | None:
-    return db.query(Admin).filter(Admin.email == email).first()
+    admin = db.query(Admin).filter(Admin.email == email).first()
+    if admin:
+        last_active_service.overlay([admin])
+    return admin
 
 
 def create_admin_user(
     db: Session,
     name: str | None,
     email: str,
-    password: str,
+    password_hash: str,
     role: Role,
     actor_id: int | None,
 ) -> Admin:
     admin = Admin(
         name=name,
         email=email,
-        password_hash=hash_password(password),
+        password_hash=password_hash,
         role=role,
         created_by_id=actor_id,
         updated_by_id=actor_id,
@@ -54,39 +98,32 @@ def create_admin_user(
 
 
 def update_admin_user(db: Session, admin: Admin, updates: dict[str, Any], actor_id: int) -> Admin:
-    if "password" in updates:
-        password = updates.pop("password")
-        if password:
-            updates["password_hash"] = hash_password(password)
+    """`updates` carries an already computed `password_hash`, never a plain password."""
+    previous_email = admin.email
     for key, value in updates.items():
         setattr(admin, key, value)
     admin.updated_by_id = actor_id
     db.commit()
+    principal_cache.invalidate(previous_email, admin.email)
     db.refresh(admin)
+    last_active_service.overlay([admin])
     return admin
 
 
 def delete_admin_user(db: Session, admin: Admin) -> None:
+    email = admin.email
     db.delete(admin)
     db.commit()
-
-
-def authenticate_admin(db: Session, email: str, password: str) -> Admin | None:
-    admin = get_admin_by_email(db, email)
-    if not admin:
-        return None
-    if not verify_password(password, admin.password_hash):
-        return None
-    return admin
+    principal_cache.invalidate(email)
 
 
 def has_any_admin(db: Session) -> bool:
     return db.query(Admin).first() is not None
 
 
-def update_last_active(db: Session, admin: Admin) -> Admin:
-    admin.last_active_at = datetime.now(UTC)
-    admin.updated_by_id = admin.id
-    db.commit()
-    db.refresh(admin)
-    return admin
+def record_login(db: Session, admin: Admin, new_password_hash: str | None) -> Admin:
+    """Stores a hash upgraded to the current cost, if any, and buffers the activity."""
+    if new_password_hash is not None:
+        admin.password_hash = new_password_hash
+        db.commit()
+    return last_active_service.touch(admin)
@@ -0,0 +1,456 @@
+import gzip
+import hashlib
+import json
+import os
+from bisect import bisect_left, bisect_right
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Date, Row, case, cast, delete, func, literal, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import data_version
+from app.core.config import settings
+from app.db.deps import DbSession, run_db, streaming_session
+from app.db.replicas import Replica
+from app.models import (
+    Attendance,
+    AttendanceArchive,
+    AttendanceMonthlyCount,
+    AttendanceStatus,
+    Employee,
+)
+from app.services import attendance_partition_service
+from app.services.attendance_partition_service import add_months, month_start
+
+FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+# Each file stores these as parallel lists, rows sorted by (employee_id, date).
+FILE_COLUMNS = (
+    "id",
+    "employee_id",
+    "day",
+    "status",
+    "created_at",
+    "updated_at",
+    "created_by_id",
+    "updated_by_id",
+)
+# Serializes archive runs; a second run waits instead of archiving the same month twice.
+_LOCK_KEY = "hrms.attendance_archive"
+# Decoded months kept per worker (a 2000-employee month is a few MB once decoded).
+_CACHED_MONTHS = 6
+
+
+@dataclass(frozen=True, slots=True)
+class ArchivedMonth:
+    month: date
+    columns: dict[str, list[Any]]
+
+    def rows_for(self, employee_id: int | None) -> range:
+        ids = self.columns["employee_id"]
+        if employee_id is None:
+            return range(len(ids))
+        return range(bisect_left(ids, employee_id), bisect_right(ids, employee_id))
+
+    def date_at(self, index: int) -> date:
+        return self.month.replace(day=self.columns["day"][index])
+
+
+@dataclass(frozen=True, slots=True)
+class ArchivedRange:
+    """Archived months overlapping a date range, and the decoded files a request reads."""
+
+    records: list[AttendanceArchive]
+    files: dict[date, ArchivedMonth]
+
+
+def archive_dir() -> Path:
+    return Path(settings.attendance_archive_dir)
+
+
+def archive_cutoff(keep_months: int, today: date | None = None) -> date:
+    """First day that stays live when `keep_months` months before the current one are kept."""
+
+    if keep_months < 1:
+        raise ValueError("keep_months must be at least 1.")
+    return add_months(month_start(today or date.today()), -keep_months)
+
+
+def _encode(month: date, rows: Sequence[Row]) -> bytes:
+    columns: dict[str, list[Any]] = {name: [] for name in FILE_COLUMNS}
+    for row in rows:
+        columns["id"].append(row.id)
+        columns["employee_id"].append(row.employee_id)
+        columns["day"].append(row.date.day)
+        columns["status"].append(row.status.value)
+        columns["created_at"].append(row.created_at.isoformat() if row.created_at else None)
+        columns["updated_at"].append(row.updated_at.isoformat() if row.updated_at else None)
+        columns["created_by_id"].append(row.created_by_id)
+        columns["updated_by_id"].append(row.updated_by_id)
+    payload = {
+        "format": FORMAT_VERSION,
+        "month": f"{month:%Y-%m}",
+        "rows": len(rows),
+        "columns": columns,
+    }
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+@lru_cache(maxsize=_CACHED_MONTHS)
+def _decode(path: str, sha256: str) -> ArchivedMonth:
+    # sha256 is only here as part of the cache key, so a re-archived month is read afresh.
+    payload = json.loads(gzip.decompress(Path(path).read_bytes()))
+    if payload.get("format") != FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported archive format {payload.get('format')!r}.")
+    return ArchivedMonth(date.fromisoformat(f"{payload['month']}-01"), payload["columns"])
+
+
+def load_month(record: AttendanceArchive) -> ArchivedMonth:
+    return _decode(str(archive_dir() / record.path), record.sha256)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f"{path.name}.partial")
+    with partial.open("wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(partial, path)
+
+
+def archived_months(
+    db: Session, date_from: date | None = None, date_to: date | None = None
+) -> list[AttendanceArchive]:
+    """Manifest entries for archived months overlapping the range, oldest first."""
+
+    stmt = select(AttendanceArchive).order_by(AttendanceArchive.month)
+    if date_from:
+        stmt = stmt.where(AttendanceArchive.month >= month_start(date_from))
+    if date_to:
+        stmt = stmt.where(AttendanceArchive.month <= date_to)
+    return list(db.scalars(stmt))
+
+
+def archived_month_among(db: Session, dates: Iterable[date]) -> date | None:
+    """
+    The earliest archived month any of `dates` falls in, or None.
+
+    Archiving always keeps the current month live, so dates from it onwards (the
+    usual case for writes) are answered without a query.
+    """
+
+    current = month_start(date.today())
+    months = {month_start(value) for value in dates if value < current}
+    if not months:
+        return None
+    return db.scalar(
+        select(func.min(AttendanceArchive.month)).where(AttendanceArchive.month.in_(months))
+    )
+
+
+def _covers(month: date, date_from: date | None, date_to: date | None) -> bool:
+    last_day = add_months(month, 1) - timedelta(days=1)
+    return (date_from is None or date_from <= month) and (date_to is None or date_to >= last_day)
+
+
+def _read_files(records: list[AttendanceArchive]) -> dict[date, ArchivedMonth]:
+    return {record.month: load_month(record) for record in records}
+
+
+async def load_archived_range(
+    db: DbSession, date_from: date | None, date_to: date | None, skip_covered: bool = False
+) -> ArchivedRange:
+    """
+    Archived months overlapping the range, with their files read in the threadpool so
+    gzip and JSON decoding never runs on the event loop. `skip_covered` leaves out the
+    files of months the range fully covers, for callers that count those from
+    `attendance_monthly_counts`.
+    """
+
+    records = await run_db(db, archived_months, date_from, date_to)
+    wanted = [
+        record
+        for record in records
+        if not (skip_covered and _covers(record.month, date_from, date_to))
+    ]
+    files = await run_in_threadpool(_read_files, wanted) if wanted else {}
+    return ArchivedRange(records, files)
+
+
+def _employee_days(
+    archived: ArchivedMonth, employee_id: int, date_from: date | None, date_to: date | None
+) -> Iterator[tuple[date, str]]:
+    statuses = archived.columns["status"]
+    for index in archived.rows_for(employee_id):
+        day = archived.date_at(index)
+        if (date_from is None or day >= date_from) and (date_to is None or day <= date_to):
+            yield day, statuses[index]
+
+
+def archived_summary(
+    db: Session,
+    employee_id: int,
+    date_from: date | None,
+    date_to: date | None,
+    archived: ArchivedRange,
+) -> tuple[int, int]:
+    """
+    Present and absent counts for one employee's archived attendance in the range.
+
+    Months the range fully covers come from `attendance_monthly_counts`; only the
+    partially covered ones at its ends are read from their files.
+    """
+
+    whole = [
+        record.month for record in archived.records if _covers(record.month, date_from, date_to)
+    ]
+    present = absent = 0
+    if whole:
+        sums = db.execute(
+            select(
+                func.sum(AttendanceMonthlyCount.present), func.sum(AttendanceMonthlyCount.absent)
+            ).where(
+                AttendanceMonthlyCount.employee_id == employee_id,
+                AttendanceMonthlyCount.month.in_(whole),
+            )
+        ).one()
+        present, absent = int(sums[0] or 0), int(sums[1] or 0)
+    for month, decoded in archived.files.items():
+        if month in whole:
+            continue
+        for _, status in _employee_days(decoded, employee_id, date_from, date_to):
+            if status == AttendanceStatus.PRESENT.value:
+                present += 1
+            else:
+                absent += 1
+    return present, absent
+
+
+def archived_daily_counts(
+    employee_id: int, date_from: date, date_to: date, archived: ArchivedRange
+) -> dict[date, dict[str, int]]:
+    """One employee's archived days in the range, shaped like `daily_counts`."""
+
+    by_date: dict[date, dict[str, int]] = {}
+    for decoded in archived.files.values():
+        for day, status in _employee_days(decoded, employee_id, date_from, date_to):
+            present = int(status == AttendanceStatus.PRESENT.value)
+            by_date[day] = {"present": present, "absent": 1 - present}
+    return by_date
+
+
+def _export_employees(
+    db: Session, employee_id: int | None, department: str | None
+) -> dict[int, tuple]:
+    stmt = select(
+        Employee.id,
+        Employee.employee_id,
+        Employee.full_name,
+        Employee.email,
+        Employee.department,
+    )
+    if employee_id is not None:
+        stmt = stmt.where(Employee.id == employee_id)
+    if department:
+        stmt = stmt.where(Employee.department == department)
+    return {row[0]: tuple(row[1:]) for row in db.execute(stmt)}
+
+
+def _export_rows(
+    path: str,
+    sha256: str,
+    employees: dict[int, tuple],
+    employee_id: int | None,
+    date_from: date | None,
+    date_to: date | None,
+) -> list[tuple]:
+    archived = _decode(path, sha256)
+    columns = archived.columns
+    picked = []
+    for index in archived.rows_for(employee_id):
+        day = archived.date_at(index)
+        if (date_from and day < date_from) or (date_to and day > date_to):
+            continue
+        if columns["employee_id"][index] in employees:
+            picked.append((day, columns["id"][index], index))
+    picked.sort()
+    return [
+        (
+            row_id,
+            columns["employee_id"][index],
+            *employees[columns["employee_id"][index]],
+            day,
+            columns["status"][index],
+            columns["created_at"][index],
+            columns["updated_at"][index],
+        )
+        for day, row_id, index in picked
+    ]
+
+
+async def archived_export_batches(
+    employee_id: int | None,
+    date_from: date | None,
+    date_to: date | None,
+    department: str | None,
+    batch_size: int,
+    replica: Replica | None = None,
+) -> AsyncIterator[list[tuple]]:
+    """
+    Archived rows in `attendance_export_statement`'s columns and (date, id) order.
+
+    Employee columns are joined from the live employees table, as the live export
+    does, so rows of deleted employees are left out. The manifest and employees are
+    read like `stream_rows` reads the live rows (same DB mode, same replica); each
+    month's file is decoded in the threadpool.
+    """
+
+    async with streaming_session(replica) as db:
+        records = await run_db(db, archived_months, date_from, date_to)
+        if not records:
+            return
+        employees = await run_db(db, _export_employees, employee_id, department)
+        files = [(str(archive_dir() / record.path), record.sha256) for record in records]
+
+    batch: list[tuple] = []
+    for path, sha256 in files:
+        rows = await run_in_threadpool(
+            _export_rows, path, sha256, employees, employee_id, date_from, date_to
+        )
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def archive_month(db: Session, month: date, directory: Path) -> AttendanceArchive | None:
+    """
+    Moves one month of attendance into `directory` and records it in the manifest.
+
+    The file is written (and fsynced) before the transaction that deletes the live
+    rows commits, so a failure leaves the rows live and at worst an unreferenced file.
+    Attendance writes wait while the month is copied. The daily rollup is left as is,
+    so org-wide stats keep counting the month. Bumps `data_version` once committed, so
+    this process's cached responses are rebuilt. Returns None if the month has no rows.
+    """
+
+    db.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": _LOCK_KEY})
+    if db.get(AttendanceArchive, month) is not None:
+        raise ValueError(f"{month:%Y-%m} is already archived but has live rows again.")
+    db.execute(text("LOCK TABLE attendance IN SHARE MODE"))
+    in_month = (Attendance.date >= month, Attendance.date < add_months(month, 1))
+    rows = db.execute(
+        select(
+            Attendance.id,
+            Attendance.employee_id,
+            Attendance.date,
+            Attendance.status,
+            Attendance.created_at,
+            Attendance.updated_at,
+            Attendance.created_by_id,
+            Attendance.updated_by_id,
+        )
+        .where(*in_month)
+        .order_by(Attendance.employee_id, Attendance.date)
+    ).all()
+    if not rows:
+        db.rollback()
+        return None
+
+    data = _encode(month, rows)
+    name = f"attendance-{month:%Y-%m}.json.gz"
+    _write_atomic(directory / name, data)
+
+    present = func.sum(case((Attendance.status == AttendanceStatus.PRESENT, 1), else_=0))
+    absent = func.sum(case((Attendance.status == AttendanceStatus.ABSENT, 1), else_=0))
+    db.execute(
+        insert(AttendanceMonthlyCount).from_select(
+            ["employee_id", "month", "present", "absent"],
+            select(Attendance.employee_id, literal(month), present, absent)
+            .where(*in_month)
+            .group_by(Attendance.employee_id),
+        )
+    )
+    record = AttendanceArchive(
+        month=month,
+        path=name,
+        row_count=len(rows),
+        size_bytes=len(data),
+        sha256=hashlib.sha256(data).hexdigest(),
+    )
+    db.add(record)
+    if not attendance_partition_service.drop_month(db, month):
+        db.execute(delete(Attendance).where(*in_month))
+    db.commit()
+    data_version.bump()
+    return record
+
+
+def write_manifest(db: Session, directory: Path) -> Path:
+    """Writes `manifest.json` next to the files, mirroring the attendance_archives table."""
+
+    months = [
+        {
+            "month": f"{record.month:%Y-%m}",
+            "file": record.path,
+            "rows": record.row_count,
+            "bytes": record.size_bytes,
+            "sha256": record.sha256,
+            "archived_at": record.archived_at.isoformat(),
+        }
+        for record in archived_months(db)
+    ]
+    payload = {"format": FORMAT_VERSION, "table": "attendance", "months": months}
+    path = directory / MANIFEST_NAME
+    _write_atomic(path, json.dumps(payload, indent=2).encode())
+    return path
+
+
+def months_to_archive(db: Session, cutoff: date) -> list[date]:
+    month = cast(func.date_trunc("month", Attendance.date), Date)
+    return list(
+        db.scalars(select(month).where(Attendance.date < cutoff).distinct().order_by(month))
+    )
+
+
+def archive_before(db: Session, cutoff: date, directory: Path) -> list[AttendanceArchive]:
+    """Archives every month with live attendance before `cutoff`, oldest first."""
+
+    archived = []
+    for month in months_to_archive(db, cutoff):
+        record = archive_month(db, month, directory)
+        if record is not None:
+            archived.append(record)
+    write_manifest(db, directory)
+    return archived
+
+
+def verify(db: Session, directory: Path) -> list[str]:
+    """Checks every manifest entry against its file; returns the problems found."""
+
+    problems = []
+    for record in archived_months(db):
+        path = directory / record.path
+        if not path.exists():
+            problems.append(f"{record.month:%Y-%m}: {path} is missing")
+            continue
+        data = path.read_bytes()
+        if hashlib.sha256(data).hexdigest() != record.sha256:
+            problems.append(f"{record.month:%Y-%m}: checksum mismatch")
+            continue
+        rows = json.loads(gzip.decompress(data))["rows"]
+        if rows != record.row_count:
+            problems.append(f"{record.month:%Y-%m}: {rows} rows, manifest says {record.row_count}")
+    return problems
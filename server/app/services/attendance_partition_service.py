@@ -0,0 +1,253 @@
+import asyncio
+import re
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.logger import logger
+from app.db.session import SessionLocal
+
+PARENT = "attendance"
+DEFAULT_PARTITION = "attendance_default"
+_MONTH_PARTITION = re.compile(r"^attendance_p(\d{4})_(\d{2})$")
+# Serializes partition DDL between workers that run maintenance at the same time.
+_LOCK_KEY = "hrms.attendance_partitions"
+
+
+def month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"attendance_p{month.year:04d}_{month.month:02d}"
+
+
+def is_partitioned(db: Session) -> bool:
+    return bool(
+        db.scalar(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table p "
+                "WHERE p.partrelid = to_regclass(:parent))"
+            ),
+            {"parent": PARENT},
+        )
+    )
+
+
+def month_partitions(db: Session) -> list[date]:
+    """Months that currently have an attached partition, oldest first."""
+
+    names = db.scalars(
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:parent)"
+        ),
+        {"parent": PARENT},
+    )
+    months = []
+    for name in names:
+        match = _MONTH_PARTITION.match(name)
+        if match:
+            months.append(date(int(match[1]), int(match[2]), 1))
+    return sorted(months)
+
+
+def _lock(db: Session) -> None:
+    db.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": _LOCK_KEY})
+
+
+def _create_month(db: Session, month: date) -> None:
+    """
+    Adds the partition for `month`. Rows that landed in the default partition for
+    that month are moved into it first, since Postgres refuses to attach a range
+    the default partition still holds rows for.
+    """
+
+    name, lower, upper = partition_name(month), month, add_months(month, 1)
+    bound = f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+    in_range = {"lo": lower, "hi": upper}
+    stray = db.scalar(
+        text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE date >= :lo AND date < :hi)"),
+        in_range,
+    )
+    if not stray:
+        db.execute(text(f"CREATE TABLE {name} PARTITION OF {PARENT} {bound}"))
+        return
+    db.execute(text(f"CREATE TABLE {name} (LIKE {PARENT} INCLUDING DEFAULTS)"))
+    db.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE date >= :lo AND date < :hi "
+            f"RETURNING *) INSERT INTO {name} SELECT * FROM moved"
+        ),
+        in_range,
+    )
+    db.execute(text(f"ALTER TABLE {PARENT} ATTACH PARTITION {name} {bound}"))
+
+
+def ensure_partitions(db: Session, months_ahead: int, today: date | None = None) -> list[str]:
+    """
+    Creates monthly partitions through `months_ahead` months past the current one,
+    plus one for every month found in the default partition. Returns the names
+    created; commits when anything changed.
+    """
+
+    _lock(db)
+    existing = set(month_partitions(db))
+    current = month_start(today or date.today())
+    wanted = {add_months(current, offset) for offset in range(months_ahead + 1)}
+    wanted.update(
+        db.scalars(
+            text(f"SELECT DISTINCT date_trunc('month', date)::date FROM {DEFAULT_PARTITION}")
+        )
+    )
+    created = []
+    for month in sorted(wanted - existing):
+        _create_month(db, month)
+        created.append(partition_name(month))
+    db.commit()
+    return created
+
+
+def partition_attendance(db: Session, months_ahead: int) -> int:
+    """
+    Converts a plain `attendance` table into one range-partitioned by month.
+
+    Runs in one transaction under an ACCESS EXCLUSIVE lock, so reads and writes of
+    attendance wait for it; expect roughly the time of copying the table once.
+    The primary key becomes `(id, date)` (a partitioned table's unique keys must
+    include the partition key); `uq_employee_date`, the foreign keys, the other
+    indexes and the id sequence are carried over. Returns the rows copied.
+    """
+
+    _lock(db)
+    if is_partitioned(db):
+        raise ValueError("attendance is already partitioned.")
+    legacy = f"{PARENT}_unpartitioned"
+    db.execute(text(f"LOCK TABLE {PARENT} IN ACCESS EXCLUSIVE MODE"))
+    sequence = db.scalar(text("SELECT pg_get_serial_sequence(:parent, 'id')"), {"parent": PARENT})
+    foreign_keys = db.execute(
+        text(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = to_regclass(:parent) AND contype = 'f'"
+        ),
+        {"parent": PARENT},
+    ).all()
+    # Plain indexes only; the primary key and uq_employee_date are re-declared below.
+    index_rows = db.execute(
+        text(
+            "SELECT c.relname, pg_get_indexdef(i.indexrelid) FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid WHERE i.indrelid = to_regclass(:parent)"
+        ),
+        {"parent": PARENT},
+    ).all()
+    constraint_indexes = set(
+        db.scalars(
+            text(
+                "SELECT conindid::regclass::text FROM pg_constraint "
+                "WHERE conrelid = to_regclass(:parent) AND conindid <> 0"
+            ),
+            {"parent": PARENT},
+        )
+    )
+
+    db.execute(text(f"ALTER TABLE {PARENT} RENAME TO {legacy}"))
+    for name, _ in index_rows:
+        db.execute(text(f"ALTER INDEX {name} RENAME TO {name}_unpartitioned"))
+
+    db.execute(
+        text(f"CREATE TABLE {PARENT} (LIKE {legacy} INCLUDING DEFAULTS) PARTITION BY RANGE (date)")
+    )
+    db.execute(text(f"ALTER TABLE {PARENT} ADD CONSTRAINT attendance_pkey PRIMARY KEY (id, date)"))
+    db.execute(
+        text(f"ALTER TABLE {PARENT} ADD CONSTRAINT uq_employee_date UNIQUE (employee_id, date)")
+    )
+    for name, definition in foreign_keys:
+        db.execute(text(f"ALTER TABLE {PARENT} ADD CONSTRAINT {name} {definition}"))
+    for name, definition in index_rows:
+        if name not in constraint_indexes:
+            db.execute(text(definition))
+    db.execute(text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {PARENT} DEFAULT"))
+
+    bounds = db.execute(text(f"SELECT min(date), max(date) FROM {legacy}")).one()
+    current = month_start(date.today())
+    first = month_start(bounds[0]) if bounds[0] else current
+    last = max(month_start(bounds[1]) if bounds[1] else current, add_months(current, months_ahead))
+    month = first
+    while month <= last:
+        _create_month(db, month)
+        month = add_months(month, 1)
+
+    copied = db.execute(text(f"INSERT INTO {PARENT} SELECT * FROM {legacy}")).rowcount
+    if sequence:
+        db.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {PARENT}.id"))
+    db.execute(text(f"DROP TABLE {legacy}"))
+    db.commit()
+    db.execute(text(f"ANALYZE {PARENT}"))
+    db.commit()
+    return copied
+
+
+def detach_month(db: Session, month: date, drop: bool = False) -> str:
+    """
+    Detaches one month's partition (and drops it if asked).
+
+    The detached table keeps its rows and can be archived or re-attached. The daily
+    rollup is untouched, so org-wide stats still count the month.
+    """
+
+    name = partition_name(month_start(month))
+    _lock(db)
+    if month_start(month) not in month_partitions(db):
+        raise ValueError(f"{name} is not an attached partition.")
+    db.execute(text(f"ALTER TABLE {PARENT} DETACH PARTITION {name}"))
+    if drop:
+        db.execute(text(f"DROP TABLE {name}"))
+    db.commit()
+    return name
+
+
+def drop_month(db: Session, month: date) -> bool:
+    """
+    Detaches and drops `month`'s partition inside the caller's transaction. Returns
+    False, changing nothing, when attendance has no partition for that month.
+    """
+
+    if not is_partitioned(db):
+        return False
+    _lock(db)
+    if month_start(month) not in month_partitions(db):
+        return False
+    name = partition_name(month_start(month))
+    db.execute(text(f"ALTER TABLE {PARENT} DETACH PARTITION {name}"))
+    db.execute(text(f"DROP TABLE {name}"))
+    return True
+
+
+def maintain(months_ahead: int) -> list[str]:
+    """`ensure_partitions` on its own session; a no-op while attendance is a plain table."""
+
+    db = SessionLocal()
+    try:
+        if not is_partitioned(db):
+            return []
+        created = ensure_partitions(db, months_ahead)
+        if created:
+            logger.info("attendance partitions created: %s", ", ".join(created))
+        return created
+    finally:
+        db.close()
+
+
+async def run_periodic_maintenance(interval_seconds: float, months_ahead: int) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await asyncio.to_thread(maintain, months_ahead)
+        except Exception:
+            logger.exception("attendance partition maintenance failed; will retry")
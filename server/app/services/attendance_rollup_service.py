@@ -0,0 +1,134 @@
+from collections import defaultdict
+from datetime import date
+
+from sqlalchemy import Date, case, cast, delete, func, literal, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.cache import data_version
+from app.models import (
+    Attendance,
+    AttendanceArchive,
+    AttendanceDailyCount,
+    AttendanceStatus,
+    Employee,
+)
+
+# (date, department) -> [present, absent] changes made by the current transaction.
+RollupDeltas = defaultdict[tuple[date, str], list[int]]
+
+
+def new_deltas() -> RollupDeltas:
+    return defaultdict(lambda: [0, 0])
+
+
+def count_delta(
+    deltas: RollupDeltas,
+    date_value: date,
+    department: str,
+    status: AttendanceStatus,
+    sign: int = 1,
+) -> None:
+    slot = 0 if status == AttendanceStatus.PRESENT else 1
+    deltas[(date_value, department)][slot] += sign
+
+
+def apply_deltas(db: Session, deltas: RollupDeltas) -> None:
+    """Adds the accumulated deltas to the rollup; call before the transaction commits."""
+
+    rows = [
+        {"date": key[0], "department": key[1], "present": present, "absent": absent}
+        for key, (present, absent) in sorted(deltas.items())
+        if present or absent
+    ]
+    if rows:
+        db.execute(_increment(insert(AttendanceDailyCount).values(rows)))
+
+
+def _increment(stmt):
+    table = AttendanceDailyCount.__table__
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.date, table.c.department],
+        set_={
+            "present": table.c.present + stmt.excluded.present,
+            "absent": table.c.absent + stmt.excluded.absent,
+        },
+    )
+
+
+def _status_sums():
+    return (
+        func.sum(case((Attendance.status == AttendanceStatus.PRESENT, 1), else_=0)),
+        func.sum(case((Attendance.status == AttendanceStatus.ABSENT, 1), else_=0)),
+    )
+
+
+def shift_employee_counts(db: Session, employee_id: int, department: str, sign: int) -> None:
+    """
+    Adds (sign=1) or removes (sign=-1) an employee's live attendance under `department`.
+
+    Archived months have no live rows, so their counts stay under the department the
+    employee had when the month was archived.
+    """
+
+    present, absent = _status_sums()
+    source = (
+        select(Attendance.date, literal(department), sign * present, sign * absent)
+        .where(Attendance.employee_id == employee_id)
+        .group_by(Attendance.date)
+    )
+    stmt = insert(AttendanceDailyCount).from_select(
+        ["date", "department", "present", "absent"], source
+    )
+    db.execute(_increment(stmt))
+
+
+def daily_counts(db: Session, date_from: date, date_to: date) -> dict[date, dict[str, int]]:
+    rows = (
+        db.query(
+            AttendanceDailyCount.date,
+            func.sum(AttendanceDailyCount.present),
+            func.sum(AttendanceDailyCount.absent),
+        )
+        .filter(AttendanceDailyCount.date >= date_from, AttendanceDailyCount.date <= date_to)
+        .group_by(AttendanceDailyCount.date)
+        .all()
+    )
+    return {row[0]: {"present": int(row[1] or 0), "absent": int(row[2] or 0)} for row in rows}
+
+
+def rebuild_daily_counts(
+    db: Session, date_from: date | None = None, date_to: date | None = None
+) -> int:
+    """
+    Recomputes the rollup from raw attendance for the given range (everything if open).
+
+    Attendance writers are blocked for the duration so the rebuilt counts cannot miss a
+    concurrent change. Archived months have no raw rows left, so their counts are kept
+    as they are. Returns the number of rollup rows written.
+    """
+
+    db.execute(text("LOCK TABLE attendance IN SHARE MODE"))
+    month = cast(func.date_trunc("month", AttendanceDailyCount.date), Date)
+    purge = delete(AttendanceDailyCount).where(month.not_in(select(AttendanceArchive.month)))
+    present, absent = _status_sums()
+    source = (
+        select(Attendance.date, Employee.department, present, absent)
+        .join(Employee, Attendance.employee_id == Employee.id)
+        .group_by(Attendance.date, Employee.department)
+    )
+    if date_from:
+        purge = purge.where(AttendanceDailyCount.date >= date_from)
+        source = source.where(Attendance.date >= date_from)
+    if date_to:
+        purge = purge.where(AttendanceDailyCount.date <= date_to)
+        source = source.where(Attendance.date <= date_to)
+    db.execute(purge)
+    written = db.execute(
+        insert(AttendanceDailyCount)
+        .from_select(["date", "department", "present", "absent"], source)
+        .returning(AttendanceDailyCount.date)
+    ).all()
+    db.commit()
+    data_version.bump()
+    return len(written)
@@ -1,10 +1,54 @@
+from collections.abc import Sequence
 from datetime import date, timedelta
 
-from sqlalchemy import case, func
+from sqlalchemy import Select, case, func, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import Insert, insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import ReturningInsert
 
+from app.core.cache import data_version
+from app.db.pagination import PageTotal, TotalMode, fetch_page
+from app.db.projection import as_dicts, row_key, select_columns
 from app.models import Attendance, AttendanceStatus, Employee
+from app.services.attendance_archive_service import (
+    ArchivedRange,
+    archived_daily_counts,
+    archived_summary,
+)
+from app.services.attendance_rollup_service import (
+    apply_deltas,
+    count_delta,
+    daily_counts,
+    new_deltas,
+)
+
+# Response field -> column for the attendance lists, in AttendanceRead order.
+ATTENDANCE_COLUMNS = {
+    "id": Attendance.id,
+    "employee_id": Attendance.employee_id,
+    "date": Attendance.date,
+    "status": Attendance.status,
+    "created_at": Attendance.created_at,
+    "updated_at": Attendance.updated_at,
+    "created_by_id": Attendance.created_by_id,
+    "updated_by_id": Attendance.updated_by_id,
+}
+# In AttendanceListItem order.
+ATTENDANCE_LIST_COLUMNS = {
+    "id": Attendance.id,
+    "employee_id": Attendance.employee_id,
+    "employee_code": Employee.employee_id,
+    "employee_name": Employee.full_name,
+    "employee_email": Employee.email,
+    "department": Employee.department,
+    "date": Attendance.date,
+    "status": Attendance.status,
+    "created_at": Attendance.created_at,
+    "updated_at": Attendance.updated_at,
+    "created_by_id": Attendance.created_by_id,
+    "updated_by_id": Attendance.updated_by_id,
+}
 
 
 def list_attendance(
@@ -14,15 +58,34 @@ def list_attendance(
     date_to: date | None,
     limit: int,
     offset: int,
-) -> tuple[list[Attendance], int]:
-    query = db.query(Attendance).filter(Attendance.employee_id == employee.id)
+    after: date | None = None,
+    include_total: TotalMode = TotalMode.EXACT,
+    fields: Sequence[str] | None = None,
+) -> tuple[list[dict], PageTotal, date | None]:
+    """
+    Returns a page of one employee's attendance as plain dicts, its total and the
+    date of its last row (the keyset cursor). Only `fields` are selected and returned.
+    """
+
+    names, columns = select_columns(ATTENDANCE_COLUMNS, fields, keys=("date",))
+    query = db.query(*columns).filter(Attendance.employee_id == employee.id)
     if date_from:
         query = query.filter(Attendance.date >= date_from)
     if date_to:
         query = query.filter(Attendance.date <= date_to)
-    total = query.count()
-    items = query.order_by(Attendance.date.desc()).offset(offset).limit(limit).all()
-    return items, total
+    # (employee_id, date) is unique, so the date alone is a stable seek key.
+    seek = Attendance.date < after if after is not None else None
+    rows, total = fetch_page(
+        db,
+        query,
+        order_by=(Attendance.date.desc(),),
+        limit=limit,
+        offset=offset,
+        include_total=include_total,
+        seek=seek,
+    )
+    last = row_key(rows[-1], names, ("date",))[0] if rows else None
+    return as_dicts(rows, fields or tuple(ATTENDANCE_COLUMNS)), total, last
 
 
 def list_attendance_all(
@@ -32,22 +95,76 @@ def list_attendance_all(
     date_to: date | None,
     limit: int,
     offset: int,
-) -> tuple[list[tuple[Attendance, Employee]], int]:
-    query = db.query(Attendance, Employee).join(Employee, Attendance.employee_id == Employee.id)
+    after: tuple[date, int] | None = None,
+    include_total: TotalMode = TotalMode.EXACT,
+    fields: Sequence[str] | None = None,
+) -> tuple[list[dict], PageTotal, tuple[date, int] | None]:
+    """
+    Returns a page of attendance joined to employees as plain dicts, its total and
+    the `(date, id)` key of its last row.
+
+    Rows come back as column tuples rather than ORM entities. The employee join is
+    only added when an employee column is among `fields`.
+    """
+
+    keys = ("date", "id")
+    names, columns = select_columns(ATTENDANCE_LIST_COLUMNS, fields, keys=keys)
+    query = db.query(*columns)
+    if any(name not in ATTENDANCE_COLUMNS for name in names):
+        # employee_id is a non-null foreign key, so the inner join never drops a row.
+        query = query.join(Employee, Attendance.employee_id == Employee.id)
     if employee_id is not None:
         query = query.filter(Attendance.employee_id == employee_id)
     if date_from:
         query = query.filter(Attendance.date >= date_from)
     if date_to:
         query = query.filter(Attendance.date <= date_to)
-    total = query.count()
-    items = (
-        query.order_by(Attendance.date.desc(), Attendance.id.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    seek = tuple_(Attendance.date, Attendance.id) < tuple_(*after) if after is not None else None
+    rows, total = fetch_page(
+        db,
+        query,
+        order_by=(Attendance.date.desc(), Attendance.id.desc()),
+        limit=limit,
+        offset=offset,
+        include_total=include_total,
+        seek=seek,
     )
-    return items, total
+    last = row_key(rows[-1], names, keys) if rows else None
+    return as_dicts(rows, fields or tuple(ATTENDANCE_LIST_COLUMNS)), total, last
+
+
+EXPORT_BATCH_SIZE = 2000
+
+
+def attendance_export_statement(
+    employee_id: int | None,
+    date_from: date | None,
+    date_to: date | None,
+    department: str | None,
+) -> Select:
+    """Same join as list_attendance_all, projected to plain columns for streaming."""
+
+    stmt = select(
+        Attendance.id,
+        Employee.id.label("employee_id"),
+        Employee.employee_id.label("employee_code"),
+        Employee.full_name.label("employee_name"),
+        Employee.email.label("employee_email"),
+        Employee.department,
+        Attendance.date,
+        Attendance.status,
+        Attendance.created_at,
+        Attendance.updated_at,
+    ).join(Employee, Attendance.employee_id == Employee.id)
+    if employee_id is not None:
+        stmt = stmt.where(Attendance.employee_id == employee_id)
+    if date_from:
+        stmt = stmt.where(Attendance.date >= date_from)
+    if date_to:
+        stmt = stmt.where(Attendance.date <= date_to)
+    if department:
+        stmt = stmt.where(Employee.department == department)
+    return stmt.order_by(Attendance.date.asc(), Attendance.id.asc())
 
 
 def attendance_stats(
@@ -55,19 +172,34 @@ def attendance_stats(
     date_from: date,
     date_to: date,
     employee_id: int | None,
+    archived: ArchivedRange | None = None,
 ) -> tuple[list[dict], int]:
-    total_employees = (
-        1 if employee_id is not None else int(db.query(func.count(Employee.id)).scalar() or 0)
-    )
-    query = db.query(
-        Attendance.date,
-        func.sum(case((Attendance.status == AttendanceStatus.PRESENT, 1), else_=0)),
-        func.sum(case((Attendance.status == AttendanceStatus.ABSENT, 1), else_=0)),
-    ).filter(Attendance.date >= date_from, Attendance.date <= date_to)
     if employee_id is not None:
-        query = query.filter(Attendance.employee_id == employee_id)
-    rows = query.group_by(Attendance.date).all()
-    by_date = {row[0]: {"present": int(row[1] or 0), "absent": int(row[2] or 0)} for row in rows}
+        total_employees = 1
+        rows = (
+            db.query(
+                Attendance.date,
+                func.sum(case((Attendance.status == AttendanceStatus.PRESENT, 1), else_=0)),
+                func.sum(case((Attendance.status == AttendanceStatus.ABSENT, 1), else_=0)),
+            )
+            .filter(
+                Attendance.employee_id == employee_id,
+                Attendance.date >= date_from,
+                Attendance.date <= date_to,
+            )
+            .group_by(Attendance.date)
+            .all()
+        )
+        by_date = {
+            row[0]: {"present": int(row[1] or 0), "absent": int(row[2] or 0)} for row in rows
+        }
+        # Archived months have no live rows, so the two never overlap.
+        if archived:
+            by_date.update(archived_daily_counts(employee_id, date_from, date_to, archived))
+    else:
+        # Org-wide points come from the daily rollup instead of re-aggregating raw rows.
+        total_employees = int(db.query(func.count(Employee.id)).scalar() or 0)
+        by_date = daily_counts(db, date_from, date_to)
 
     points: list[dict] = []
     cursor = date_from
@@ -88,20 +220,31 @@ def attendance_stats(
     return points, total_employees
 
 
-def get_attendance_by_id(db: Session, employee: Employee, attendance_id: int) -> Attendance | None:
-    return (
-        db.query(Attendance)
-        .filter(Attendance.employee_id == employee.id, Attendance.id == attendance_id)
-        .first()
+def get_attendance_by_id(
+    db: Session, employee: Employee, attendance_id: int, for_update: bool = False
+) -> Attendance | None:
+    """
+    `for_update` locks the row and reloads it, so a write's rollup delta starts from its
+    current status.
+    """
+
+    query = db.query(Attendance).filter(
+        Attendance.employee_id == employee.id, Attendance.id == attendance_id
     )
+    if for_update:
+        query = query.with_for_update().populate_existing()
+    return query.first()
 
 
-def get_attendance_by_date(db: Session, employee: Employee, date_value: date) -> Attendance | None:
-    return (
-        db.query(Attendance)
-        .filter(Attendance.employee_id == employee.id, Attendance.date == date_value)
-        .first()
+def get_attendance_by_date(
+    db: Session, employee: Employee, date_value: date, for_update: bool = False
+) -> Attendance | None:
+    query = db.query(Attendance).filter(
+        Attendance.employee_id == employee.id, Attendance.date == date_value
     )
+    if for_update:
+        query = query.with_for_update().populate_existing()
+    return query.first()
 
 
 def create_attendance(
@@ -119,11 +262,15 @@ def create_attendance(
         updated_by_id=actor_id,
     )
     db.add(attendance)
+    deltas = new_deltas()
+    count_delta(deltas, date_value, employee.department, status)
+    apply_deltas(db, deltas)
     try:
         db.commit()
     except IntegrityError as exc:
         db.rollback()
         raise exc
+    data_version.bump()
     db.refresh(attendance)
     return attendance
 
@@ -134,14 +281,22 @@ def update_attendance(
     updates: dict,
     actor_id: int | None,
 ) -> Attendance:
+    previous_date, previous_status = attendance.date, attendance.status
     for key, value in updates.items():
         setattr(attendance, key, value)
     attendance.updated_by_id = actor_id
+    if (attendance.date, attendance.status) != (previous_date, previous_status):
+        department = attendance.employee.department
+        deltas = new_deltas()
+        count_delta(deltas, previous_date, department, previous_status, sign=-1)
+        count_delta(deltas, attendance.date, department, attendance.status)
+        apply_deltas(db, deltas)
     try:
         db.commit()
     except IntegrityError as exc:
         db.rollback()
         raise exc
+    data_version.bump()
     db.refresh(attendance)
     return attendance
 
@@ -153,15 +308,166 @@ def upsert_attendance_for_date(
     status: AttendanceStatus,
     actor_id: int | None,
 ) -> Attendance:
-    existing = get_attendance_by_date(db, employee, date_value)
+    existing = get_attendance_by_date(db, employee, date_value, for_update=True)
     if existing:
         return update_attendance(db, existing, {"status": status}, actor_id=actor_id)
     return create_attendance(db, employee, date_value, status, actor_id=actor_id)
 
 
+BULK_UPSERT_CHUNK_SIZE = 1000
+
+
+def _upsert_returning(stmt: Insert) -> ReturningInsert:
+    return stmt.on_conflict_do_update(
+        constraint="uq_employee_date",
+        set_={
+            "status": stmt.excluded.status,
+            "updated_by_id": stmt.excluded.updated_by_id,
+            "updated_at": func.now(),
+        },
+    ).returning(Attendance.id, Attendance.employee_id, Attendance.date)
+
+
+def _lock_existing_statuses(
+    db: Session, keys: list[tuple[int, date]]
+) -> dict[tuple[int, date], AttendanceStatus]:
+    """Current status of the rows about to be upserted, locked so the rollup delta stays exact."""
+
+    rows = db.execute(
+        select(Attendance.employee_id, Attendance.date, Attendance.status)
+        .where(tuple_(Attendance.employee_id, Attendance.date).in_(keys))
+        .with_for_update()
+    )
+    return {(row.employee_id, row.date): row.status for row in rows}
+
+
+def bulk_upsert_attendance(
+    db: Session,
+    items: list[tuple[int, date, AttendanceStatus]],
+    actor_id: int | None,
+) -> list[dict]:
+    """
+    Creates or updates attendance for many (employee, date) pairs in one transaction.
+
+    Each chunk is a single INSERT ... ON CONFLICT DO UPDATE. Unknown employees and
+    repeated (employee, date) pairs are reported per item instead of failing the batch;
+    for repeats the last occurrence wins.
+    """
+
+    employee_ids = {employee_id for employee_id, _, _ in items}
+    departments = dict(
+        db.execute(
+            select(Employee.id, Employee.department).where(Employee.id.in_(employee_ids))
+        ).all()
+    )
+    known_ids = departments.keys()
+
+    last_index: dict[tuple[int, date], int] = {}
+    for index, (employee_id, date_value, _) in enumerate(items):
+        if employee_id in known_ids:
+            last_index[(employee_id, date_value)] = index
+    rows = [
+        {
+            "employee_id": items[index][0],
+            "date": items[index][1],
+            "status": items[index][2],
+            "created_by_id": actor_id,
+            "updated_by_id": actor_id,
+        }
+        for index in sorted(last_index.values())
+    ]
+
+    written: dict[tuple[int, date], tuple[int, bool]] = {}
+    deltas = new_deltas()
+    for start in range(0, len(rows), BULK_UPSERT_CHUNK_SIZE):
+        chunk = rows[start : start + BULK_UPSERT_CHUNK_SIZE]
+        previous = _lock_existing_statuses(db, [(row["employee_id"], row["date"]) for row in chunk])
+        for row in chunk:
+            department = departments[row["employee_id"]]
+            old_status = previous.get((row["employee_id"], row["date"]))
+            if old_status is not None:
+                count_delta(deltas, row["date"], department, old_status, sign=-1)
+            count_delta(deltas, row["date"], department, row["status"])
+        # Keys missing from the locked snapshot are inserts; `xmax = 0` would say the
+        # same but cannot be returned from a partitioned table.
+        for row in db.execute(_upsert_returning(insert(Attendance).values(chunk))):
+            key = (row.employee_id, row.date)
+            written[key] = (row.id, key not in previous)
+    apply_deltas(db, deltas)
+    db.commit()
+    data_version.bump()
+
+    results: list[dict] = []
+    for index, (employee_id, date_value, _) in enumerate(items):
+        key = (employee_id, date_value)
+        result = {"employee_id": employee_id, "date": date_value, "attendance_id": None}
+        if employee_id not in known_ids:
+            result["result"] = "not_found"
+        elif last_index[key] != index:
+            result["result"] = "duplicate"
+        else:
+            attendance_id, inserted = written[key]
+            result["attendance_id"] = attendance_id
+            result["result"] = "created" if inserted else "updated"
+        results.append(result)
+    return results
+
+
+def bulk_upsert_department(
+    db: Session,
+    department: str,
+    date_value: date,
+    status: AttendanceStatus,
+    actor_id: int | None,
+) -> list[dict]:
+    """Marks every employee of `department` for `date_value` with one INSERT ... SELECT."""
+
+    status_type = Attendance.__table__.c.status.type
+    source = select(
+        Employee.id,
+        literal(date_value),
+        literal(status, status_type),
+        literal(actor_id),
+        literal(actor_id),
+    ).where(Employee.department == department)
+    stmt = insert(Attendance).from_select(
+        ["employee_id", "date", "status", "created_by_id", "updated_by_id"], source
+    )
+    previous = dict(
+        db.execute(
+            select(Attendance.employee_id, Attendance.status)
+            .join(Employee, Attendance.employee_id == Employee.id)
+            .where(Employee.department == department, Attendance.date == date_value)
+            .with_for_update(of=Attendance)
+        ).all()
+    )
+    rows = db.execute(_upsert_returning(stmt)).all()
+    deltas = new_deltas()
+    for old_status in previous.values():
+        count_delta(deltas, date_value, department, old_status, sign=-1)
+    for _ in rows:
+        count_delta(deltas, date_value, department, status)
+    apply_deltas(db, deltas)
+    db.commit()
+    data_version.bump()
+    return [
+        {
+            "employee_id": row.employee_id,
+            "date": row.date,
+            "attendance_id": row.id,
+            "result": "updated" if row.employee_id in previous else "created",
+        }
+        for row in sorted(rows, key=lambda row: row.employee_id)
+    ]
+
+
 def delete_attendance(db: Session, attendance: Attendance) -> None:
+    deltas = new_deltas()
+    count_delta(deltas, attendance.date, attendance.employee.department, attendance.status, sign=-1)
+    apply_deltas(db, deltas)
     db.delete(attendance)
     db.commit()
+    data_version.bump()
 
 
 def attendance_summary(
@@ -169,6 +475,7 @@ def attendance_summary(
     employee: Employee,
     date_from: date | None,
     date_to: date | None,
+    archived: ArchivedRange,
 ) -> dict:
     query = db.query(
         func.count(Attendance.id),
@@ -180,8 +487,11 @@ def attendance_summary(
     if date_to:
         query = query.filter(Attendance.date <= date_to)
     total, present, absent = query.one()
+    archived_present, archived_absent = archived_summary(
+        db, employee.id, date_from, date_to, archived
+    )
     return {
-        "total": int(total or 0),
-        "present": int(present or 0),
-        "absent": int(absent or 0),
+        "total": int(total or 0) + archived_present + archived_absent,
+        "present": int(present or 0) + archived_present,
+        "absent": int(absent or 0) + archived_absent,
     }
@@ -0,0 +1,211 @@
+import csv
+from collections.abc import Iterator
+from typing import IO
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    Text,
+    and_,
+    case,
+    func,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.cache import data_version
+from app.db.copy import copy_rows
+from app.models import Employee
+from app.services.employee_service import employee_code_expr, next_employee_id
+from app.services.employee_suggest_service import suggest_index
+
+IMPORT_COLUMNS = ("full_name", "email", "department")
+
+# Close to what EmailStr accepts; the import checks it in SQL rather than per row in Python.
+EMAIL_PATTERN = (
+    r"^[A-Za-z0-9.!#$%&'*+/=?^_`{|}~-]+"
+    r"@[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?"
+    r"(?:\.[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?)+$"
+)
+
+staging = Table(
+    "employee_import_staging",
+    MetaData(),
+    Column("row_no", Integer, primary_key=True),
+    Column("full_name", Text),
+    Column("email", Text),
+    Column("department", Text),
+    Column("error", Text),
+    Column("employee_pk", Integer),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+
+class ImportFileError(ValueError):
+    """The upload cannot be read as an employee CSV at all."""
+
+
+def read_header(reader: Iterator[list[str]]) -> list[str]:
+    header = next(reader, None)
+    if not header:
+        raise ImportFileError("CSV file is empty.")
+    columns = [name.strip().lower() for name in header]
+    missing = [name for name in IMPORT_COLUMNS if name not in columns]
+    if missing:
+        raise ImportFileError(f"CSV header is missing: {', '.join(missing)}.")
+    return columns
+
+
+def _normalize_email(email: str) -> str:
+    local, at, domain = email.strip().rpartition("@")
+    return f"{local}{at}{domain.lower()}" if at else email.strip()
+
+
+def _staging_rows(reader: Iterator[list[str]], columns: list[str]) -> Iterator[tuple]:
+    # Row numbers match a spreadsheet view of the file: the header is row 1.
+    positions = [columns.index(name) for name in IMPORT_COLUMNS]
+    for row_no, record in enumerate(reader, start=2):
+        if not any(cell.strip() for cell in record):
+            continue
+        if len(record) != len(columns):
+            error = f"Expected {len(columns)} columns, found {len(record)}."
+            yield (row_no, None, None, None, error)
+            continue
+        full_name, email, department = (record[index] for index in positions)
+        yield (row_no, full_name.strip(), _normalize_email(email), department.strip(), None)
+
+
+def _validate_staged(db: Session) -> None:
+    s = staging.c
+    field_error = case(
+        (or_(s.full_name.is_(None), s.full_name == ""), "full_name is required."),
+        (func.length(s.full_name) > 120, "full_name must be at most 120 characters."),
+        (or_(s.email.is_(None), s.email == ""), "email is required."),
+        (func.length(s.email) > 255, "email must be at most 255 characters."),
+        (s.email.regexp_match(EMAIL_PATTERN).is_not(True), "email is not a valid email address."),
+        (or_(s.department.is_(None), s.department == ""), "department is required."),
+        (func.length(s.department) > 120, "department must be at most 120 characters."),
+    )
+    db.execute(update(staging).where(s.error.is_(None)).values(error=field_error))
+
+    first_seen = (
+        select(s.email, func.min(s.row_no).label("first_row"))
+        .where(s.error.is_(None))
+        .group_by(s.email)
+        .having(func.count() > 1)
+        .subquery()
+    )
+    db.execute(
+        update(staging)
+        .where(
+            s.error.is_(None),
+            s.email == first_seen.c.email,
+            s.row_no > first_seen.c.first_row,
+        )
+        .values(error=func.format("Duplicate email; first seen on row %s.", first_seen.c.first_row))
+    )
+    db.execute(
+        update(staging)
+        .where(s.error.is_(None), s.email == Employee.email)
+        .values(error="Employee with this email already exists.")
+    )
+
+
+def _merge_staged(db: Session, actor_id: int | None) -> None:
+    s = staging.c
+    # Ids are drawn in row order (volatile targets run after the sort), so codes follow the file.
+    valid = (
+        select(
+            next_employee_id().label("id"),
+            s.full_name,
+            s.email,
+            s.department,
+        )
+        .where(s.error.is_(None))
+        .order_by(s.row_no)
+        .cte("valid")
+    )
+    inserted = (
+        insert(Employee)
+        .from_select(
+            [
+                "id",
+                "employee_id",
+                "full_name",
+                "email",
+                "department",
+                "created_by_id",
+                "updated_by_id",
+            ],
+            select(
+                valid.c.id,
+                employee_code_expr(valid.c.id),
+                valid.c.full_name,
+                valid.c.email,
+                valid.c.department,
+                literal(actor_id, Integer),
+                literal(actor_id, Integer),
+            ),
+        )
+        .on_conflict_do_nothing()
+        .returning(Employee.id, Employee.email)
+        .cte("inserted")
+    )
+    db.execute(
+        update(staging)
+        .where(and_(s.error.is_(None), s.email == inserted.c.email))
+        .values(employee_pk=inserted.c.id)
+    )
+    # Whatever was valid but not inserted lost a race with a concurrent create.
+    db.execute(
+        update(staging)
+        .where(s.error.is_(None), s.employee_pk.is_(None))
+        .values(error="Employee with this email already exists.")
+    )
+
+
+def import_employees_csv(db: Session, text: IO[str], actor_id: int | None) -> dict:
+    """
+    Creates employees from a CSV with full_name, email and department columns.
+
+    Rows are streamed into a temporary staging table with COPY, validated and
+    de-duplicated there, and merged into `employees` in the same transaction.
+    Invalid rows are skipped and reported; they never fail the rest of the file.
+    """
+
+    reader = csv.reader(text)
+    columns = read_header(reader)
+    staging.create(db.connection())
+    copy_rows(
+        db,
+        staging,
+        ("row_no", "full_name", "email", "department", "error"),
+        _staging_rows(reader, columns),
+    )
+    _validate_staged(db)
+    _merge_staged(db, actor_id)
+
+    s = staging.c
+    total_rows, created = db.execute(
+        select(func.count(), func.count(s.employee_pk)).select_from(staging)
+    ).one()
+    errors = db.execute(
+        select(s.row_no, s.email, s.error).where(s.error.is_not(None)).order_by(s.row_no)
+    ).all()
+    db.commit()
+    if created:
+        data_version.bump()
+        suggest_index.invalidate()
+    return {
+        "total_rows": total_rows,
+        "created": created,
+        "failed": len(errors),
+        "errors": [{"row": row.row_no, "email": row.email, "error": row.error} for row in errors],
+    }
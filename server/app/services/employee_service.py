@@ -1,27 +1,103 @@
-from sqlalchemy import func, or_
+from collections.abc import Sequence
+
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    String,
+    and_,
+    cast,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core.cache import data_version
+from app.db.pagination import PageTotal, TotalMode, fetch_page
+from app.db.projection import as_dicts, row_key, select_columns
+from app.db.search import SearchMode, substring_search, text_search
 from app.models import Employee
+from app.services.attendance_rollup_service import shift_employee_counts
+from app.services.employee_suggest_service import suggest_index
+
+# Response field -> column for the employee list, in EmployeeRead order.
+EMPLOYEE_COLUMNS = {
+    "id": Employee.id,
+    "employee_id": Employee.employee_id,
+    "full_name": Employee.full_name,
+    "email": Employee.email,
+    "department": Employee.department,
+    "created_at": Employee.created_at,
+    "updated_at": Employee.updated_at,
+    "created_by_id": Employee.created_by_id,
+    "updated_by_id": Employee.updated_by_id,
+}
 
 
 def list_employees(
-    db: Session, limit: int, offset: int, search: str | None
-) -> tuple[list[Employee], int]:
-    query = db.query(Employee)
+    db: Session,
+    limit: int,
+    offset: int,
+    search: str | None,
+    after: tuple | None = None,
+    include_total: TotalMode = TotalMode.EXACT,
+    fields: Sequence[str] | None = None,
+    search_mode: SearchMode = SearchMode.SUBSTRING,
+) -> tuple[list[dict], PageTotal, tuple | None]:
+    """
+    Returns a page of employees as plain dicts of `fields`, its total and the sort
+    key of its last row.
+
+    The order is by id and the key is `(id,)`, with or without a substring search.
+    A ranked search orders matches by relevance and the key is `(rank, id)`.
+    """
+
+    matches = None
     if search:
-        term = f"%{search}%"
-        query = query.filter(
-            or_(
-                Employee.employee_id.ilike(term),
-                Employee.full_name.ilike(term),
-                Employee.email.ilike(term),
-                Employee.department.ilike(term),
-            )
+        matches = substring_search(
+            search,
+            Employee.employee_id,
+            Employee.full_name,
+            Employee.email,
+            Employee.department,
+        )
+    if search and search_mode == SearchMode.RANKED:
+        matches, rank = text_search(Employee.search_vector, search, matches)
+        keys = ("rank", "id")
+        names, columns = select_columns({**EMPLOYEE_COLUMNS, "rank": rank}, fields, keys=keys)
+        seek = None
+        if after is not None:
+            after_rank, after_id = after
+            seek = or_(rank < after_rank, and_(rank == after_rank, Employee.id > after_id))
+        rows, total = fetch_page(
+            db,
+            db.query(*columns).filter(matches),
+            order_by=(rank.desc(), Employee.id.asc()),
+            limit=limit,
+            offset=offset,
+            include_total=include_total,
+            seek=seek,
+        )
+    else:
+        keys = ("id",)
+        names, columns = select_columns(EMPLOYEE_COLUMNS, fields, keys=keys)
+        query = db.query(*columns)
+        if matches is not None:
+            query = query.filter(matches)
+        rows, total = fetch_page(
+            db,
+            query,
+            order_by=(Employee.id.asc(),),
+            limit=limit,
+            offset=offset,
+            include_total=include_total,
+            seek=Employee.id > after[0] if after is not None else None,
         )
-    total = query.count()
-    items = query.order_by(Employee.id.asc()).offset(offset).limit(limit).all()
-    return items, total
+    last = row_key(rows[-1], names, keys) if rows else None
+    return as_dicts(rows, fields or tuple(EMPLOYEE_COLUMNS)), total, last
 
 
 def get_employee_by_id(db: Session, employee_id: int) -> Employee | None:
@@ -36,10 +112,38 @@ def get_employee_by_email(db: Session, email: str) -> Employee | None:
     return db.query(Employee).filter(Employee.email == email).first()
 
 
-def generate_employee_code(db: Session) -> str:
-    last_id = db.query(func.max(Employee.id)).scalar() or 0
-    next_id = int(last_id) + 1
-    return f"EMP-{next_id:03d}"
+def format_employee_code(number: int) -> str:
+    return f"EMP-{number:03d}"
+
+
+def employee_code_expr(number: ColumnElement[int]) -> ColumnElement[str]:
+    """SQL twin of `format_employee_code` for inserts that draw the id in SQL."""
+    text = cast(number, String)
+    return literal("EMP-") + func.lpad(text, func.greatest(3, func.length(text)), "0")
+
+
+def next_employee_id() -> ColumnElement[int]:
+    """
+    Draws the next value of the employees id sequence.
+
+    Codes are derived from the id, so a drawn value is both the row's primary key
+    and its EMP code. nextval never hands the same value out twice, which makes
+    concurrent creates collision-free; values lost to rollbacks are simply skipped.
+    """
+    return func.nextval(func.pg_get_serial_sequence(Employee.__tablename__, "id"))
+
+
+def reserve_employee_ids(db: Session, count: int) -> list[int]:
+    """
+    Reserves `count` ids (and their codes) in one round trip, in increasing order.
+
+    For the bulk paths that build rows before inserting them; a single create draws
+    its id inside the INSERT instead.
+    """
+    if count <= 0:
+        return []
+    stmt = select(next_employee_id()).select_from(func.generate_series(1, count))
+    return sorted(db.scalars(stmt))
 
 
 def create_employee(
@@ -49,22 +153,41 @@ def create_employee(
     department: str,
     actor_id: int | None,
 ) -> Employee:
-    employee_id = generate_employee_code(db)
-    employee = Employee(
-        employee_id=employee_id,
-        full_name=full_name,
-        email=email,
-        department=department,
-        created_by_id=actor_id,
-        updated_by_id=actor_id,
+    # One statement: the id is drawn in the SELECT, and the code is derived from it there too.
+    drawn = select(next_employee_id().label("id")).subquery("drawn")
+    stmt = (
+        insert(Employee)
+        .from_select(
+            [
+                "id",
+                "employee_id",
+                "full_name",
+                "email",
+                "department",
+                "created_by_id",
+                "updated_by_id",
+            ],
+            select(
+                drawn.c.id,
+                employee_code_expr(drawn.c.id),
+                literal(full_name, String),
+                literal(email, String),
+                literal(department, String),
+                literal(actor_id, Integer),
+                literal(actor_id, Integer),
+            ),
+        )
+        .returning(Employee)
     )
-    db.add(employee)
     try:
+        employee = db.scalars(stmt).one()
         db.commit()
     except IntegrityError as exc:
         db.rollback()
         raise exc
+    data_version.bump()
     db.refresh(employee)
+    suggest_index.upsert(employee)
     return employee
 
 
@@ -74,18 +197,28 @@ def update_employee(
     updates: dict,
     actor_id: int | None,
 ) -> Employee:
+    previous_department = employee.department
     for key, value in updates.items():
         setattr(employee, key, value)
     employee.updated_by_id = actor_id
+    if employee.department != previous_department:
+        shift_employee_counts(db, employee.id, previous_department, sign=-1)
+        shift_employee_counts(db, employee.id, employee.department, sign=1)
     try:
         db.commit()
     except IntegrityError as exc:
         db.rollback()
         raise exc
+    data_version.bump()
     db.refresh(employee)
+    suggest_index.upsert(employee)
     return employee
 
 
 def delete_employee(db: Session, employee: Employee) -> None:
+    employee_pk = employee.id
+    shift_employee_counts(db, employee_pk, employee.department, sign=-1)
     db.delete(employee)
     db.commit()
+    data_version.bump()
+    suggest_index.remove(employee_pk)
@@ -0,0 +1,148 @@
+import threading
+import time
+from bisect import bisect_left, insort
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Row, select
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.db.deps import DbSession, run_db
+from app.models import Employee
+
+
+def _employee_rows(db: Session) -> Sequence[Row]:
+    return db.execute(
+        select(Employee.id, Employee.employee_id, Employee.full_name, Employee.email)
+    ).all()
+
+
+class EmployeeSuggestIndex:
+    """
+    Per-worker prefix index over employee names, codes and emails.
+
+    Terms live in one sorted list of `(term, employee_pk)` pairs, so a prefix
+    lookup is a bisect plus a short forward scan. Writes in this worker update
+    it in place. The whole index is reloaded once it is older than `ttl_seconds`,
+    which is how changes made by other workers (or by imports) show up.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._pairs: list[tuple[str, int]] = []
+        self._entries: dict[int, dict[str, Any]] = {}
+        self._built_at: float | None = None
+        self._version = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._reloading = threading.Lock()
+
+    @staticmethod
+    def _terms(entry: dict[str, Any]) -> set[str]:
+        name = entry["full_name"].lower()
+        code = entry["employee_id"].lower()
+        terms = {name, *name.split(), code, entry["email"].lower()}
+        # `EMP-007` is also found by `007`.
+        terms.add(code.rpartition("-")[2])
+        return terms
+
+    def _add(self, entry: dict[str, Any]) -> None:
+        self._entries[entry["id"]] = entry
+        for term in self._terms(entry):
+            insort(self._pairs, (term, entry["id"]))
+
+    def _remove(self, employee_pk: int) -> None:
+        entry = self._entries.pop(employee_pk, None)
+        if entry is None:
+            return
+        for term in self._terms(entry):
+            index = bisect_left(self._pairs, (term, employee_pk))
+            if index < len(self._pairs) and self._pairs[index] == (term, employee_pk):
+                del self._pairs[index]
+
+    def is_stale(self) -> bool:
+        built_at = self._built_at
+        return built_at is None or time.monotonic() - built_at > self.ttl_seconds
+
+    def _install(self, rows: Sequence[Row], version: int) -> None:
+        entries = {row.id: dict(row._mapping) for row in rows}
+        pairs = sorted((term, pk) for pk, entry in entries.items() for term in self._terms(entry))
+        with self._lock:
+            self._entries = entries
+            self._pairs = pairs
+            self._loaded = True
+            # A write that landed while loading may be missing; reload on the next lookup.
+            self._built_at = time.monotonic() if version == self._version else None
+
+    async def rebuild(self, db: DbSession) -> None:
+        """
+        Reloads every employee. The query goes through `run_db`; building and sorting
+        the terms runs in the threadpool, so neither blocks the event loop.
+        """
+
+        # Never wait here. Once loaded, concurrent lookups keep serving the current
+        # index while one request reloads.
+        acquired = self._reloading.acquire(blocking=False)
+        if not acquired and self._loaded:
+            return
+        try:
+            with self._lock:
+                version = self._version
+            rows = await run_db(db, _employee_rows)
+            await run_in_threadpool(self._install, rows, version)
+        finally:
+            if acquired:
+                self._reloading.release()
+
+    def upsert(self, employee: Employee) -> None:
+        entry = {
+            "id": employee.id,
+            "employee_id": employee.employee_id,
+            "full_name": employee.full_name,
+            "email": employee.email,
+        }
+        with self._lock:
+            self._version += 1
+            self._remove(employee.id)
+            self._add(entry)
+
+    def remove(self, employee_pk: int) -> None:
+        with self._lock:
+            self._version += 1
+            self._remove(employee_pk)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._built_at = None
+
+    def search(self, prefix: str, limit: int) -> list[dict[str, Any]]:
+        prefix = prefix.strip().lower()
+        matches: list[dict[str, Any]] = []
+        seen: set[int] = set()
+        with self._lock:
+            index = bisect_left(self._pairs, (prefix,))
+            while index < len(self._pairs) and len(matches) < limit:
+                term, employee_pk = self._pairs[index]
+                if not term.startswith(prefix):
+                    break
+                if employee_pk not in seen:
+                    seen.add(employee_pk)
+                    matches.append(self._entries[employee_pk])
+                index += 1
+        return matches
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            built_at = self._built_at
+            return {
+                "employees": len(self._entries),
+                "terms": len(self._pairs),
+                "ttl_seconds": self.ttl_seconds,
+                "age_seconds": round(time.monotonic() - built_at, 1) if built_at else None,
+            }
+
+
+suggest_index = EmployeeSuggestIndex(ttl_seconds=settings.suggest_index_ttl_seconds)
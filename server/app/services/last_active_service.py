@@ -0,0 +1,83 @@
+import asyncio
+from collections.abc import Iterable
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, Integer, column, or_, update, values
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import LatestValueBuffer
+from app.core.config import settings
+from app.core.logger import logger
+from app.db.session import AsyncSessionLocal, SessionLocal
+from app.models import Admin
+
+# admin id -> most recent activity not yet written to admins.last_active_at.
+last_active_buffer = LatestValueBuffer()
+
+
+def touch(admin: Admin) -> Admin:
+    """Records activity without a write; the value is visible on `admin` right away."""
+    now = datetime.now(UTC)
+    last_active_buffer.touch(admin.id, now)
+    set_committed_value(admin, "last_active_at", now)
+    return admin
+
+
+def overlay(admins: Iterable[Admin]) -> None:
+    """Shows buffered activity on loaded admins without marking them dirty."""
+    for admin in admins:
+        pending = last_active_buffer.get(admin.id)
+        if pending is not None and (admin.last_active_at is None or pending > admin.last_active_at):
+            set_committed_value(admin, "last_active_at", pending)
+
+
+def flush(db: Session) -> int:
+    """Writes all buffered activity with one UPDATE ... FROM (VALUES ...)."""
+    pending = last_active_buffer.drain()
+    if not pending:
+        return 0
+    seen = values(
+        column("admin_id", Integer), column("seen_at", DateTime(timezone=True)), name="seen"
+    ).data(sorted(pending.items()))
+    stmt = (
+        update(Admin)
+        .where(
+            Admin.id == seen.c.admin_id,
+            # Another worker may already have written a later time.
+            or_(Admin.last_active_at.is_(None), Admin.last_active_at < seen.c.seen_at),
+        )
+        # Activity is not an edit, so updated_at keeps its value.
+        .values(last_active_at=seen.c.seen_at, updated_at=Admin.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    try:
+        db.execute(stmt)
+        db.commit()
+    except Exception:
+        db.rollback()
+        last_active_buffer.restore(pending)
+        raise
+    return len(pending)
+
+
+def _flush_sync() -> int:
+    with SessionLocal() as db:
+        return flush(db)
+
+
+async def flush_pending() -> int:
+    if settings.database_async:
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(flush)
+    return await run_in_threadpool(_flush_sync)
+
+
+async def run_periodic_flush(interval_seconds: float) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await flush_pending()
+        except Exception:
+            logger.exception("last_active flush failed; will retry")
@@ -2,39 +2,35 @@ from __future__ import annotations
 
 from datetime import date
 
-from sqlalchemy import and_, case, func
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from app.models import Attendance, AttendanceStatus, Employee
+from app.models import AttendanceDailyCount, Employee
 
 
 def overview_stats(db: Session, date_value: date) -> dict:
     """
     Returns employee totals + attendance split for the given date.
 
-    Unmarked = employees with no attendance record for that date.
+    Unmarked = employees with no attendance record for that date. The split is read
+    from the daily rollup, so the cost does not grow with attendance history.
     """
 
-    total, present, absent, unmarked = (
+    total, present, absent = (
         db.query(
-            func.count(Employee.id),
-            func.sum(case((Attendance.status == AttendanceStatus.PRESENT, 1), else_=0)),
-            func.sum(case((Attendance.status == AttendanceStatus.ABSENT, 1), else_=0)),
-            func.sum(case((Attendance.id.is_(None), 1), else_=0)),
-        )
-        .select_from(Employee)
-        .join(
-            Attendance,
-            and_(Attendance.employee_id == Employee.id, Attendance.date == date_value),
-            isouter=True,
+            select(func.count(Employee.id)).scalar_subquery(),
+            func.coalesce(func.sum(AttendanceDailyCount.present), 0),
+            func.coalesce(func.sum(AttendanceDailyCount.absent), 0),
         )
+        .filter(AttendanceDailyCount.date == date_value)
         .one()
     )
+    total, present, absent = int(total or 0), int(present), int(absent)
 
     return {
         "date": date_value,
-        "total_employees": int(total or 0),
-        "present": int(present or 0),
-        "absent": int(absent or 0),
-        "unmarked": int(unmarked or 0),
+        "total_employees": total,
+        "present": present,
+        "absent": absent,
+        "unmarked": max(total - present - absent, 0),
     }
@@ -0,0 +1,41 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Sequence
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import Row
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, date | datetime):
+        return value.isoformat()
+    return value
+
+
+async def csv_chunks(
+    columns: Sequence[str], batches: AsyncIterator[Sequence[Row]]
+) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    # Send the header before the first query batch so the download starts immediately.
+    yield buffer.getvalue()
+    async for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([[_plain(value) for value in row] for row in batch])
+        yield buffer.getvalue()
+
+
+async def ndjson_chunks(
+    columns: Sequence[str], batches: AsyncIterator[Sequence[Row]]
+) -> AsyncIterator[str]:
+    async for batch in batches:
+        yield "".join(
+            json.dumps(dict(zip(columns, map(_plain, row), strict=True))) + "\n" for row in batch
+        )
@@ -0,0 +1,25 @@
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+
+
+def parse_fields(fields: str | None, schema: type[BaseModel]) -> tuple[str, ...] | None:
+    """
+    Parses a `?fields=a,b` sparse fieldset into `schema` field names, in schema order.
+
+    Returns None (every field) when the parameter is absent. Unknown names are a 400.
+    """
+
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    if not requested:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="fields must name at least one field."
+        )
+    unknown = requested - schema.model_fields.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}.",
+        )
+    return tuple(name for name in schema.model_fields if name in requested)
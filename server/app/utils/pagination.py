@@ -0,0 +1,65 @@
+import base64
+import json
+from datetime import date
+from typing import Any
+
+from fastapi import HTTPException, status
+
+from app.db.pagination import PageTotal
+
+DEFAULT_PAGE_SIZE = 20
+MAX_OFFSET_PAGE_SIZE = 100
+MAX_CURSOR_PAGE_SIZE = 500
+
+
+def encode_cursor(*values: int | float | date) -> str:
+    raw = [value.isoformat() if isinstance(value, date) else value for value in values]
+    payload = json.dumps(raw, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple[Any, ...]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(raw, list) or len(raw) != len(types):
+            raise ValueError("cursor shape mismatch")
+        return tuple(
+            date.fromisoformat(value) if kind is date else kind(value)
+            for kind, value in zip(types, raw, strict=True)
+        )
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor."
+        ) from exc
+
+
+def check_page_size(limit: int, offset: int, cursor: str | None) -> None:
+    if cursor is not None and offset:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor and offset cannot be combined.",
+        )
+    if cursor is None and offset and limit > MAX_OFFSET_PAGE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"limit must be <= {MAX_OFFSET_PAGE_SIZE} when paginating by offset.",
+        )
+
+
+def page_meta(
+    total: PageTotal,
+    limit: int,
+    offset: int,
+    cursor: str | None,
+    next_cursor: str | None,
+) -> dict[str, Any]:
+    meta: dict[str, Any] = {"total": total.value, "limit": limit}
+    if total.value is not None:
+        meta["total_kind"] = total.kind.value
+    if cursor is None:
+        meta["offset"] = offset
+    else:
+        meta["cursor"] = cursor
+    meta["next_cursor"] = next_cursor
+    return meta
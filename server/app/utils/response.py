@@ -1,5 +1,15 @@
-from typing import Any, TypeVar
+import hashlib
+import operator
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from functools import cache
+from typing import Any, NamedTuple, TypeVar
 
+import pydantic_core
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.core.cache import data_version, response_cache
 from app.schemas.response import ApiResponse
 
 T = TypeVar("T")
@@ -9,3 +19,88 @@ def success_response(
     data: T | None = None, message: str = "Success", meta: dict[str, Any] | None = None
 ) -> ApiResponse[T]:
     return ApiResponse(message=message, data=data, meta=meta)
+
+
+class ApiJSONResponse(JSONResponse):
+    """JSONResponse encoded by pydantic-core; already-serialized `bytes` are sent as-is."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return pydantic_core.to_json(content)
+
+
+@cache
+def _schema_getter(schema: type[BaseModel]) -> tuple[tuple[str, ...], Callable[[Any], tuple]]:
+    fields = tuple(schema.model_fields)
+    return fields, operator.attrgetter(*fields)
+
+
+def project(rows: Iterable[Any], schema: type[BaseModel]) -> list[dict[str, Any]]:
+    """Copies the attributes `schema` declares off each row (ORM objects included), unvalidated."""
+
+    fields, getter = _schema_getter(schema)
+    if len(fields) == 1:
+        return [{fields[0]: getter(row)} for row in rows]
+    return [dict(zip(fields, getter(row), strict=True)) for row in rows]
+
+
+def trusted_response(
+    data: Any = None,
+    message: str = "Success",
+    meta: dict[str, Any] | None = None,
+    status_code: int = status.HTTP_200_OK,
+) -> Response:
+    """
+    Encodes a server-built payload straight to JSON bytes without response validation.
+
+    Only for data this service loaded from its own tables or assembled itself in the
+    response schema's shape (dicts, schema instances, or rows passed through `project`).
+    The route's `response_model` still documents the shape, but is not checked against it.
+    """
+
+    body = pydantic_core.to_json({"success": True, "message": message, "data": data, "meta": meta})
+    return ApiJSONResponse(body, status_code=status_code)
+
+
+class CachedBody(NamedTuple):
+    etag: str
+    body: bytes
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+async def cached_response(
+    request: Request,
+    key: Hashable,
+    response_model: type[BaseModel],
+    build: Callable[[], Awaitable[ApiResponse]],
+) -> Response:
+    """
+    Serves a read-only payload from the response cache with a strong ETag.
+
+    Entries are keyed by `key` plus the current data version, so any committed write
+    makes them unreachable. A matching If-None-Match on a cached entry is answered
+    with 304 before `build` (and the database) is touched. Payloads built from a read
+    replica are served but not stored: the replica may not have the current version's
+    writes yet.
+    """
+
+    cache_key = (key, data_version.value)
+    entry = response_cache.get(cache_key)
+    if entry is None:
+        payload = await build()
+        body = response_model.model_validate(payload, from_attributes=True).model_dump_json()
+        body_bytes = body.encode()
+        entry = CachedBody(f'"{hashlib.sha256(body_bytes).hexdigest()[:32]}"', body_bytes)
+        if getattr(request.state, "read_source", "primary") == "primary":
+            response_cache.put(cache_key, entry)
+    headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
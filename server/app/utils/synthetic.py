@@ -0,0 +1,114 @@
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, timedelta
+from itertools import accumulate
+
+from app.models import AttendanceStatus
+
+FIRST_NAMES = (
+    "Aarav", "Aisha", "Alex", "Amara", "Ana", "Arjun", "Ava", "Ben", "Carlos", "Chen",
+    "Chloe", "Daniel", "Diya", "Elena", "Emma", "Ethan", "Fatima", "Grace", "Hana", "Ishaan",
+    "Isla", "Jack", "James", "Kai", "Kavya", "Leo", "Liam", "Lucas", "Maya", "Mei",
+    "Mia", "Noah", "Olivia", "Omar", "Priya", "Rahul", "Sara", "Sofia", "Yusuf", "Zara",
+)  # fmt: skip
+LAST_NAMES = (
+    "Ahmed", "Ali", "Brown", "Chen", "Das", "Davis", "Fernandez", "Garcia", "Gupta", "Ivanov",
+    "Johnson", "Khan", "Kim", "Kumar", "Lee", "Lopez", "Martin", "Mehta", "Miller", "Mueller",
+    "Nakamura", "Nguyen", "Okafor", "Patel", "Rao", "Reddy", "Rossi", "Sato", "Schmidt", "Shah",
+    "Silva", "Singh", "Smith", "Sharma", "Taylor", "Tanaka", "Wang", "Williams", "Wilson", "Zhang",
+)  # fmt: skip
+DEPARTMENT_AREAS = (
+    "Engineering", "Sales", "Customer Support", "Operations", "Finance", "HR", "Marketing",
+    "Product", "Legal", "IT", "Design", "Data", "Security", "Procurement", "Facilities", "Quality",
+)  # fmt: skip
+REGIONS = ("EMEA", "APAC", "Americas", "India", "LATAM")
+
+# Share of employees already on staff when the window opens; the rest join during it.
+TENURED_SHARE = 0.85
+# Chance that a weekend day has a (Present) mark, and that a workday has no mark at all.
+WEEKEND_WORK_RATE = 0.02
+UNMARKED_RATE = 0.01
+# Absences cluster: after an absent day the next workday is absent with this probability.
+ABSENCE_CONTINUES = 0.55
+# Winter months see more absences (Northern-hemisphere flu season).
+SEASONAL_ABSENCE = {12: 1.5, 1: 1.6, 2: 1.4, 3: 1.1}
+
+PRESENT = AttendanceStatus.PRESENT.name
+ABSENT = AttendanceStatus.ABSENT.name
+
+
+def department_names(count: int) -> list[str]:
+    """`count` distinct names: plain functional areas first, then area/region pairs."""
+
+    names = list(DEPARTMENT_AREAS)
+    names += [f"{area} {region}" for region in REGIONS for area in DEPARTMENT_AREAS]
+    names += [f"{area} {n}" for n in range(2, count + 2) for area in DEPARTMENT_AREAS]
+    return names[:count]
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticEmployee:
+    full_name: str
+    email_local: str
+    department: str
+    # Index into the window of the first day with attendance (0 = on staff throughout).
+    start_day: int
+    absence_rate: float
+
+
+class SyntheticDataset:
+    """
+    Deterministic HR data for load tests.
+
+    Every employee draws from RNGs seeded with `(seed, ordinal)`, so any
+    employee's profile and attendance can be regenerated independently and the
+    output does not depend on batch sizes. Department sizes follow a Zipf-like
+    curve (a few large departments, a long tail of small ones).
+    """
+
+    def __init__(self, seed: int, departments: int, days: int, end_date: date) -> None:
+        self.seed = seed
+        self.departments = department_names(departments)
+        self._department_weights = list(
+            accumulate(1 / rank**0.9 for rank in range(1, departments + 1))
+        )
+        self.dates = [end_date - timedelta(days=offset) for offset in range(days - 1, -1, -1)]
+        self._date_text = [day.isoformat() for day in self.dates]
+        self._weekend = [day.weekday() >= 5 for day in self.dates]
+        self._season = [SEASONAL_ABSENCE.get(day.month, 1.0) for day in self.dates]
+
+    def _rng(self, ordinal: int, stream: str) -> random.Random:
+        # String seeds are hashed with SHA-512, so they are stable across processes.
+        return random.Random(f"{self.seed}:{ordinal}:{stream}")
+
+    def employee(self, ordinal: int) -> SyntheticEmployee:
+        rng = self._rng(ordinal, "profile")
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        tenured = rng.random() < TENURED_SHARE
+        return SyntheticEmployee(
+            full_name=f"{first} {last}",
+            email_local=f"{first}.{last}".lower(),
+            department=rng.choices(self.departments, cum_weights=self._department_weights)[0],
+            start_day=0 if tenured else rng.randrange(len(self.dates)),
+            # Most people are rarely out; a few are out a lot.
+            absence_rate=min(0.25, rng.expovariate(1 / 0.035)),
+        )
+
+    def attendance(self, ordinal: int, profile: SyntheticEmployee) -> Iterator[tuple[str, str]]:
+        """Yields `(iso_date, status_name)` for one employee, oldest first."""
+
+        draw = self._rng(ordinal, "attendance").random
+        absent_yesterday = False
+        for day in range(profile.start_day, len(self.dates)):
+            if self._weekend[day]:
+                if draw() < WEEKEND_WORK_RATE:
+                    yield self._date_text[day], PRESENT
+                continue
+            if draw() < UNMARKED_RATE:
+                continue
+            if absent_yesterday:
+                absent_yesterday = draw() < ABSENCE_CONTINUES
+            else:
+                absent_yesterday = draw() < profile.absence_rate * self._season[day]
+            yield self._date_text[day], ABSENT if absent_yesterday else PRESENT
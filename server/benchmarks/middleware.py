@@ -0,0 +1,178 @@
+"""
+Per-request overhead of the HTTP middleware stack.
+
+Drives ASGI apps in-process (no sockets) and reports the mean cost of one
+request through CORS, GZip, rate limiting, TrustedHost, security headers and request
+logging. It compares the BaseHTTPMiddleware layers this app used to ship with
+the pure ASGI ones, against the same route with no middleware at all.
+
+    uv run python -m benchmarks.middleware --requests 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import Callable
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.trustedhost import TrustedHostMiddleware
+from starlette.responses import Response
+
+from app.core.logger import logger
+from app.core.ratelimit import RateLimiter
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.request_logging import RequestLoggingMiddleware
+from app.middleware.security_headers import SecurityHeadersMiddleware
+
+limiter = RateLimiter("1000000/minute", "async+memory://")
+
+
+class LegacyRateLimitMiddleware(BaseHTTPMiddleware):
+    # The same check as RateLimitMiddleware, in the BaseHTTPMiddleware shape slowapi shipped.
+    async def dispatch(self, request, call_next):
+        endpoint = request.scope["path"]
+        if await limiter.hit(limiter.default_limits, request.client.host, endpoint) is not None:
+            return Response(status_code=429)
+        return await call_next(request)
+
+
+class LegacySecurityHeadersMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["X-Frame-Options"] = "DENY"
+        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        response.headers["Permissions-Policy"] = "geolocation=(), microphone=()"
+        if request.url.scheme == "https":
+            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+        return response
+
+
+async def legacy_request_logger(request: Request, call_next) -> Response:
+    request_id = request.headers.get("X-Request-Id", str(uuid.uuid4()))
+    start_time = time.time()
+    response: Response = await call_next(request)
+    duration_ms = int((time.time() - start_time) * 1000)
+    response.headers["X-Request-Id"] = request_id
+    logger.info(
+        "request_id=%s method=%s path=%s status=%s duration_ms=%s",
+        request_id,
+        request.method,
+        request.url.path,
+        response.status_code,
+        duration_ms,
+    )
+    return response
+
+
+def _base_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> dict:
+        return {"status": "ok"}
+
+    return app
+
+
+def build_bare() -> FastAPI:
+    return _base_app()
+
+
+def _add_common(app: FastAPI, rate_limit_middleware: type, **options) -> None:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origin_regex=".*",
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    app.add_middleware(rate_limit_middleware, **options)
+    app.add_middleware(TrustedHostMiddleware, allowed_hosts=["*"])
+
+
+def build_legacy() -> FastAPI:
+    app = _base_app()
+    _add_common(app, LegacyRateLimitMiddleware)
+    app.add_middleware(LegacySecurityHeadersMiddleware)
+
+    @app.middleware("http")
+    async def logging_middleware(request, call_next):
+        return await legacy_request_logger(request, call_next)
+
+    return app
+
+
+def build_asgi() -> FastAPI:
+    app = _base_app()
+    _add_common(app, RateLimitMiddleware, limiter=limiter)
+    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(RequestLoggingMiddleware)
+    return app
+
+
+VARIANTS: dict[str, Callable[[], FastAPI]] = {
+    "bare": build_bare,
+    "base_http": build_legacy,
+    "pure_asgi": build_asgi,
+}
+
+
+async def _drive(app: FastAPI, requests: int) -> float:
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        return None
+
+    def scope() -> dict:
+        return {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/ping",
+            "raw_path": b"/ping",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"host", b"bench"), (b"origin", b"http://bench")],
+            "client": ("127.0.0.1", 50000),
+            "server": ("bench", 80),
+            "app": app,
+        }
+
+    for _ in range(min(500, requests)):
+        await app(scope(), receive, send)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(scope(), receive, send)
+    return (time.perf_counter() - started) / requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    # Measure the middleware, not the log handler.
+    logger.setLevel(logging.WARNING)
+    results = {
+        name: asyncio.run(_drive(build(), args.requests)) for name, build in VARIANTS.items()
+    }
+    bare = results["bare"]
+    print(f"{'stack':<10} {'us/request':>11} {'overhead us':>12}")
+    for name, seconds in results.items():
+        print(f"{name:<10} {seconds * 1e6:>11.1f} {(seconds - bare) * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Per-row cost of encoding list responses.
+
+Serves the same rows through three route setups, in-process over ASGI:
+
+- `fastapi`: the stock route. FastAPI validates the result against
+  `response_model`, dumps it to Python primitives, and `json` encodes those.
+- `one_pass`: `ApiRoute`. It validates once and pydantic-core writes the bytes.
+- `trusted`: `trusted_response(project(...))`. It does no validation.
+
+Rows are ORM `Employee` objects (`EmployeeRead` validates `EmailStr`) and
+attendance list dicts. The per-row cost is the slope between a one-row and an
+N-row page.
+
+    uv run python -m benchmarks.serialization --rows 500 --requests 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from datetime import UTC, date, datetime
+from typing import Any
+
+from fastapi import APIRouter, FastAPI
+from pydantic import BaseModel
+
+from app.api.routing import ApiRoute
+from app.models import AttendanceStatus, Employee
+from app.schemas.attendance import AttendanceListItem
+from app.schemas.employee import EmployeeRead
+from app.schemas.response import ApiResponse
+from app.utils.response import project, success_response, trusted_response
+
+VARIANTS = ("fastapi", "one_pass", "trusted")
+
+
+def employee_rows(count: int) -> list[Employee]:
+    now = datetime.now(UTC)
+    return [
+        Employee(
+            id=index,
+            employee_id=f"EMP-{index:03d}",
+            full_name="Ava Patel",
+            email=f"ava.patel.{index}@example.com",
+            department="Engineering",
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(1, count + 1)
+    ]
+
+
+def attendance_rows(count: int) -> list[dict[str, Any]]:
+    now = datetime.now(UTC)
+    return [
+        {
+            "id": index,
+            "employee_id": index,
+            "employee_code": f"EMP-{index:03d}",
+            "employee_name": "Ava Patel",
+            "employee_email": f"ava.patel.{index}@example.com",
+            "department": "Engineering",
+            "date": date(2026, 1, 1),
+            "status": AttendanceStatus.PRESENT,
+            "created_at": now,
+            "updated_at": now,
+            "created_by_id": 1,
+            "updated_by_id": None,
+        }
+        for index in range(1, count + 1)
+    ]
+
+
+DATASETS: dict[str, tuple[type[BaseModel], Any]] = {
+    "employees": (EmployeeRead, employee_rows),
+    "attendance": (AttendanceListItem, attendance_rows),
+}
+
+
+def build_app(rows: dict[tuple[str, int], list[Any]]) -> FastAPI:
+    stock = APIRouter()
+    fast = APIRouter(route_class=ApiRoute)
+
+    for (dataset, count), items in rows.items():
+        schema = DATASETS[dataset][0]
+        model = ApiResponse[list[schema]]
+        meta = {"total": count, "limit": count, "offset": 0}
+
+        def plain(items=items, meta=meta):
+            async def endpoint():
+                return success_response(items, message="Fetched", meta=meta)
+
+            return endpoint
+
+        def trusted(items=items, meta=meta, schema=schema):
+            async def endpoint():
+                data = items if isinstance(items[0], dict) else project(items, schema)
+                return trusted_response(data, message="Fetched", meta=meta)
+
+            return endpoint
+
+        stock.add_api_route(f"/fastapi/{dataset}/{count}", plain(), response_model=model)
+        fast.add_api_route(f"/one_pass/{dataset}/{count}", plain(), response_model=model)
+        fast.add_api_route(f"/trusted/{dataset}/{count}", trusted(), response_model=model)
+
+    app = FastAPI()
+    app.include_router(stock)
+    app.include_router(fast)
+    return app
+
+
+async def _drive(app: FastAPI, path: str, requests: int) -> float:
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        return None
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+        "app": app,
+    }
+    for _ in range(min(20, requests)):
+        await app(dict(scope), receive, send)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - started) / requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500, help="rows on the large page")
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    sizes = (1, args.rows)
+    rows = {(name, size): build(size) for name, (_, build) in DATASETS.items() for size in sizes}
+    app = build_app(rows)
+
+    print(
+        f"{'dataset':<11} {'variant':<9} {'us/1 row':>9} {f'us/{args.rows} rows':>14} {'us/row':>8}"
+    )
+    for dataset in DATASETS:
+        for variant in VARIANTS:
+            small, large = (
+                asyncio.run(_drive(app, f"/{variant}/{dataset}/{size}", args.requests))
+                for size in sizes
+            )
+            per_row = (large - small) / (args.rows - 1)
+            print(
+                f"{dataset:<11} {variant:<9} {small * 1e6:>9.1f} {large * 1e6:>14.1f} "
+                f"{per_row * 1e6:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
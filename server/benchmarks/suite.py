@@ -0,0 +1,415 @@
+"""
+Service-level and HTTP benchmarks of the main read paths.
+
+Runs against the database in DATABASE_URL. `--prepare` fills an empty database
+with a synthetic dataset first (see `app.seed`). Every case runs once calling
+the controller/service functions directly on one session, and once through
+the ASGI app with `--concurrency` clients. Results go to JSON. With
+`--baseline` they are compared to a stored run, and the exit status is 1 if
+any case's p95 latency rose, or its throughput fell, by more than `--threshold`.
+
+    uv run python -m benchmarks.suite --prepare --employees 2000 --days 365
+    uv run python -m benchmarks.suite --baseline benchmarks/baseline.json
+    uv run python -m benchmarks.suite --output benchmarks/baseline.json   # refresh it
+
+Response and principal caches are disabled unless `--warm-caches` is given, so
+the numbers reflect the queries rather than cache hits.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+BENCH_EMAIL = "bench@hrms.com"
+BENCH_PASSWORD = "bench-password"
+DEFAULT_OUTPUT = Path(__file__).parent / "results" / "latest.json"
+
+
+def _configure_environment(warm_caches: bool) -> None:
+    # Read by app.core.config at import time, so this must run before any app import.
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    for name in ("RATE_LIMIT_DEFAULT", "RATE_LIMIT_LOGIN"):
+        os.environ.setdefault(name, "1000000/minute")
+    if not warm_caches:
+        os.environ.setdefault("PRINCIPAL_CACHE_MAX_SIZE", "0")
+        os.environ.setdefault("RESPONSE_CACHE_MAX_ENTRIES", "0")
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    # Called with the iteration number; service cases also get a session.
+    run: Callable[..., Awaitable[Any]]
+    # Fraction of --iterations to run, for cases that are much slower than the rest.
+    weight: float = 1.0
+
+
+@dataclass(frozen=True)
+class Fixture:
+    token: str
+    employee_ids: list[int]
+    last_date: date
+    employees: int
+    attendance: int
+    deep_offset: int
+
+
+async def _measure(
+    run: Callable[[int], Awaitable[Any]], iterations: int, concurrency: int
+) -> dict[str, Any]:
+    from app.core.metrics import LatencyWindow
+
+    window = LatencyWindow(size=iterations)
+    for warmup in range(min(10, iterations)):
+        await run(warmup)
+    counter = iter(range(iterations))
+
+    async def worker() -> None:
+        for i in counter:
+            with window.time():
+                await run(i)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    stats = window.stats()
+    del stats["window"]
+    return {**stats, "concurrency": concurrency, "throughput_rps": round(iterations / elapsed, 1)}
+
+
+def _prepare(employees: int, days: int, departments: int) -> None:
+    from sqlalchemy import func, select
+
+    from app.db.base import Base
+    from app.db.session import SessionLocal, engine
+    from app.models import Employee
+    from app.seed import generate
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        existing = db.scalar(select(func.count()).select_from(Employee))
+    if existing:
+        print(f"database already has {existing} employees; skipping --prepare")
+        return
+    generate(employees, days, departments, seed_value=42, end_date=date.today(), batch_size=1000)
+
+
+def _fixture() -> Fixture:
+    from sqlalchemy import func, select
+
+    from app.core.rbac import Role
+    from app.core.security import create_access_token, hash_password
+    from app.db.session import SessionLocal
+    from app.models import Attendance, Employee
+    from app.services import admins_service
+
+    with SessionLocal() as db:
+        if admins_service.get_admin_by_email(db, BENCH_EMAIL) is None:
+            admins_service.create_admin_user(
+                db, "Benchmark", BENCH_EMAIL, hash_password(BENCH_PASSWORD), Role.ADMIN, None
+            )
+        employees = db.scalar(select(func.count()).select_from(Employee))
+        attendance = db.scalar(select(func.count()).select_from(Attendance))
+        if not employees or not attendance:
+            sys.exit(
+                "no employees/attendance to benchmark; run with --prepare on an empty database"
+            )
+        # An evenly spread sample, so per-employee cases do not all hit one hot row.
+        step = max(1, employees // 50)
+        employee_ids = list(
+            db.scalars(
+                select(Employee.id).order_by(Employee.id).where((Employee.id % step) == 0).limit(50)
+            )
+        ) or list(db.scalars(select(Employee.id).limit(50)))
+        last_date = db.scalar(select(func.max(Attendance.date)))
+    return Fixture(
+        token=create_access_token(subject=BENCH_EMAIL, role=Role.ADMIN.value),
+        employee_ids=employee_ids,
+        last_date=last_date,
+        employees=employees,
+        attendance=attendance,
+        deep_offset=max(0, min(10_000, attendance - 100)),
+    )
+
+
+def _service_cases(fx: Fixture) -> list[Case]:
+    from app.controllers import (
+        attendance_controller,
+        auth_controller,
+        employee_controller,
+        stats_controller,
+    )
+    from app.core.deps import get_current_admin
+    from app.db.deps import run_db
+
+    def employee(i: int) -> int:
+        return fx.employee_ids[i % len(fx.employee_ids)]
+
+    def stats_case(days: int) -> Callable[..., Awaitable[Any]]:
+        date_from = fx.last_date - timedelta(days=days - 1)
+        return lambda db, i: run_db(
+            db, attendance_controller.stats, date_from, fx.last_date, employee_id=None
+        )
+
+    return [
+        Case(
+            "login",
+            lambda db, i: auth_controller.login(db, BENCH_EMAIL, BENCH_PASSWORD),
+            weight=0.25,
+        ),
+        Case("get_current_admin", lambda db, i: get_current_admin(fx.token, db)),
+        Case(
+            "employees_list",
+            lambda db, i: run_db(db, employee_controller.list_all, 20, 0, None),
+        ),
+        Case(
+            "employees_search",
+            lambda db, i: run_db(db, employee_controller.list_all, 20, 0, "pat"),
+        ),
+        Case(
+            "employee_attendance_list",
+            lambda db, i: run_db(
+                db, attendance_controller.list_for_employee, employee(i), None, None, 100, 0
+            ),
+        ),
+        Case(
+            "employee_attendance_summary",
+            lambda db, i: run_db(db, attendance_controller.summary, employee(i), None, None),
+        ),
+        Case(
+            "attendance_list_deep_offset",
+            lambda db, i: run_db(
+                db, attendance_controller.list_all, None, None, None, 100, fx.deep_offset
+            ),
+            weight=0.25,
+        ),
+        Case("attendance_stats_30d", stats_case(30)),
+        Case("attendance_stats_365d", stats_case(365)),
+        Case(
+            "stats_overview",
+            lambda db, i: run_db(db, stats_controller.get_overview, fx.last_date),
+        ),
+    ]
+
+
+def _http_cases(fx: Fixture, client: Any) -> list[Case]:
+    def employee(i: int) -> int:
+        return fx.employee_ids[i % len(fx.employee_ids)]
+
+    async def get(url: str) -> None:
+        response = await client.get(url)
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {url} returned {response.status_code}: {response.text}")
+
+    async def login(i: int) -> None:
+        response = await client.post(
+            "/api/v1/auth/login", json={"email": BENCH_EMAIL, "password": BENCH_PASSWORD}
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"login returned {response.status_code}: {response.text}")
+
+    last = fx.last_date
+    return [
+        Case("login", login, weight=0.25),
+        Case("get_current_admin", lambda i: get("/api/v1/auth/session")),
+        Case("employees_list", lambda i: get("/api/v1/employees")),
+        Case("employees_search", lambda i: get("/api/v1/employees?q=pat")),
+        Case(
+            "employee_attendance_list",
+            lambda i: get(f"/api/v1/employees/{employee(i)}/attendance?limit=100"),
+        ),
+        Case(
+            "employee_attendance_summary",
+            lambda i: get(f"/api/v1/employees/{employee(i)}/attendance/summary"),
+        ),
+        Case(
+            "attendance_list_deep_offset",
+            lambda i: get(f"/api/v1/attendance?limit=100&offset={fx.deep_offset}"),
+            weight=0.25,
+        ),
+        Case(
+            "attendance_stats_30d",
+            lambda i: get(
+                f"/api/v1/attendance/stats?date_from={last - timedelta(days=29)}&date_to={last}"
+            ),
+        ),
+        Case(
+            "attendance_stats_365d",
+            lambda i: get(
+                f"/api/v1/attendance/stats?date_from={last - timedelta(days=364)}&date_to={last}"
+            ),
+        ),
+        Case("stats_overview", lambda i: get(f"/api/v1/stats/overview?date={last}")),
+    ]
+
+
+async def _run_service(cases: list[Case], iterations: int) -> dict[str, Any]:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.core.config import settings
+    from app.db.session import AsyncSessionLocal, SessionLocal
+
+    async def reset(db: Any) -> None:
+        # Each call starts from a clean session, as a request would.
+        if isinstance(db, AsyncSession):
+            await db.rollback()
+        else:
+            db.rollback()
+        db.expunge_all()
+
+    results = {}
+    for case in cases:
+        db = AsyncSessionLocal() if settings.database_async else SessionLocal()
+
+        async def run(i: int, db: Any = db, case: Case = case) -> None:
+            await case.run(db, i)
+            await reset(db)
+
+        count = max(1, int(iterations * case.weight))
+        try:
+            results[f"service.{case.name}"] = await _measure(run, count, concurrency=1)
+        finally:
+            if isinstance(db, AsyncSession):
+                await db.close()
+            else:
+                db.close()
+        print(f"service.{case.name}: {results[f'service.{case.name}']}", flush=True)
+    return results
+
+
+async def _run_http(fx: Fixture, iterations: int, concurrency: int) -> dict[str, Any]:
+    import httpx
+
+    from app.main import app
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://bench",
+        headers={"Authorization": f"Bearer {fx.token}"},
+        timeout=60,
+    ) as client:
+        for case in _http_cases(fx, client):
+            count = max(concurrency, int(iterations * case.weight))
+            results[f"http.{case.name}"] = await _measure(case.run, count, concurrency)
+            print(f"http.{case.name}: {results[f'http.{case.name}']}", flush=True)
+    return results
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    from app.core.config import settings
+    from app.main import app
+
+    fx = _fixture()
+    await app.router.startup()
+    try:
+        results = {}
+        if "service" in args.levels:
+            results.update(await _run_service(_service_cases(fx), args.iterations))
+        if "http" in args.levels:
+            results.update(await _run_http(fx, args.iterations, args.concurrency))
+    finally:
+        await app.router.shutdown()
+    return {
+        "meta": {
+            "recorded_at": datetime.now(UTC).isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "db_mode": "async" if settings.database_async else "sync",
+            "warm_caches": args.warm_caches,
+            "iterations": args.iterations,
+            "concurrency": args.concurrency,
+            "employees": fx.employees,
+            "attendance": fx.attendance,
+            "deep_offset": fx.deep_offset,
+        },
+        "results": results,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Prints a comparison table and returns the names of regressed cases."""
+
+    for key in ("employees", "attendance", "db_mode", "concurrency", "warm_caches"):
+        if current["meta"].get(key) != baseline["meta"].get(key):
+            print(
+                f"warning: {key} differs from the baseline "
+                f"({current['meta'].get(key)} vs {baseline['meta'].get(key)})"
+            )
+    regressions = []
+    print(f"{'case':<40} {'p95 ms':>9} {'base':>9} {'rps':>9} {'base':>9}")
+    for name, base in baseline["results"].items():
+        result = current["results"].get(name)
+        if result is None:
+            continue
+        slower = result["p95_ms"] > base["p95_ms"] * (1 + threshold)
+        fewer = result["throughput_rps"] < base["throughput_rps"] * (1 - threshold)
+        flag = "  REGRESSION" if slower or fewer else ""
+        print(
+            f"{name:<40} {result['p95_ms']:>9.2f} {base['p95_ms']:>9.2f} "
+            f"{result['throughput_rps']:>9.1f} {base['throughput_rps']:>9.1f}{flag}"
+        )
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--prepare", action="store_true", help="seed an empty database first")
+    parser.add_argument("--employees", type=int, default=2000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--departments", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--levels", nargs="+", choices=("service", "http"), default=["service", "http"]
+    )
+    parser.add_argument("--warm-caches", action="store_true")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument(
+        "--threshold", type=float, default=0.25, help="allowed relative change (0.25 = 25%%)"
+    )
+    args = parser.parse_args()
+
+    _configure_environment(args.warm_caches)
+    if args.prepare:
+        _prepare(args.employees, args.days, args.departments)
+    report = asyncio.run(_run(args))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"wrote {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} case(s) regressed by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
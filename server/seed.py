@@ -1,4 +1,4 @@
-from app.seed import seed
+from app.seed import main
 
 if __name__ == "__main__":
-    seed()
+    main()